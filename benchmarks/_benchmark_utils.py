@@ -0,0 +1,20 @@
+"""Utilities for timing benchmarks."""
+
+import timeit
+from typing import Any, Callable, Optional
+
+
+def time_per_call(func: Callable[[], Any], repeat: int = 5, min_time: float = 0.2) -> float:
+    """Return the best observed time, in seconds, of a single call to `func`."""
+    timer = timeit.Timer(func)
+    number, _ = timer.autorange()
+    number = max(number, int(number * min_time / 0.2))
+    return min(timer.repeat(repeat=repeat, number=number)) / number
+
+
+def report(name: str, seconds: float, baseline: Optional[float] = None, unit: str = "call"):
+    """Print a single benchmark result, with the speedup relative to `baseline` if provided."""
+    line = f"{name:<48} {seconds * 1e6:>12.3f} us/{unit} {1 / seconds:>14,.0f} {unit}/s"
+    if baseline is not None:
+        line += f" {baseline / seconds:>8.1f}x"
+    print(line)
@@ -0,0 +1,40 @@
+"""Benchmark parsing of BLE advertisements."""
+
+from typing import Optional
+
+from benchmarks._benchmark_utils import report, time_per_call
+from combustion_ble.ble_data.advertising_data import AdvertisingData
+
+# Manufacturer data of a Probe advertisement, as delivered by Bleak (without the vendor ID).
+PROBE_ADVERTISEMENT = bytes.fromhex("01b10f0010" + "a4c5e02b11f8c1d8ac72cd9ba5" + "0d0240")
+
+
+def eager_bit_string_from_bleak_data(data: bytes) -> Optional[AdvertisingData]:
+    """Parse an advertisement and build its bit string eagerly, as was previously done."""
+    from bitstring import Bits
+
+    advertising = AdvertisingData.from_bleak_data(data)
+    Bits(0x09C7.to_bytes(2, "big") + data).bin
+    return advertising
+
+
+def main():
+    baseline = None
+    try:
+        import bitstring  # noqa: F401
+    except ImportError:
+        print("bitstring is not installed, skipping the eager bit string baseline")
+    else:
+        baseline = time_per_call(lambda: eager_bit_string_from_bleak_data(PROBE_ADVERTISEMENT))
+        report("from_bleak_data + eager bit_string", baseline, unit="adv")
+
+    report(
+        "from_bleak_data",
+        time_per_call(lambda: AdvertisingData.from_bleak_data(PROBE_ADVERTISEMENT)),
+        baseline,
+        unit="adv",
+    )
+
+
+if __name__ == "__main__":
+    main()
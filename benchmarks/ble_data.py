@@ -0,0 +1,74 @@
+"""Benchmark decoding of advertisements, probe status notifications and log records."""
+
+from benchmarks._benchmark_utils import report, time_per_call
+from benchmarks.advertising_data import PROBE_ADVERTISEMENT
+from combustion_ble.ble_data.advertising_data import AdvertisingData
+from combustion_ble.ble_data.battery_status_virtual_sensors import (
+    BatteryStatusVirtualSensors,
+)
+from combustion_ble.ble_data.hop_count import HopCount
+from combustion_ble.ble_data.mode_id import ModeId
+from combustion_ble.ble_data.prediction_log import PredictionLog
+from combustion_ble.ble_data.probe_status import ProbeStatus
+from combustion_ble.ble_data.probe_temperatures import ProbeTemperatures
+from combustion_ble.ble_data.virtual_sensors import VirtualSensors
+from combustion_ble.uart import LogResponse
+
+# Payload of a probe status notification.
+PROBE_STATUS = bytes.fromhex(
+    "00000000" + "2c010000" + "a4c5e02b11f8c1d8ac72cd9ba5" + "0d02" + "43e803284a0119" + "00" * 14
+)
+
+# Payload of a log response, including the UART header.
+LOG_RESPONSE = bytes.fromhex(
+    "cafe0000040118" + "2c010000" + "a4c5e02b11f8c1d8ac72cd9ba5" + "8a1b3c0a1f4b02"
+)
+
+
+def main():
+    for name, table_decode, decode in (
+        ("ModeId", ModeId.from_byte, ModeId._decode),
+        ("VirtualSensors", VirtualSensors.from_byte, VirtualSensors._decode),
+        (
+            "BatteryStatusVirtualSensors",
+            BatteryStatusVirtualSensors.from_byte,
+            BatteryStatusVirtualSensors._decode,
+        ),
+        ("HopCount", HopCount.from_network_info_byte, HopCount._decode),
+    ):
+        baseline = time_per_call(lambda: decode(0x4D))
+        report(f"{name} decode", baseline)
+        report(f"{name} table lookup", time_per_call(lambda: table_decode(0x4D)), baseline)
+
+    temperatures = ProbeTemperatures.from_raw_data(PROBE_STATUS[8:21])
+    report(
+        "ProbeTemperatures.from_raw_data",
+        time_per_call(lambda: ProbeTemperatures.from_raw_data(PROBE_STATUS[8:21])),
+    )
+    report("ProbeTemperatures.values_celsius", time_per_call(lambda: temperatures.values_celsius))
+    report("ProbeTemperatures.celsius", time_per_call(lambda: temperatures.celsius(0)))
+
+    report(
+        "AdvertisingData.from_bleak_data",
+        time_per_call(lambda: AdvertisingData.from_bleak_data(PROBE_ADVERTISEMENT)),
+        unit="adv",
+    )
+    report(
+        "ProbeStatus.from_data",
+        time_per_call(lambda: ProbeStatus.from_data(PROBE_STATUS)),
+        unit="status",
+    )
+    report(
+        "PredictionLog.from_raw",
+        time_per_call(lambda: PredictionLog.from_raw(LOG_RESPONSE[24:31])),
+        unit="log",
+    )
+    report(
+        "LogResponse.from_raw",
+        time_per_call(lambda: LogResponse.from_raw(LOG_RESPONSE, True, 24)),
+        unit="log",
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,48 @@
+"""Benchmark the CRC-16-CCITT engine used for UART and MeatNet framing."""
+
+import os
+
+from benchmarks._benchmark_utils import report, time_per_call
+from combustion_ble.uart import LogRequest
+from combustion_ble.uart.meatnet import NodeReadLogsRequest
+from combustion_ble.utilities.crc16ccitt import CRC16CCITT, crc16ccitt
+
+
+def bitwise_crc16ccitt(data: bytes) -> int:
+    """The original bit-by-bit implementation, kept as a baseline."""
+    poly = 0x1021
+    crc = 0xFFFF
+
+    for byte in data:
+        crc ^= byte << 8
+        for _ in range(8):
+            crc = (crc << 1) ^ poly if (crc & 0x8000) else crc << 1
+            crc &= 0xFFFF
+
+    return crc
+
+
+def main():
+    # Frame sizes: a session info request, a probe log response, a node log response,
+    # and a full MTU worth of data.
+    for size in (3, 27, 43, 244):
+        data = os.urandom(size)
+        assert crc16ccitt(data) == bitwise_crc16ccitt(data)
+
+        baseline = time_per_call(lambda: bitwise_crc16ccitt(data))
+        report(f"bitwise crc16ccitt [{size} bytes]", baseline)
+        report(f"crc16ccitt [{size} bytes]", time_per_call(lambda: crc16ccitt(data)), baseline)
+
+        view = memoryview(data)
+        report(
+            f"CRC16CCITT.update x2 [{size} bytes]",
+            time_per_call(lambda: CRC16CCITT(view[:4]).update(view[4:]).value),
+            baseline,
+        )
+
+    report("LogRequest()", time_per_call(lambda: LogRequest(0, 100)))
+    report("NodeReadLogsRequest()", time_per_call(lambda: NodeReadLogsRequest(1, 0, 100)))
+
+
+if __name__ == "__main__":
+    main()
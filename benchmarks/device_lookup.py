@@ -0,0 +1,101 @@
+"""Benchmark looking up devices and connections by identifier with 500 devices."""
+
+import asyncio
+from typing import Any, Optional
+
+from benchmarks._benchmark_utils import report, time_per_call
+from benchmarks.advertising_data import PROBE_ADVERTISEMENT
+from combustion_ble.ble_data.advertising_data import AdvertisingData
+from combustion_ble.ble_manager import BleConnection, BleManager
+from combustion_ble.device_manager import DeviceManager
+from combustion_ble.devices.device import Device
+from combustion_ble.devices.probe import Probe
+
+DEVICE_COUNT = 500
+
+
+class FakeClient:
+    def __init__(self, address: str) -> None:
+        self.address = address
+        self.is_connected = True
+
+
+def scan_device_by_ble_identifier(devices: dict[str, Device], identifier: str) -> Optional[Device]:
+    """Look a device up by BLE identifier, as was previously done."""
+    if device := devices.get(identifier):
+        return device
+    for device in devices.values():
+        if device.ble_identifier and device.ble_identifier == identifier:
+            return device
+    return None
+
+
+def scan_connected_peripheral(clients: dict[str, Any], identifier: str) -> Any:
+    """Look a connected client up, as was previously done."""
+    connected = [
+        clients[c] for c in clients if clients[c].address == identifier and clients[c].is_connected
+    ]
+    return connected[0] if connected else None
+
+
+def scan_probe_with_serial(device_manager: DeviceManager, serial: str) -> Optional[Probe]:
+    """Look a probe up by serial number string, as was previously done."""
+    probes = device_manager.get_probes()
+    return next((probe for probe in probes if probe.serial_number_string == serial), None)
+
+
+async def run():
+    # The device manager starts its timers on the running event loop.
+    device_manager = DeviceManager()
+    if device_manager.timer_task:
+        device_manager.timer_task.cancel()
+    ble_manager = BleManager()
+    for index in range(DEVICE_COUNT):
+        data = bytearray(PROBE_ADVERTISEMENT)
+        data[1:5] = (0x10000000 + index).to_bytes(4, "little")
+        identifier = f"00:00:00:00:{index >> 8:02X}:{index & 0xFF:02X}"
+        advertising = AdvertisingData.from_bleak_data(bytes(data))
+        assert advertising is not None
+        device_manager.update_probe_with_advertising(advertising, True, -60, identifier)
+        ble_manager.connections[identifier] = BleConnection(FakeClient(identifier))  # type: ignore
+
+    # The last device added is the worst case of a linear scan.
+    last = device_manager.get_probes()[-1]
+    assert last.ble_identifier is not None
+    identifier = last.ble_identifier
+    serial = last.serial_number_string
+    clients = ble_manager.clients
+
+    baseline = time_per_call(
+        lambda: scan_device_by_ble_identifier(device_manager.devices, identifier)
+    )
+    report("find_device_by_ble_identifier (scan)", baseline)
+    report(
+        "find_device_by_ble_identifier",
+        time_per_call(lambda: device_manager.find_device_by_ble_identifier(identifier)),
+        baseline,
+    )
+
+    baseline = time_per_call(lambda: scan_connected_peripheral(clients, identifier))
+    report("get_connected_peripheral (scan)", baseline)
+    report(
+        "get_connected_peripheral",
+        time_per_call(lambda: ble_manager.get_connected_peripheral(identifier)),
+        baseline,
+    )
+
+    baseline = time_per_call(lambda: scan_probe_with_serial(device_manager, serial))
+    report("get_probe_with_serial (scan)", baseline)
+    report(
+        "get_probe_with_serial",
+        time_per_call(lambda: device_manager.connection_manager.get_probe_with_serial(serial)),
+        baseline,
+    )
+
+
+def main():
+    asyncio.run(run())
+
+
+if __name__ == "__main__":
+    main()
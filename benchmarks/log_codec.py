@@ -0,0 +1,68 @@
+"""Benchmark the compression ratio and speed of the log segment codec on a simulated cook."""
+
+import math
+import random
+
+from benchmarks._benchmark_utils import report, time_per_call
+from combustion_ble.ble_data.probe_temperatures import ProbeTemperatures
+from combustion_ble.data_point_columns import DataPointColumns
+from combustion_ble.log_codec import decode_columns, encode_columns
+
+# A 12 hour cook at a 1 second sample period.
+POINT_COUNT = 12 * 60 * 60
+
+
+def cook_columns(seed: int = 0) -> tuple:
+    """Columns of a cook: the probe tip heats from 4 to 63 Celsius along an exponential curve, the
+    handle sits near a 110 Celsius ambient, with sensor noise and occasional virtual sensor and
+    prediction changes."""
+    rng = random.Random(seed)
+    columns = DataPointColumns()
+    for sequence_number in range(POINT_COUNT):
+        progress = 1 - math.exp(-sequence_number / (POINT_COUNT / 3))
+        values = [
+            4.0 + (63.0 + sensor * 6.0 - 4.0) * progress + rng.gauss(0, 0.05) for sensor in range(7)
+        ]
+        values.append(110.0 + 3 * math.sin(sequence_number / 600) + rng.gauss(0, 0.2))
+        core = min(values[:3])
+        columns.append(
+            (
+                sequence_number,
+                ProbeTemperatures.from_values(values).raw_data,
+                (sequence_number * 4 // POINT_COUNT) | 1 << 3 | 2 << 5,
+                (2 if progress < 0.9 else 3) | 1 << 4,
+                630,
+                max(POINT_COUNT - sequence_number + rng.randrange(-30, 30), 0),
+                round((core + 20) * 10),
+            )
+        )
+    return columns.raw_columns(0, len(columns))
+
+
+def main():
+    columns = cook_columns()
+    encoded = encode_columns(columns)
+    stored = 27 * POINT_COUNT
+    floats = 8 * 8 * POINT_COUNT
+
+    print(f"{'Columns':<48} {stored / POINT_COUNT:>12.2f} bytes/point")
+    print(f"{'Eight doubles':<48} {floats / POINT_COUNT:>12.2f} bytes/point")
+    print(
+        f"{'Encoded segment':<48} {len(encoded) / POINT_COUNT:>12.2f} bytes/point "
+        f"{stored / len(encoded):>8.1f}x vs columns {floats / len(encoded):>6.1f}x vs doubles"
+    )
+
+    report(
+        "encode_columns",
+        time_per_call(lambda: encode_columns(columns), repeat=3) / POINT_COUNT,
+        unit="point",
+    )
+    report(
+        "decode_columns",
+        time_per_call(lambda: decode_columns(encoded), repeat=3) / POINT_COUNT,
+        unit="point",
+    )
+
+
+if __name__ == "__main__":
+    main()
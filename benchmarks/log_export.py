@@ -0,0 +1,71 @@
+"""Benchmark exporting a 12 hour session of 8 probes."""
+
+import io
+import os
+import tempfile
+import time
+
+from benchmarks.probe_temperature_log import log_responses
+from combustion_ble import log_export
+from combustion_ble.logged_probe_data_count import LoggedProbeDataPoint
+from combustion_ble.probe_temperature_log import ProbeTemperatureLog
+from combustion_ble.uart import SessionInformation
+
+PROBE_COUNT = 8
+
+# A 12 hour cook at a 1 second sample period.
+POINT_COUNT = 12 * 60 * 60
+
+
+def session_logs() -> list[ProbeTemperatureLog]:
+    data_points = [
+        LoggedProbeDataPoint.from_log_response(response) for response in log_responses(POINT_COUNT)
+    ]
+    logs = []
+    for session_id in range(PROBE_COUNT):
+        log = ProbeTemperatureLog(SessionInformation(session_id=session_id, sample_period=1000))
+        for data_point in data_points:
+            log.append_data_point(data_point)
+        logs.append(log)
+    return logs
+
+
+def run(name: str, export) -> None:
+    start = time.perf_counter()
+    count = export()
+    elapsed = time.perf_counter() - start
+    print(f"{name:<48} {elapsed * 1e3:>12.1f} ms {count / elapsed:>14,.0f} point/s")
+
+
+def main():
+    logs = session_logs()
+
+    run("export_csv", lambda: sum(log_export.export_csv(log, io.StringIO()) for log in logs))
+
+    if log_export.np is None:
+        print("numpy is not installed, skipping NumPy and Arrow exports")
+        return
+
+    run("to_numpy", lambda: sum(len(log_export.to_numpy(log)) for log in logs))
+
+    try:
+        import pyarrow  # noqa: F401
+    except ImportError:
+        print("pyarrow is not installed, skipping Arrow exports")
+        return
+
+    with tempfile.TemporaryDirectory() as directory:
+        for format in ("ipc", "parquet"):
+            run(
+                f"export_arrow ({format})",
+                lambda: sum(
+                    log_export.export_arrow(
+                        log, os.path.join(directory, f"{i}.{format}"), format=format
+                    )
+                    for i, log in enumerate(logs)
+                ),
+            )
+
+
+if __name__ == "__main__":
+    main()
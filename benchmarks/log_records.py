@@ -0,0 +1,49 @@
+"""Benchmark decoding a backfill of log records per record and as a single batch."""
+
+from benchmarks._benchmark_utils import report, time_per_call
+from benchmarks.ble_data import LOG_RESPONSE
+from combustion_ble import log_records
+from combustion_ble.data_point_columns import encode_data_point
+from combustion_ble.log_records import decode_log_record, decode_log_records
+from combustion_ble.logged_probe_data_count import LoggedProbeDataPoint
+from combustion_ble.uart import LogResponse
+
+BACKFILL_COUNT = 20_000
+
+
+def main():
+    data = bytearray(LOG_RESPONSE)
+    frames = []
+    for sequence_number in range(BACKFILL_COUNT):
+        data[7:11] = sequence_number.to_bytes(4, "little")
+        frames.append(bytes(data))
+    records = [LogResponse(frame, True, 24).log_record for frame in frames]
+
+    def per_data_point():
+        return [
+            encode_data_point(LoggedProbeDataPoint.from_log_response(LogResponse(frame, True, 24)))
+            for frame in frames
+        ]
+
+    baseline = time_per_call(per_data_point, repeat=3) / BACKFILL_COUNT
+    report("LogResponse -> data point -> row", baseline, unit="record")
+    report(
+        "decode_log_record",
+        time_per_call(lambda: [decode_log_record(record) for record in records], repeat=3)
+        / BACKFILL_COUNT,
+        baseline,
+        unit="record",
+    )
+    if log_records.np is None:
+        print("numpy is not installed, skipping the vectorized benchmark")
+        return
+    report(
+        "decode_log_records (numpy)",
+        time_per_call(lambda: decode_log_records(records), repeat=3) / BACKFILL_COUNT,
+        baseline,
+        unit="record",
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,138 @@
+"""Benchmark the memory used and the time taken to store logged data points."""
+
+import asyncio
+import time
+import tracemalloc
+from datetime import timedelta
+
+from benchmarks._benchmark_utils import report, time_per_call
+from benchmarks.ble_data import LOG_RESPONSE
+from combustion_ble.logged_probe_data_count import LoggedProbeDataPoint
+from combustion_ble.probe_temperature_log import ProbeTemperatureLog
+from combustion_ble.uart import LogResponse, SessionInformation
+
+# An 8 hour cook at a 1 second sample period.
+POINT_COUNT = 8 * 60 * 60
+
+BACKFILL_COUNT = 20_000
+
+# Number of log responses that fit in a single notification.
+BACKFILL_BATCH_SIZE = 9
+
+
+def log_responses(count: int) -> list[LogResponse]:
+    """Decode `count` log responses with consecutive sequence numbers."""
+    responses = []
+    data = bytearray(LOG_RESPONSE)
+    for sequence_number in range(count):
+        data[7:11] = sequence_number.to_bytes(4, "little")
+        responses.append(LogResponse(bytes(data), True, 24))
+    return responses
+
+
+def fill_log(data_points: list[LoggedProbeDataPoint]) -> ProbeTemperatureLog:
+    log = ProbeTemperatureLog(SessionInformation(session_id=1, sample_period=1000))
+    for data_point in data_points:
+        log.append_data_point(data_point)
+    return log
+
+
+def fill_log_with_rollup(data_points: list[LoggedProbeDataPoint]) -> ProbeTemperatureLog:
+    log = ProbeTemperatureLog(SessionInformation(session_id=1, sample_period=1000))
+    log.rollup(60)
+    for data_point in data_points:
+        log.append_data_point(data_point)
+    return log
+
+
+async def backfill(data_points: list[LoggedProbeDataPoint], batch_size: int) -> tuple[float, int]:
+    """Backfill a log with `data_points` in batches of `batch_size`, as they would arrive from a
+    probe. Returns the time taken and the number of update events published."""
+    log = ProbeTemperatureLog(SessionInformation(session_id=1, sample_period=1000))
+    log.append_data_point(data_points[-1])
+    updates = 0
+
+    def on_update(_):
+        nonlocal updates
+        updates += 1
+
+    log.add_logs_updated_listener(on_update)
+
+    start = time.perf_counter()
+    for index in range(0, len(data_points) - 1, batch_size):
+        batch = data_points[index : min(index + batch_size, len(data_points) - 1)]
+        if batch_size == 1:
+            log.insert_data_point(batch[0])
+        else:
+            log.insert_data_points(batch)
+        # Let the event loop run between notifications.
+        await asyncio.sleep(0)
+    log.insert_accumulated_data_points()
+    elapsed = time.perf_counter() - start
+
+    assert len(log.sequence_numbers) == len(data_points)
+    return elapsed, updates
+
+
+def main():
+    data_points = [
+        LoggedProbeDataPoint.from_log_response(response) for response in log_responses(POINT_COUNT)
+    ]
+
+    tracemalloc.start()
+    log = fill_log(data_points)
+    allocated, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"{'ProbeTemperatureLog memory':<48} {allocated / POINT_COUNT:>12.1f} bytes/point")
+
+    report(
+        "ProbeTemperatureLog.append_data_point",
+        time_per_call(lambda: fill_log(data_points), repeat=3) / POINT_COUNT,
+        unit="point",
+    )
+    report(
+        "ProbeTemperatureLog.data_points",
+        time_per_call(lambda: log.data_points, repeat=3) / POINT_COUNT,
+        unit="point",
+    )
+
+    assert log.start_time is not None
+    end = log.start_time + timedelta(seconds=POINT_COUNT)
+    report(
+        "Last 10 minutes by scanning data_points",
+        time_per_call(
+            lambda: [
+                point
+                for point in log.data_points
+                if point.sequence_num >= POINT_COUNT - 600  # type: ignore[operator]
+            ],
+            repeat=3,
+        ),
+    )
+    report(
+        "Last 10 minutes with points_between",
+        time_per_call(lambda: list(log.points_between(end - timedelta(minutes=10), end))),
+    )
+    report("ProbeTemperatureLog.latest(600)", time_per_call(lambda: log.latest(600)))
+
+    log.rollup(60)
+    report(
+        "ProbeTemperatureLog.append_data_point with rollup",
+        time_per_call(lambda: fill_log_with_rollup(data_points), repeat=3) / POINT_COUNT,
+        unit="point",
+    )
+    report("ProbeTemperatureLog.rollup(60)", time_per_call(lambda: log.rollup(60)))
+    report("ProbeTemperatureLog.downsample(1000)", time_per_call(lambda: log.downsample(1000)))
+
+    backfill_points = data_points[:BACKFILL_COUNT]
+    for name, batch_size in (
+        ("insert_data_point", 1),
+        ("insert_data_points", BACKFILL_BATCH_SIZE),
+    ):
+        elapsed, updates = asyncio.run(backfill(backfill_points, batch_size))
+        report(f"Backfill {BACKFILL_COUNT} with {name}", elapsed / BACKFILL_COUNT, unit="point")
+        print(f"{'':<48} {updates:>12} update events")
+
+
+if __name__ == "__main__":
+    main()
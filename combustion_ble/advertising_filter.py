@@ -0,0 +1,97 @@
+"""Deduplication and rate limiting of BLE advertisements."""
+
+import time
+from collections import OrderedDict
+from typing import Optional
+
+from combustion_ble.ble_data.advertising_data import AdvertisingData
+
+# Product type and serial number at the start of the manufacturer data. MeatNet nodes repeat the
+# advertisements of several probes, so entries are kept per (BLE address, advertised device).
+ADVERTISED_DEVICE_SLICE = slice(0, 5)
+
+
+class _CachedAdvertisement:
+    __slots__ = ("payload", "advertising", "forwarded_at")
+
+    def __init__(self) -> None:
+        self.payload: Optional[bytes] = None
+        self.advertising: Optional[AdvertisingData] = None
+        self.forwarded_at = float("-inf")
+
+
+class AdvertisingFilter:
+    """Filters advertisements before they are decoded.
+
+    The last payload received for each advertised device is kept in an LRU cache, so a payload
+    identical to the previous one reuses the previously decoded ``AdvertisingData``. Optionally,
+    advertisements for a device that arrive less than ``min_interval`` seconds after the last one
+    that was forwarded are dropped altogether.
+    """
+
+    DEFAULT_MAX_ENTRIES = 1024
+
+    def __init__(self, min_interval: float = 0.0, max_entries: int = DEFAULT_MAX_ENTRIES) -> None:
+        self.min_interval = min_interval
+        """Minimum number of seconds between two advertisements forwarded for the same device."""
+
+        self.max_entries = max_entries
+        """Maximum number of advertised devices to remember."""
+
+        self._entries: OrderedDict[tuple[str, bytes], _CachedAdvertisement] = OrderedDict()
+
+        self.received = 0
+        """Number of advertisements received."""
+
+        self.decoded = 0
+        """Number of advertisements decoded."""
+
+        self.coalesced = 0
+        """Number of advertisements forwarded without decoding, as they repeated the last payload."""
+
+        self.dropped = 0
+        """Number of advertisements dropped by the rate limit."""
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def clear(self) -> None:
+        """Forget all cached advertisements."""
+        self._entries.clear()
+
+    def forget(self, address: str) -> None:
+        """Forget the cached advertisements received from `address`."""
+        for key in [key for key in self._entries if key[0] == address]:
+            del self._entries[key]
+
+    def filter(self, address: str, payload: bytes) -> tuple[bool, Optional[AdvertisingData]]:
+        """Filter an advertisement received from `address`, with the given manufacturer data.
+
+        Returns whether the advertisement should be forwarded, and its decoded data. The decoded
+        data is ``None`` when the advertisement is dropped, or when it is not a valid Combustion
+        advertisement.
+        """
+        self.received += 1
+        now = time.monotonic()
+        key = (address, payload[ADVERTISED_DEVICE_SLICE])
+
+        entry = self._entries.get(key)
+        if entry is None:
+            entry = self._entries[key] = _CachedAdvertisement()
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        else:
+            self._entries.move_to_end(key)
+            if now - entry.forwarded_at < self.min_interval:
+                self.dropped += 1
+                return False, None
+            if entry.payload == payload:
+                self.coalesced += 1
+                entry.forwarded_at = now
+                return True, entry.advertising
+
+        self.decoded += 1
+        entry.payload = payload
+        entry.advertising = AdvertisingData.from_bleak_data(payload)
+        entry.forwarded_at = now
+        return True, entry.advertising
@@ -28,13 +28,16 @@ class AdvertisingData(NamedTuple):
     mode_id: ModeId
     battery_status_virtual_sensors: BatteryStatusVirtualSensors
     hop_count: HopCount
-    bit_string: str
+    raw_data: bytes
+
+    @property
+    def bit_string(self) -> str:
+        """The raw advertising data as a string of bits. Computed on each access."""
+        return format(int.from_bytes(self.raw_data, byteorder="big"), f"0{len(self.raw_data) * 8}b")
 
     @staticmethod
     def from_data(data: bytes) -> Optional["AdvertisingData"]:
         """Create instance from raw advertising data."""
-        from bitstring import Bits
-
         if data is None or len(data) < 20:
             return None
 
@@ -70,9 +73,6 @@ class AdvertisingData(NamedTuple):
             else HopCount.default_values()
         )
 
-        # Bit String
-        bit_string = Bits(data).bin
-
         return AdvertisingData(
             type=product_type,
             serial_number=serial_number,
@@ -80,7 +80,7 @@ class AdvertisingData(NamedTuple):
             mode_id=mode_id,
             battery_status_virtual_sensors=battery_status_virtual_sensors,
             hop_count=hop_count,
-            bit_string=bit_string,
+            raw_data=data,
         )
 
     @staticmethod
@@ -1,6 +1,7 @@
 """Representation of the battery status & virtual sensors portion of the advertisement payload."""
 
 from enum import Enum
+from typing import NamedTuple
 
 from combustion_ble.ble_data.virtual_sensors import (
     VirtualAmbientSensor,
@@ -19,17 +20,20 @@ class BatteryStatus(Enum):
     MASK = 0x1
 
 
-class BatteryStatusVirtualSensors:
+class BatteryStatusVirtualSensors(NamedTuple):
     """Representation of the battery status & virtual sensors portion of the advertisement payload."""
 
-    def __init__(self, battery_status: BatteryStatus, virtual_sensors: VirtualSensors):
-        """Initialize."""
-        self.battery_status = battery_status
-        self.virtual_sensors = virtual_sensors
+    battery_status: BatteryStatus
+    virtual_sensors: VirtualSensors
 
     @staticmethod
-    def from_byte(byte):
-        """Create instance from raw byte."""
+    def from_byte(byte) -> "BatteryStatusVirtualSensors":
+        """Create instance from raw byte. Returns a shared instance from a precomputed table."""
+        return _BATTERY_STATUS_VIRTUAL_SENSORS[byte]
+
+    @staticmethod
+    def _decode(byte) -> "BatteryStatusVirtualSensors":
+        """Decode a raw byte into a new instance."""
         raw_status = byte & BatteryStatus.MASK.value
         battery = BatteryStatus(raw_status)
         virtual_sensors = VirtualSensors.from_byte(byte >> 1)
@@ -42,3 +46,6 @@ class BatteryStatusVirtualSensors:
             BatteryStatus.OK,
             VirtualSensors(VirtualCoreSensor.T1, VirtualSurfaceSensor.T4, VirtualAmbientSensor.T5),
         )
+
+
+_BATTERY_STATUS_VIRTUAL_SENSORS = [BatteryStatusVirtualSensors._decode(byte) for byte in range(256)]
@@ -15,8 +15,13 @@ class HopCount(Enum):
     HOP_COUNT_SHIFT = 6
 
     @staticmethod
-    def from_network_info_byte(network_info_byte):
-        """Generate hop count from network info byte."""
+    def from_network_info_byte(network_info_byte) -> "HopCount":
+        """Generate hop count from network info byte, using a precomputed table."""
+        return _HOP_COUNTS[network_info_byte]
+
+    @staticmethod
+    def _decode(network_info_byte) -> "HopCount":
+        """Decode the hop count from a network info byte."""
         raw_hop_count = (
             network_info_byte >> HopCount.HOP_COUNT_SHIFT.value
         ) & HopCount.HOP_COUNT_MASK.value
@@ -30,3 +35,6 @@ class HopCount(Enum):
     def default_values():
         """Generate default values."""
         return HopCount.HOP1
+
+
+_HOP_COUNTS = [HopCount._decode(byte) for byte in range(256)]
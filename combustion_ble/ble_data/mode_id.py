@@ -1,6 +1,7 @@
 """ModeId portion of advertisement payload."""
 
 from enum import Enum, unique
+from typing import NamedTuple
 
 
 @unique
@@ -41,24 +42,31 @@ class ProbeMode(Enum):
     ERROR = 0x03
 
 
-class ModeId:
+class _ModeIdFields(NamedTuple):
+    id: ProbeID
+    color: ProbeColor
+    mode: ProbeMode
+
+
+class ModeId(_ModeIdFields):
     """ModeId portion of advertisement payload."""
 
+    __slots__ = ()
+
     PROBE_ID_MASK = 0x7
     PROBE_ID_SHIFT = 5
     PROBE_COLOR_MASK = 0x7
     PROBE_COLOR_SHIFT = 2
     PROBE_MODE_MASK = 0x3
 
-    def __init__(self, id: ProbeID, color: ProbeColor, mode: ProbeMode):
-        """Initialize."""
-        self.id = id
-        self.color = color
-        self.mode = mode
-
     @classmethod
     def from_byte(cls, byte) -> "ModeId":
-        """Create instance from byte."""
+        """Create instance from byte. Returns a shared instance from a precomputed table."""
+        return _MODE_IDS[byte]
+
+    @classmethod
+    def _decode(cls, byte) -> "ModeId":
+        """Decode a byte into a new instance."""
         raw_probe_id = (byte >> cls.PROBE_ID_SHIFT) & cls.PROBE_ID_MASK
         id = ProbeID(raw_probe_id)
 
@@ -74,3 +82,6 @@ class ModeId:
     def default_values():
         """Generate default values."""
         return ModeId(ProbeID.ID1, ProbeColor.color1, ProbeMode.NORMAL)
+
+
+_MODE_IDS = [ModeId._decode(byte) for byte in range(256)]
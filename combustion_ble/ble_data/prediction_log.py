@@ -1,56 +1,29 @@
 """Prediction Log."""
 
+from typing import NamedTuple
+
 from combustion_ble.ble_data.prediction_mode import PredictionMode
 from combustion_ble.ble_data.prediction_state import PredictionState
 from combustion_ble.ble_data.prediction_type import PredictionType
 from combustion_ble.ble_data.virtual_sensors import VirtualSensors
 
 
-class PredictionLog:
-    def __init__(
-        self,
-        virtual_sensors: VirtualSensors,
-        prediction_state: PredictionState,
-        prediction_mode: PredictionMode,
-        prediction_type: PredictionType,
-        prediction_set_point_temperature: float,
-        prediction_value_seconds: int,
-        estimated_core_temperature: float,
-    ):
-        """Initialize"""
-        self.virtual_sensors = virtual_sensors
-        self.prediction_state = prediction_state
-        self.prediction_mode = prediction_mode
-        self.prediction_type = prediction_type
-        self.prediction_set_point_temperature = prediction_set_point_temperature
-        self.prediction_value_seconds = prediction_value_seconds
-        self.estimated_core_temperature = estimated_core_temperature
+class PredictionLog(NamedTuple):
+    virtual_sensors: VirtualSensors
+    prediction_state: PredictionState
+    prediction_mode: PredictionMode
+    prediction_type: PredictionType
+    prediction_set_point_temperature: float
+    prediction_value_seconds: int
+    estimated_core_temperature: float
 
     @staticmethod
     def from_raw(data: bytes):
         """Create instance from raw data."""
         virtual_sensors = VirtualSensors.from_byte(data[0])
-
-        raw_prediction = (data[1] & 0x07) << 1 | (data[0] & 0x80) >> 7
-        prediction_state = (
-            PredictionState(raw_prediction)
-            if raw_prediction in PredictionState._member_map_
-            else PredictionState.UNKNOWN
-        )
-
-        raw_mode = (data[1] & PredictionMode.MASK.value) >> 3
-        prediction_mode = (
-            PredictionMode(raw_mode)
-            if raw_mode in PredictionMode._member_map_
-            else PredictionMode.NONE
-        )
-
-        raw_type = (data[1] & PredictionType.MASK.value) >> 5
-        prediction_type = (
-            PredictionType(raw_type)
-            if raw_type in PredictionType._member_map_
-            else PredictionType.NONE
-        )
+        prediction_state, prediction_mode, prediction_type = _PREDICTION_STATE_MODE_TYPE[
+            data[1] << 1 | data[0] >> 7
+        ]
 
         raw_set_point = (data[3] & 0x01) << 9 | data[2] << 1 | (data[1] & 0x80) >> 7
         prediction_set_point_temperature = float(raw_set_point) * 0.1
@@ -69,3 +42,36 @@ class PredictionLog:
             prediction_value_seconds,
             estimated_core_temperature,
         )
+
+
+def _decode_state_mode_type(index: int) -> tuple[PredictionState, PredictionMode, PredictionType]:
+    """Decode the prediction state, mode and type from the header bytes of a prediction log.
+
+    `index` holds the second header byte shifted left by one, and the most significant bit of the
+    first header byte in its lowest bit.
+    """
+    raw_prediction = index & PredictionState.MASK.value
+    prediction_state = (
+        PredictionState(raw_prediction)
+        if raw_prediction in PredictionState._value2member_map_
+        else PredictionState.UNKNOWN
+    )
+
+    raw_mode = (index >> 4) & PredictionMode.MASK.value
+    prediction_mode = (
+        PredictionMode(raw_mode)
+        if raw_mode in PredictionMode._value2member_map_
+        else PredictionMode.NONE
+    )
+
+    raw_type = (index >> 6) & PredictionType.MASK.value
+    prediction_type = (
+        PredictionType(raw_type)
+        if raw_type in PredictionType._value2member_map_
+        else PredictionType.NONE
+    )
+
+    return prediction_state, prediction_mode, prediction_type
+
+
+_PREDICTION_STATE_MODE_TYPE = [_decode_state_mode_type(index) for index in range(512)]
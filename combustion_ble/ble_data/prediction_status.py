@@ -1,41 +1,33 @@
 """Prediction Status."""
 
+from typing import NamedTuple
+
 from combustion_ble.ble_data.prediction_mode import PredictionMode
 from combustion_ble.ble_data.prediction_state import PredictionState
 from combustion_ble.ble_data.prediction_type import PredictionType
 
 
-class PredictionStatus:
+class PredictionStatus(NamedTuple):
     """Prediction Status."""
 
-    def __init__(
-        self,
-        prediction_state: PredictionState,
-        prediction_mode: PredictionMode,
-        prediction_type: PredictionType,
-        prediction_set_point_temperature: float,
-        heat_start_temperature: float,
-        prediction_value_seconds: float,
-        estimated_core_temperature: float,
-    ):
-        self.prediction_state: PredictionState = prediction_state
-        """Prediction state"""
+    prediction_state: PredictionState
+    """Prediction state"""
 
-        self.prediction_mode: PredictionMode = prediction_mode
-        """Prediction mode"""
+    prediction_mode: PredictionMode
+    """Prediction mode"""
 
-        self.prediction_type: PredictionType = prediction_type
-        """Prediction type"""
+    prediction_type: PredictionType
+    """Prediction type"""
 
-        self.prediction_set_point_temperature: float = prediction_set_point_temperature
-        """Prediction set point temperature"""
+    prediction_set_point_temperature: float
+    """Prediction set point temperature"""
 
-        self.heat_start_temperature: float = heat_start_temperature
-        self.prediction_value_seconds: float = prediction_value_seconds
-        """Predicted seconds remaining."""
+    heat_start_temperature: float
+    prediction_value_seconds: float
+    """Predicted seconds remaining."""
 
-        self.estimated_core_temperature: float = estimated_core_temperature
-        """Estimated core temperature."""
+    estimated_core_temperature: float
+    """Estimated core temperature."""
 
     def to_dict(self):
         return {
@@ -50,26 +42,7 @@ class PredictionStatus:
 
     @staticmethod
     def from_bytes(bytes):
-        raw_prediction_state = bytes[0] & PredictionState.MASK.value
-        prediction_state = (
-            PredictionState(raw_prediction_state)
-            if raw_prediction_state in PredictionState._value2member_map_
-            else PredictionState.UNKNOWN
-        )
-
-        raw_prediction_mode = (bytes[0] >> 4) & PredictionMode.MASK.value
-        prediction_mode = (
-            PredictionMode(raw_prediction_mode)
-            if raw_prediction_mode in PredictionMode._value2member_map_
-            else PredictionMode.NONE
-        )
-
-        raw_prediction_type = (bytes[0] >> 6) & PredictionType.MASK.value
-        prediction_type = (
-            PredictionType(raw_prediction_type)
-            if raw_prediction_type in PredictionType._value2member_map_
-            else PredictionType.NONE
-        )
+        prediction_state, prediction_mode, prediction_type = _PREDICTION_STATE_MODE_TYPE[bytes[0]]
 
         raw_set_point = (bytes[2] & 0x03) << 8 | bytes[1]
         set_point = float(raw_set_point) * 0.1
@@ -91,3 +64,32 @@ class PredictionStatus:
             seconds,
             estimated_core,
         )
+
+
+def _decode_state_mode_type(byte: int) -> tuple[PredictionState, PredictionMode, PredictionType]:
+    """Decode the prediction state, mode and type from the first prediction status byte."""
+    raw_prediction_state = byte & PredictionState.MASK.value
+    prediction_state = (
+        PredictionState(raw_prediction_state)
+        if raw_prediction_state in PredictionState._value2member_map_
+        else PredictionState.UNKNOWN
+    )
+
+    raw_prediction_mode = (byte >> 4) & PredictionMode.MASK.value
+    prediction_mode = (
+        PredictionMode(raw_prediction_mode)
+        if raw_prediction_mode in PredictionMode._value2member_map_
+        else PredictionMode.NONE
+    )
+
+    raw_prediction_type = (byte >> 6) & PredictionType.MASK.value
+    prediction_type = (
+        PredictionType(raw_prediction_type)
+        if raw_prediction_type in PredictionType._value2member_map_
+        else PredictionType.NONE
+    )
+
+    return prediction_state, prediction_mode, prediction_type
+
+
+_PREDICTION_STATE_MODE_TYPE = [_decode_state_mode_type(byte) for byte in range(256)]
@@ -1,3 +1,5 @@
+from typing import NamedTuple, Optional
+
 from combustion_ble.ble_data.battery_status_virtual_sensors import (
     BatteryStatusVirtualSensors,
 )
@@ -7,24 +9,14 @@ from combustion_ble.ble_data.prediction_status import PredictionStatus
 from combustion_ble.ble_data.probe_temperatures import ProbeTemperatures
 
 
-class ProbeStatus:
-    def __init__(
-        self,
-        min_sequence_number: int,
-        max_sequence_number: int,
-        temperatures: ProbeTemperatures,
-        mode_id: ModeId,
-        battery_status_virtual_sensors: BatteryStatusVirtualSensors,
-        prediction_status: PredictionStatus,
-        food_safe_data: FoodSafeData | None,
-    ):
-        self.min_sequence_number = min_sequence_number
-        self.max_sequence_number = max_sequence_number
-        self.temperatures = temperatures
-        self.mode_id = mode_id
-        self.battery_status_virtual_sensors = battery_status_virtual_sensors
-        self.prediction_status = prediction_status
-        self.food_safe_data = food_safe_data
+class ProbeStatus(NamedTuple):
+    min_sequence_number: int
+    max_sequence_number: int
+    temperatures: ProbeTemperatures
+    mode_id: ModeId
+    battery_status_virtual_sensors: BatteryStatusVirtualSensors
+    prediction_status: PredictionStatus
+    food_safe_data: Optional[FoodSafeData]
 
     @classmethod
     def from_data(cls, data):
@@ -1,41 +1,75 @@
 """Probe temperature data."""
 
+from typing import Iterable, NamedTuple
 
-class ProbeTemperatures:
-    """Temperature values for a single probe."""
+TEMPERATURE_COUNT = 8
+"""Number of thermistors in a probe."""
 
-    def __init__(self, values: list[float]):
-        """Initialize."""
-        self.values: list[float] = values
-        """Temerature readings for each of the Probe's 8 thermistors."""
+RAW_TEMPERATURE_BITS = 13
+RAW_TEMPERATURE_MASK = (1 << RAW_TEMPERATURE_BITS) - 1
+
+PACKED_TEMPERATURES_LENGTH = 13
+"""Length in bytes of the eight packed 13-bit temperatures."""
+
+_SHIFTS = range(0, TEMPERATURE_COUNT * RAW_TEMPERATURE_BITS, RAW_TEMPERATURE_BITS)
+
+
+def raw_to_celsius(raw: float) -> float:
+    """Convert a raw 13-bit temperature reading to degrees Celsius."""
+    return raw * 0.05 - 20.0
+
+
+def celsius_to_raw(celsius: float) -> int:
+    """Convert degrees Celsius to the closest raw 13-bit temperature reading."""
+    return min(max(round((celsius + 20.0) / 0.05), 0), RAW_TEMPERATURE_MASK)
+
+
+class ProbeTemperatures(NamedTuple):
+    """Temperature values for a single probe.
+
+    The temperatures are kept in their packed wire format, eight little-endian 13-bit readings in
+    13 bytes, and are only converted to Celsius when read.
+    """
+
+    raw_data: bytes
+    """Packed temperature readings for each of the Probe's 8 thermistors."""
+
+    @property
+    def raw_values(self) -> list[int]:
+        """Raw 13-bit temperature readings for each of the Probe's 8 thermistors."""
+        packed = int.from_bytes(self.raw_data, "little")
+        return [packed >> shift & RAW_TEMPERATURE_MASK for shift in _SHIFTS]
+
+    @property
+    def values_celsius(self) -> list[float]:
+        """Temperature readings in Celsius for each of the Probe's 8 thermistors."""
+        packed = int.from_bytes(self.raw_data, "little")
+        return [(packed >> shift & RAW_TEMPERATURE_MASK) * 0.05 - 20.0 for shift in _SHIFTS]
+
+    @property
+    def values(self) -> list[float]:
+        """Temperature readings in Celsius for each of the Probe's 8 thermistors."""
+        return self.values_celsius
+
+    def celsius(self, index: int) -> float:
+        """Temperature reading in Celsius of a single thermistor (0-based)."""
+        packed = int.from_bytes(self.raw_data, "little")
+        return raw_to_celsius(packed >> _SHIFTS[index] & RAW_TEMPERATURE_MASK)
+
+    @staticmethod
+    def from_values(values: Iterable[float]) -> "ProbeTemperatures":
+        """Create instance from temperatures in Celsius, rounded to the probe's resolution."""
+        packed = 0
+        for shift, value in zip(_SHIFTS, values):
+            packed |= celsius_to_raw(value) << shift
+        return ProbeTemperatures(packed.to_bytes(PACKED_TEMPERATURES_LENGTH, "little"))
 
     @staticmethod
     def from_reversed(bytes_: list[int]) -> "ProbeTemperatures":
         """Create instance from reversed bytes."""
-        raw_temps: list[int] = []
-        raw_temps.insert(0, (bytes_[0] & 0xFF) << 5 | (bytes_[1] & 0xF8) >> 3)
-        raw_temps.insert(
-            0, (bytes_[1] & 0x07) << 10 | (bytes_[2] & 0xFF) << 2 | (bytes_[3] & 0xC0) >> 6
-        )
-        raw_temps.insert(0, (bytes_[3] & 0x3F) << 7 | (bytes_[4] & 0xFE) >> 1)
-        raw_temps.insert(
-            0, (bytes_[4] & 0x01) << 12 | (bytes_[5] & 0xFF) << 4 | (bytes_[6] & 0xF0) >> 4
-        )
-        raw_temps.insert(
-            0, (bytes_[6] & 0x0F) << 9 | (bytes_[7] & 0xFF) << 1 | (bytes_[8] & 0x80) >> 7
-        )
-        raw_temps.insert(0, (bytes_[8] & 0x7F) << 6 | (bytes_[9] & 0xFC) >> 2)
-        raw_temps.insert(
-            0, (bytes_[9] & 0x03) << 11 | (bytes_[10] & 0xFF) << 3 | (bytes_[11] & 0xE0) >> 5
-        )
-        raw_temps.insert(0, (bytes_[11] & 0x1F) << 8 | (bytes_[12] & 0xFF) >> 0)
-
-        temperatures = [float(temp) * 0.05 - 20.0 for temp in raw_temps]
-        return ProbeTemperatures(values=temperatures)
+        return ProbeTemperatures(bytes(reversed(bytes_)))
 
     @staticmethod
     def from_raw_data(data: bytes) -> "ProbeTemperatures":
         """Create instance from raw data."""
-        bytes_ = list(data)
-        bytes_.reverse()  # Reversing the byte order
-        return ProbeTemperatures.from_reversed(bytes_)
+        return ProbeTemperatures(bytes(data))
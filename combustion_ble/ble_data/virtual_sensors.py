@@ -1,4 +1,5 @@
 from enum import Enum
+from typing import NamedTuple
 
 from combustion_ble.ble_data.probe_temperatures import ProbeTemperatures
 
@@ -21,7 +22,7 @@ class VirtualCoreSensor(Enum):
 
     def temperature_from(self, temperatures: ProbeTemperatures):
         """Get temperature for virtual sensor."""
-        return temperatures.values[int(self.value)]
+        return temperatures.celsius(int(self.value))
 
 
 class VirtualSurfaceSensor(Enum):
@@ -41,7 +42,7 @@ class VirtualSurfaceSensor(Enum):
     def temperature_from(self, temperatures: ProbeTemperatures):
         """Get temperature for virtual sensor."""
         surface_sensor_number = int(self.value) + 3
-        return temperatures.values[surface_sensor_number]
+        return temperatures.celsius(surface_sensor_number)
 
 
 class VirtualAmbientSensor(Enum):
@@ -61,26 +62,24 @@ class VirtualAmbientSensor(Enum):
     def temperature_from(self, temperatures: ProbeTemperatures):
         """Get temperature for virtual sensor."""
         ambient_sensor_number = int(self.value) + 4
-        return temperatures.values[ambient_sensor_number]
+        return temperatures.celsius(ambient_sensor_number)
 
 
-class VirtualSensors:
+class VirtualSensors(NamedTuple):
     """Collection of all virtual sensors."""
 
-    def __init__(
-        self,
-        virtual_core: VirtualCoreSensor,
-        virtual_surface: VirtualSurfaceSensor,
-        virtual_ambient: VirtualAmbientSensor,
-    ):
-        """Initialize."""
-        self.virtual_core = virtual_core
-        self.virtual_surface = virtual_surface
-        self.virtual_ambient = virtual_ambient
+    virtual_core: VirtualCoreSensor
+    virtual_surface: VirtualSurfaceSensor
+    virtual_ambient: VirtualAmbientSensor
 
     @staticmethod
-    def from_byte(byte):
-        """Create instances from byte."""
+    def from_byte(byte) -> "VirtualSensors":
+        """Create instances from byte. Returns a shared instance from a precomputed table."""
+        return _VIRTUAL_SENSORS[byte]
+
+    @staticmethod
+    def _decode(byte) -> "VirtualSensors":
+        """Decode a byte into a new instance."""
         raw_virtual_core = byte & VirtualCoreSensor.MASK.value
         try:
             virtual_core = VirtualCoreSensor(raw_virtual_core)
@@ -100,3 +99,6 @@ class VirtualSensors:
             virtual_ambient = VirtualAmbientSensor.T5
 
         return VirtualSensors(virtual_core, virtual_surface, virtual_ambient)
+
+
+_VIRTUAL_SENSORS = [VirtualSensors._decode(byte) for byte in range(256)]
@@ -1,5 +1,6 @@
+import asyncio
 import enum
-from typing import Optional
+from typing import Callable, Optional
 
 from bleak import (
     AdvertisementDataCallback,
@@ -11,8 +12,11 @@ from bleak import (
 from bleak.backends.device import BLEDevice
 from bleak.backends.scanner import AdvertisementData
 
+from combustion_ble.advertising_filter import AdvertisingFilter
 from combustion_ble.ble_data.advertising_data import AdvertisingData
 from combustion_ble.ble_data.probe_status import ProbeStatus
+from combustion_ble.connection_pool import ConnectionPool
+from combustion_ble.connection_scheduler import ConnectionPriority, ConnectionScheduler
 from combustion_ble.const import (
     BT_MANUFACTURER_ID,
     DEVICE_STATUS_CHARACTERISTIC,
@@ -48,10 +52,13 @@ class BleManagerDelegate:
     ):
         pass
 
+    def update_device_rssi(self, identifier: str, rssi: int):
+        pass
+
     def update_device_with_status(self, identifier: str, status: ProbeStatus):
         pass
 
-    def handle_uart_data(self, identifier: str, data: bytes):
+    def handle_uart_data(self, identifier: str, data: bytes | bytearray):
         pass
 
     def update_device_fw_version(self, identifier: str, fw_version: str):
@@ -66,6 +73,12 @@ class BleManagerDelegate:
     def update_device_model_info(self, identifier: str, model_info: str):
         pass
 
+    def has_device_info(self, identifier: str, characteristic: str) -> bool:
+        """Whether the value of a device information characteristic (``fw_revision``,
+        ``hw_revision``, ``serial_number`` or ``model_number``) is already known, so it does not
+        need to be read again."""
+        return False
+
 
 class BluetoothMode(enum.Enum):
     """Mode for bluetooth device discovery."""
@@ -102,23 +115,68 @@ class PendingGattReads:
         return char.handle in reads
 
 
+class BleConnection:
+    """A connected client and the characteristics discovered on it."""
+
+    __slots__ = (
+        "client",
+        "uart",
+        "uart_tx",
+        "device_status",
+        "fw_revision",
+        "hw_revision",
+        "serial_number",
+        "model_number",
+    )
+
+    def __init__(self, client: BleakClient) -> None:
+        self.client = client
+        self.uart: Optional[BleakGATTCharacteristic] = None
+        self.uart_tx: Optional[BleakGATTCharacteristic] = None
+        self.device_status: Optional[BleakGATTCharacteristic] = None
+        self.fw_revision: Optional[BleakGATTCharacteristic] = None
+        self.hw_revision: Optional[BleakGATTCharacteristic] = None
+        self.serial_number: Optional[BleakGATTCharacteristic] = None
+        self.model_number: Optional[BleakGATTCharacteristic] = None
+
+
+# Attribute of a `BleConnection` holding each characteristic used.
+_CHARACTERISTIC_ATTRIBUTES = {
+    UART_RX_CHARACTERISTIC: "uart",
+    UART_TX_CHARACTERISTIC: "uart_tx",
+    DEVICE_STATUS_CHARACTERISTIC: "device_status",
+    FW_VERSION_CHARACTERISTIC: "fw_revision",
+    HW_VERSION_CHARACTERISTIC: "hw_revision",
+    SERIAL_NUMBER_CHARACTERISTIC: "serial_number",
+    MODEL_NUMBER_CHARACTERISTIC: "model_number",
+}
+
+
 class BleManager:
     shared: "BleManager" = None  # type: ignore
 
     def __init__(self):
-        self.clients: dict[str, BleakClient] = {}
+        self.connections: dict[str, BleConnection] = {}
+        """Connections by BLE identifier."""
         self.scanner: Optional[BleakScanner] = None
         self.delegate: Optional[BleManagerDelegate] = None
-        self.device_status_characteristics: dict[str, BleakGATTCharacteristic] = {}
-        self.uart_characteristics: dict[str, BleakGATTCharacteristic] = {}
-        self.fw_revision_characteristics: dict[str, BleakGATTCharacteristic] = {}
-        self.hw_revision_characteristics: dict[str, BleakGATTCharacteristic] = {}
-        self.serial_number_characteristics: dict[str, BleakGATTCharacteristic] = {}
-        self.model_number_characteristics: dict[str, BleakGATTCharacteristic] = {}
         self._pending_gatt_reads = PendingGattReads()
         self._pending_connections: set[str] = set()
+        self._adapters: dict[str, Optional[str]] = {}
+        self._gatt_handles: dict[str, dict[str, int]] = {}
+        """Handles of the characteristics used, by UUID, by BLE identifier."""
+        self.advertising_filter = AdvertisingFilter()
+        self.connection_scheduler = ConnectionScheduler()
+        self.connection_pool = ConnectionPool()
         self.is_stopping = False
 
+    @property
+    def clients(self) -> dict[str, BleakClient]:
+        """Connected clients by BLE identifier."""
+        return {
+            identifier: connection.client for identifier, connection in self.connections.items()
+        }
+
     async def init_bluetooth(
         self, mode: BluetoothMode = BluetoothMode.ACTIVE
     ) -> None | AdvertisementDataCallback:
@@ -148,28 +206,44 @@ class BleManager:
                 await self.scanner.stop()
             except Exception:
                 LOGGER.exception("Error stopping Bleak scanner")
-            if self.clients:
-                client_list = [c for c in self.clients]
-                for client in client_list:
-                    try:
-                        if self.clients[client].is_connected:
-                            await self.clients[client].disconnect()
-                    except Exception:
-                        LOGGER.exception("Error disconnecting client")
-        self.clients = {}
+            for connection in list(self.connections.values()):
+                try:
+                    if connection.client.is_connected:
+                        await connection.client.disconnect()
+                except Exception:
+                    LOGGER.exception("Error disconnecting client")
+        self.connections = {}
         self._pending_connections = set()
+        self.connection_scheduler.clear()
+        self.connection_pool.clear()
+        self._adapters = {}
         self._pending_gatt_reads = PendingGattReads()
+        self.advertising_filter.clear()
         self.scanner = None
         self.is_stopping = False
 
+    def forget(self, identifier: str):
+        """Drop the state kept for a device that is no longer around."""
+        self._adapters.pop(identifier, None)
+        self._gatt_handles.pop(identifier, None)
+        self.advertising_filter.forget(identifier)
+        self.connection_pool.forget(identifier)
+
     def detection_callback(self, device: BLEDevice, advertisement_data: AdvertisementData):
-        if BT_MANUFACTURER_ID not in advertisement_data.manufacturer_data:
+        payload = advertisement_data.manufacturer_data.get(BT_MANUFACTURER_ID)
+        if payload is None:
             return
 
-        advertising_data = AdvertisingData.from_bleak_data(
-            advertisement_data.manufacturer_data[BT_MANUFACTURER_ID]
-        )
-        if advertising_data and self.delegate:
+        if device.address not in self._adapters:
+            self._adapters[device.address] = _adapter_name(device)
+
+        forward, advertising_data = self.advertising_filter.filter(device.address, payload)
+        if not self.delegate:
+            return
+        if not forward:
+            # Rate limited, only keep the signal strength current.
+            self.delegate.update_device_rssi(device.address, advertisement_data.rssi)
+        elif advertising_data:
             self.delegate.update_device_with_advertising(
                 advertising=advertising_data,
                 is_connectable=True,  # TODO: support non-connectable devices
@@ -177,63 +251,61 @@ class BleManager:
                 identifier=device.address,
             )
 
-    async def connect(self, identifier: str):
+    async def connect(self, identifier: str, priority: ConnectionPriority = ()):
+        """Connect to a device, once the connection scheduler has a slot for its adapter. Devices
+        with a lower `priority` are connected to first."""
         if not self.delegate:
             return
         if identifier in self._pending_connections:
             LOGGER.debug("Ignoring concurrent connect request for [%s]", identifier)
             return
 
-        if identifier in self.clients:
+        self._pending_connections.add(identifier)
+        try:
+            await self.connection_scheduler.run(
+                lambda: self._connect(identifier), priority, self._adapters.get(identifier)
+            )
+        finally:
+            self._pending_connections.discard(identifier)
+
+    async def _connect(self, identifier: str) -> bool:
+        assert self.delegate is not None
+        if connection := self.connections.get(identifier):
             LOGGER.debug("Connecting to [%s] via established client", identifier)
-            client = self.clients[identifier]
+            client = connection.client
         else:
             LOGGER.debug("Connecting to [%s] via new client", identifier)
             client = BleakClient(
                 identifier, disconnected_callback=self.disconnected_callback(identifier)
             )
 
-        successful = False
-        self._pending_connections.add(identifier)
         try:
             await client.connect()
             LOGGER.debug("Connection to [%s] successful", identifier)
-            self.clients[identifier] = client
-            successful = True
+            if connection is None or connection.client is not client:
+                self.connections[identifier] = BleConnection(client)
+            self.connection_pool.touch(identifier)
         except Exception as ex:
             LOGGER.debug("Failed connecting to [%s]: %s", identifier, ex)
             self.delegate.did_fail_to_connect_to(identifier)
-        finally:
-            self._pending_connections.discard(identifier)
+            return False
 
-        if successful:
-            self.delegate.did_connect_to(identifier)
-            self.handle_discovered_services(identifier, client)
+        self.delegate.did_connect_to(identifier)
+        self.handle_discovered_services(identifier, client)
+        return True
 
     def disconnected_callback(self, identifier: str):
         def cb(client: BleakClient):
             if self.delegate:
                 self.delegate.did_disconnect_from(identifier)
-            if identifier in self.clients:
-                del self.clients[identifier]
-            if identifier in self.uart_characteristics:
-                del self.uart_characteristics[identifier]
-            if identifier in self.device_status_characteristics:
-                del self.device_status_characteristics[identifier]
-            if identifier in self.fw_revision_characteristics:
-                del self.fw_revision_characteristics[identifier]
-            if identifier in self.hw_revision_characteristics:
-                del self.hw_revision_characteristics[identifier]
-            if identifier in self.serial_number_characteristics:
-                del self.serial_number_characteristics[identifier]
-            if identifier in self.model_number_characteristics:
-                del self.model_number_characteristics[identifier]
+            self.connection_pool.forget(identifier)
+            self.connections.pop(identifier, None)
 
         return cb
 
     async def disconnect(self, identifier: str):
-        if identifier in self.clients:
-            client = self.clients[identifier]
+        if connection := self.connections.get(identifier):
+            client = connection.client
             if client.is_connected:
                 try:
                     await client.disconnect()
@@ -244,182 +316,168 @@ class BleManager:
     async def send_request(
         self, identifier: str, request: Request | NodeRequest
     ):  # todo this does not need to be async. we can ensure_future instead
-        connection_peripheral = self.get_connected_peripheral(identifier)
-        if not connection_peripheral:
+        connection = self._get_connection(identifier)
+        if not connection or not connection.uart:
             return
 
-        uart_char = self.uart_characteristics.get(identifier)
-        client = self.clients.get(identifier)
         try:
-            if client and client.is_connected and uart_char:
-                await client.write_gatt_char(uart_char, request.data, response=False)
+            self.connection_pool.touch(identifier)
+            await connection.client.write_gatt_char(connection.uart, request.data, response=False)
         except BleakError as be:
             LOGGER.error("Error sending request to [%s]: %s", identifier, be)
 
     async def read_firmware_revision(self, identifier: str) -> None:
-        connection_peripheral = self.get_connected_peripheral(identifier)
-        if connection_peripheral:
-            uart_char = self.fw_revision_characteristics.get(identifier)
-            client = self.clients.get(identifier)
-            if self._pending_gatt_reads.has(identifier, uart_char):
-                LOGGER.debug(
-                    "Discarding concurent request to read_firmware_revision for [%s]", identifier
-                )
-                return
-            try:
-                if client and client.is_connected and uart_char and self.delegate:
-                    self._pending_gatt_reads.add(identifier, uart_char)
-                    data = await client.read_gatt_char(uart_char, use_cached=True)
-                    fw_version = data.decode(encoding="utf-8")
-                    self.delegate.update_device_fw_version(identifier, fw_version)
-            except BleakError as be:
-                LOGGER.error("Error reading firmware version from [%s]: %s", identifier, be)
-            finally:
-                self._pending_gatt_reads.remove(identifier, uart_char)
+        if self.delegate:
+            await self._read_string(
+                identifier, "fw_revision", self.delegate.update_device_fw_version
+            )
 
     async def read_hardware_revision(self, identifier: str) -> None:
-        connection_peripheral = self.get_connected_peripheral(identifier)
-        if connection_peripheral:
-            uart_char = self.hw_revision_characteristics.get(identifier)
-            client = self.clients.get(identifier)
-            if self._pending_gatt_reads.has(identifier, uart_char):
-                LOGGER.debug(
-                    "Discarding concurent request to read_hardware_revision for [%s]", identifier
-                )
-                return
-            try:
-                if client and client.is_connected and uart_char and self.delegate:
-                    self._pending_gatt_reads.add(identifier, uart_char)
-                    data = await client.read_gatt_char(uart_char, use_cached=True)
-                    hw_revision = data.decode(encoding="utf-8")
-                    self.delegate.update_device_hw_revision(identifier, hw_revision)
-            except BleakError as be:
-                LOGGER.error("Error reading hardware version from [%s]: %s", identifier, be)
-            finally:
-                self._pending_gatt_reads.remove(identifier, uart_char)
+        if self.delegate:
+            await self._read_string(
+                identifier, "hw_revision", self.delegate.update_device_hw_revision
+            )
 
     async def read_serial_number(self, identifier: str) -> None:
-        connection_peripheral = self.get_connected_peripheral(identifier)
-        if connection_peripheral:
-            uart_char = self.serial_number_characteristics.get(identifier)
-            client = self.clients.get(identifier)
-            if self._pending_gatt_reads.has(identifier, uart_char):
-                LOGGER.debug(
-                    "Discarding concurent request to read_serial_number for [%s]", identifier
-                )
-                return
-            try:
-                if client and client.is_connected and uart_char and self.delegate:
-                    self._pending_gatt_reads.add(identifier, uart_char)
-                    data = await client.read_gatt_char(uart_char, use_cached=True)
-                    serial_number = data.decode(encoding="utf-8")
-                    self.delegate.update_device_serial_number(identifier, serial_number)
-            except BleakError as be:
-                LOGGER.error("Error reading serial number from [%s]: %s", identifier, be)
-            finally:
-                self._pending_gatt_reads.remove(identifier, uart_char)
+        if self.delegate:
+            await self._read_string(
+                identifier, "serial_number", self.delegate.update_device_serial_number
+            )
 
     async def read_model_number(self, identifier: str) -> None:
-        connection_peripheral = self.get_connected_peripheral(identifier)
-        if connection_peripheral:
-            uart_char = self.model_number_characteristics.get(identifier)
-            client = self.clients.get(identifier)
-            if self._pending_gatt_reads.has(identifier, uart_char):
-                LOGGER.debug(
-                    "Discarding concurent request to read_model_number for [%s]", identifier
-                )
-                return
-            try:
-                if client and client.is_connected and uart_char and self.delegate:
-                    self._pending_gatt_reads.add(identifier, uart_char)
-                    data = await client.read_gatt_char(uart_char, use_cached=True)
-                    model_number = data.decode(encoding="utf-8")
-                    self.delegate.update_device_model_info(identifier, model_number)
-            except BleakError as be:
-                LOGGER.error("Error reading model number from [%s]: %s", identifier, be)
-            finally:
-                self._pending_gatt_reads.remove(identifier, uart_char)
+        if self.delegate:
+            await self._read_string(
+                identifier, "model_number", self.delegate.update_device_model_info
+            )
 
-    def get_connected_peripheral(self, identifier: str) -> BleakClient | None:
-        connected_clients = [
-            self.clients[c]
-            for c in self.clients
-            if self.clients[c].address == identifier and self.clients[c].is_connected
-        ]
-        if not connected_clients:
-            return None
+    async def _read_string(
+        self, identifier: str, characteristic_name: str, update: Callable[[str, str], None]
+    ) -> None:
+        """Read a UTF-8 string characteristic of a connection, and pass it to `update`."""
+        connection = self._get_connection(identifier)
+        if not connection:
+            return
+        characteristic = getattr(connection, characteristic_name)
+        if self._pending_gatt_reads.has(identifier, characteristic):
+            LOGGER.debug(
+                "Discarding concurent request to read %s for [%s]", characteristic_name, identifier
+            )
+            return
+        if not characteristic:
+            return
+        try:
+            self._pending_gatt_reads.add(identifier, characteristic)
+            data = await connection.client.read_gatt_char(characteristic, use_cached=True)
+            update(identifier, data.decode(encoding="utf-8"))
+        except BleakError as be:
+            LOGGER.error("Error reading %s from [%s]: %s", characteristic_name, identifier, be)
+        finally:
+            self._pending_gatt_reads.remove(identifier, characteristic)
 
-        return connected_clients[0]
+    def _get_connection(self, identifier: str) -> Optional[BleConnection]:
+        connection = self.connections.get(identifier)
+        if connection and connection.client.is_connected:
+            return connection
+        return None
 
-    def handle_uart_data(self, identifier: str, data: bytes):
+    def get_connected_peripheral(self, identifier: str) -> BleakClient | None:
+        connection = self._get_connection(identifier)
+        return connection.client if connection else None
+
+    def handle_uart_data(self, identifier: str, data: bytes | bytearray):
+        self.connection_pool.touch(identifier)
         if self.delegate:
             self.delegate.handle_uart_data(identifier, data)
 
     def handle_discovered_services(self, identifier: str, client: BleakClient):
+        """Set up a new connection: subscribe to status and UART notifications first, so data flows
+        as soon as possible, then request the session information and read the device information
+        that is not already known."""
+        connection = self.connections.get(identifier)
+        if connection is None or connection.client is not client:
+            return
+        ensure_future(
+            self._set_up_connection(identifier, connection),
+            name="ble_manager[set_up_connection]",
+        )
+
+    async def _set_up_connection(self, identifier: str, connection: BleConnection):
+        self._bind_characteristics(identifier, connection)
+        client = connection.client
+        callback = self._notification_callback(identifier)
+
+        subscriptions = []
+        if connection.device_status:
+            subscriptions.append(client.start_notify(connection.device_status, callback))
+        uart_notifies = bool(connection.uart_tx and connection.uart_tx.descriptors)
+        if uart_notifies:
+            subscriptions.append(client.start_notify(connection.uart_tx, callback))
+        await asyncio.gather(*subscriptions)
+
+        if connection.device_status and uart_notifies:
+            await self.send_request(identifier, request=SessionInfoRequest())
+
+        for characteristic, read in (
+            ("fw_revision", self.read_firmware_revision),
+            ("hw_revision", self.read_hardware_revision),
+            ("serial_number", self.read_serial_number),
+            ("model_number", self.read_model_number),
+        ):
+            if not getattr(connection, characteristic) or not self.delegate:
+                continue
+            if not self.delegate.has_device_info(identifier, characteristic):
+                await read(identifier)
+
+    def _bind_characteristics(self, identifier: str, connection: BleConnection):
+        """Find the characteristics used on a connection, by the handles they had on a previous
+        connection to the same device if they are unchanged, or else by scanning the services."""
+        services = connection.client.services
+        handles = self._gatt_handles.get(identifier)
+        if handles:
+            characteristics = [services.get_characteristic(handle) for handle in handles.values()]
+            if all(
+                characteristic is not None and characteristic.uuid == uuid
+                for characteristic, uuid in zip(characteristics, handles)
+            ):
+                for characteristic in characteristics:
+                    setattr(
+                        connection, _CHARACTERISTIC_ATTRIBUTES[characteristic.uuid], characteristic
+                    )
+                return
+
+        handles = {}
+        for service in services:
+            for characteristic in service.characteristics:
+                if attribute := _CHARACTERISTIC_ATTRIBUTES.get(characteristic.uuid):
+                    setattr(connection, attribute, characteristic)
+                    handles[characteristic.uuid] = characteristic.handle
+        self._gatt_handles[identifier] = handles
+
+    def _notification_callback(
+        self, identifier: str
+    ) -> Callable[[BleakGATTCharacteristic, bytearray], None]:
         def uart_tx_notify_callback(char: BleakGATTCharacteristic, data: bytearray):
             if char.uuid == UART_TX_CHARACTERISTIC:
-                self.handle_uart_data(identifier, bytes(data))
+                self.handle_uart_data(identifier, data)
             elif char.uuid == DEVICE_STATUS_CHARACTERISTIC:
+                self.connection_pool.touch(identifier)
                 probe_status = ProbeStatus.from_data(data)
                 if probe_status and self.delegate:
                     self.delegate.update_device_with_status(identifier, probe_status)
             else:
                 LOGGER.debug("uart_tx_notify_callback ignoring unknown char [%s]", char.uuid)
 
-        for service in client.services:
-            for characteristic in service.characteristics:
-                if characteristic.uuid == UART_RX_CHARACTERISTIC:
-                    self.uart_characteristics[identifier] = characteristic
-                elif characteristic.uuid == DEVICE_STATUS_CHARACTERISTIC:
-                    self.device_status_characteristics[identifier] = characteristic
-                elif (
-                    characteristic.uuid == FW_VERSION_CHARACTERISTIC
-                    or characteristic.uuid == HW_VERSION_CHARACTERISTIC
-                    or characteristic.uuid == SERIAL_NUMBER_CHARACTERISTIC
-                    or characteristic.uuid == MODEL_NUMBER_CHARACTERISTIC
-                ):
-                    if characteristic.uuid == FW_VERSION_CHARACTERISTIC:
-                        self.fw_revision_characteristics[identifier] = characteristic
-                        ensure_future(
-                            self.read_firmware_revision(identifier),
-                            name="ble_manager[read_firmware_revision]",
-                        )
-                    elif characteristic.uuid == HW_VERSION_CHARACTERISTIC:
-                        self.hw_revision_characteristics[identifier] = characteristic
-                        ensure_future(
-                            self.read_hardware_revision(identifier),
-                            name="ble_manager[read_hardware_revision]",
-                        )
-                    elif characteristic.uuid == SERIAL_NUMBER_CHARACTERISTIC:
-                        self.serial_number_characteristics[identifier] = characteristic
-                        ensure_future(
-                            self.read_serial_number(identifier),
-                            name="ble_manager[read_serial_number]",
-                        )
-                    elif characteristic.uuid == MODEL_NUMBER_CHARACTERISTIC:
-                        self.model_number_characteristics[identifier] = characteristic
-                        ensure_future(
-                            self.read_model_number(identifier),
-                            name="ble_manager[read_model_number]",
-                        )
-                elif characteristic.uuid == UART_TX_CHARACTERISTIC:
-                    if characteristic.descriptors:
-                        client = self.get_connected_peripheral(identifier)
-                        if client:
-                            ensure_future(
-                                client.start_notify(characteristic, uart_tx_notify_callback),
-                                name="ble_manager[start_notify:uart_tx]",
-                            )
-                            status_char = self.device_status_characteristics.get(identifier)
-                            if status_char:
-                                ensure_future(
-                                    client.start_notify(status_char, uart_tx_notify_callback),
-                                    name="ble_manager[start_notify:device_status]",
-                                )
-                                ensure_future(
-                                    self.send_request(identifier, request=SessionInfoRequest()),
-                                    name="ble_manager[send_request:session_info]",
-                                )
+        return uart_tx_notify_callback
+
+
+def _adapter_name(device: BLEDevice) -> Optional[str]:
+    """Name of the adapter a device was discovered on, when the backend reports it. BlueZ object
+    paths look like ``/org/bluez/hci0/dev_XX_XX_XX_XX_XX_XX``."""
+    details = device.details
+    path = details.get("path") if isinstance(details, dict) else None
+    if isinstance(path, str) and path.startswith("/org/bluez/"):
+        return path.split("/")[3]
+    return None
 
 
 # Instantiate the BleManager singleton
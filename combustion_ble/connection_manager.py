@@ -70,5 +70,5 @@ class ConnectionManager:
                 ensure_future(updated_probe.disconnect(), "probe.disconnect[prefer_meatnet]")
 
     def get_probe_with_serial(self, serial: str) -> Optional["Probe"]:
-        probes = self.device_manager.get_probes()
-        return next((probe for probe in probes if probe.serial_number_string == serial), None)
+        # Probes are indexed by serial number, of which `serial` is the hexadecimal string.
+        return self.device_manager.find_probe_by_serial_number(int(serial, 16))
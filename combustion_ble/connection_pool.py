@@ -0,0 +1,126 @@
+"""Limits on the direct BLE connections kept open."""
+
+import time
+from typing import Any, Iterable, Optional
+
+Usefulness = tuple[Any, ...]
+"""Sort key of a connection; connections with lower usefulness are released first."""
+
+
+class ConnectionPool:
+    """Selects the direct connections to release so that at most ``max_size`` stay open.
+
+    When the pool is full, a new connection is only admitted if an open connection is less useful,
+    and that connection is evicted to make room. Connections without UART traffic for
+    ``idle_timeout`` seconds are released. Connections still being opened count towards the size of
+    the pool, but are neither evicted nor released. Limits set to None are not enforced.
+    """
+
+    def __init__(
+        self, max_size: Optional[int] = None, idle_timeout: Optional[float] = None
+    ) -> None:
+        if max_size is not None and max_size <= 0:
+            raise ValueError("max_size must be positive.")
+        self.max_size = max_size
+        """Maximum number of direct connections open or being opened at once."""
+
+        self.idle_timeout = idle_timeout
+        """Number of seconds without UART traffic after which a connection is released."""
+
+        self._last_activity: dict[str, float] = {}
+
+        self.size = 0
+        """Number of direct connections open or being opened, as of the last check."""
+
+        self.peak_size = 0
+        """Largest number of direct connections open at once."""
+
+        self.evictions = 0
+        """Number of connections released to make room for a more useful one."""
+
+        self.idle_releases = 0
+        """Number of connections released because they were idle."""
+
+        self.refused = 0
+        """Number of connections not opened because all open connections were more useful."""
+
+    @property
+    def utilization(self) -> Optional[float]:
+        """Fraction of the pool in use, if its size is limited."""
+        return self.size / self.max_size if self.max_size else None
+
+    def touch(self, identifier: str, now: Optional[float] = None) -> None:
+        """Record traffic on the connection to `identifier`."""
+        self._last_activity[identifier] = time.monotonic() if now is None else now
+
+    def forget(self, identifier: str) -> None:
+        """Forget the activity of a connection that was closed."""
+        self._last_activity.pop(identifier, None)
+
+    def clear(self) -> None:
+        """Forget the activity of all connections."""
+        self._last_activity.clear()
+
+    def _update_size(self, size: int) -> None:
+        self.size = size
+        self.peak_size = max(self.peak_size, size)
+
+    def admit(
+        self,
+        usefulness: Usefulness,
+        connections: Iterable[tuple[str, Usefulness]],
+        connecting: int = 0,
+    ) -> tuple[bool, Optional[str]]:
+        """Decide whether a new connection of the given usefulness may be opened, next to the
+        `(identifier, usefulness)` of the open connections and `connecting` connections being
+        opened.
+
+        Returns whether to connect, and the identifier of the connection to evict first, if any.
+        """
+        connections = list(connections)
+        self._update_size(len(connections) + connecting)
+        if self.max_size is None or self.size < self.max_size:
+            return True, None
+        if not connections:
+            self.refused += 1
+            return False, None
+        identifier, least_useful = min(connections, key=lambda connection: connection[1])
+        if least_useful >= usefulness:
+            self.refused += 1
+            return False, None
+        self.evictions += 1
+        return True, identifier
+
+    def connections_to_release(
+        self,
+        connections: Iterable[tuple[str, Usefulness]],
+        now: Optional[float] = None,
+        connecting: int = 0,
+    ) -> list[str]:
+        """Return the identifiers of the open connections to release: idle connections, then the
+        least useful ones beyond ``max_size``, counting `connecting` connections being opened."""
+        if now is None:
+            now = time.monotonic()
+        connections = list(connections)
+        self._update_size(len(connections) + connecting)
+
+        released: list[str] = []
+        if self.idle_timeout is not None:
+            for identifier, _ in connections:
+                # Connections are active from when they are first seen.
+                last_activity = self._last_activity.setdefault(identifier, now)
+                if now - last_activity > self.idle_timeout:
+                    released.append(identifier)
+            self.idle_releases += len(released)
+
+        if self.max_size is not None:
+            excess = self.size - len(released) - self.max_size
+            if excess > 0:
+                released_set = set(released)
+                candidates = sorted(
+                    (connection for connection in connections if connection[0] not in released_set),
+                    key=lambda connection: connection[1],
+                )[:excess]
+                released.extend(identifier for identifier, _ in candidates)
+                self.evictions += len(candidates)
+        return released
@@ -0,0 +1,153 @@
+"""Queueing of BLE connection attempts, with a concurrency limit per adapter."""
+
+import asyncio
+import heapq
+import itertools
+import time
+from collections import deque
+from typing import Any, Awaitable, Callable, Optional
+
+ConnectionPriority = tuple[Any, ...]
+"""Sort key of a connection attempt; attempts with lower priorities are started first."""
+
+
+class ConnectionScheduler:
+    """Runs connection attempts, at most ``max_concurrent`` at once per adapter.
+
+    Attempts beyond the limit wait in a queue per adapter, ordered by priority and then by arrival,
+    and are started as running attempts complete. The scheduler tracks the number of queued and
+    running attempts, the time attempts wait for a slot, and the time from queueing to a successful
+    connection.
+    """
+
+    DEFAULT_MAX_CONCURRENT = 2
+    METRICS_WINDOW = 32
+    """Number of recent attempts that the wait and time to connect averages are computed over."""
+
+    def __init__(self, max_concurrent: int = DEFAULT_MAX_CONCURRENT) -> None:
+        self._queues: dict[Optional[str], list[tuple[ConnectionPriority, int, asyncio.Future]]] = {}
+        self._running: dict[Optional[str], int] = {}
+        self.max_concurrent = max_concurrent
+        self._order = itertools.count()
+        self._queued = 0
+
+        self.attempts = 0
+        """Number of connection attempts started."""
+
+        self.successes = 0
+        """Number of connection attempts that connected."""
+
+        self.failures = 0
+        """Number of connection attempts that failed."""
+
+        self.max_queue_depth = 0
+        """Largest number of attempts that were queued at once."""
+
+        self._wait_times: deque[float] = deque(maxlen=self.METRICS_WINDOW)
+        self._connect_times: deque[float] = deque(maxlen=self.METRICS_WINDOW)
+
+    @property
+    def max_concurrent(self) -> int:
+        """Maximum number of connection attempts running at once on an adapter. Raising it starts
+        queued attempts right away; lowering it lets running attempts complete."""
+        return self._max_concurrent
+
+    @max_concurrent.setter
+    def max_concurrent(self, max_concurrent: int) -> None:
+        if max_concurrent <= 0:
+            raise ValueError("max_concurrent must be positive.")
+        self._max_concurrent = max_concurrent
+        for adapter in self._queues:
+            self._start_queued(adapter)
+
+    @property
+    def queue_depth(self) -> int:
+        """Number of attempts waiting for a slot, on all adapters."""
+        return self._queued
+
+    @property
+    def running(self) -> int:
+        """Number of attempts running, on all adapters."""
+        return sum(self._running.values())
+
+    @property
+    def mean_wait_time(self) -> Optional[float]:
+        """Average number of seconds recent attempts waited for a slot."""
+        return sum(self._wait_times) / len(self._wait_times) if self._wait_times else None
+
+    @property
+    def mean_time_to_connect(self) -> Optional[float]:
+        """Average number of seconds from queueing to connecting, over recent successful attempts."""
+        return sum(self._connect_times) / len(self._connect_times) if self._connect_times else None
+
+    async def run(
+        self,
+        connect: Callable[[], Awaitable[bool]],
+        priority: ConnectionPriority = (),
+        adapter: Optional[str] = None,
+    ) -> bool:
+        """Wait for a slot on `adapter`, then run `connect`, which returns whether it connected.
+
+        Returns False without running `connect` if the queue is cleared while waiting.
+        """
+        queued_at = time.monotonic()
+        queue = self._queues.setdefault(adapter, [])
+        if queue or self._running.get(adapter, 0) >= self.max_concurrent:
+            future = asyncio.get_running_loop().create_future()
+            heapq.heappush(queue, (priority, next(self._order), future))
+            self._queued += 1
+            self.max_queue_depth = max(self.max_queue_depth, self._queued)
+            try:
+                granted = await future
+            except asyncio.CancelledError:
+                if future.cancelled():
+                    self._queued -= 1
+                elif future.result():
+                    # The slot was handed over just as the waiting task was cancelled.
+                    self._release(adapter)
+                raise
+            if not granted:
+                return False
+        else:
+            self._running[adapter] = self._running.get(adapter, 0) + 1
+
+        started_at = time.monotonic()
+        self._wait_times.append(started_at - queued_at)
+        self.attempts += 1
+        connected = False
+        try:
+            connected = await connect()
+        finally:
+            self._release(adapter)
+            if connected:
+                self.successes += 1
+                self._connect_times.append(time.monotonic() - queued_at)
+            else:
+                self.failures += 1
+        return connected
+
+    def _release(self, adapter: Optional[str]) -> None:
+        """Hand the slot of a completed attempt over to the next queued attempt, if any."""
+        self._running[adapter] -= 1
+        self._start_queued(adapter)
+
+    def _start_queued(self, adapter: Optional[str]) -> None:
+        """Start queued attempts on `adapter` while it has free slots."""
+        queue = self._queues.get(adapter, [])
+        while queue and self._running.get(adapter, 0) < self._max_concurrent:
+            _, _, future = heapq.heappop(queue)
+            if future.done():
+                # Cancelled while waiting, already uncounted.
+                continue
+            self._queued -= 1
+            self._running[adapter] = self._running.get(adapter, 0) + 1
+            future.set_result(True)
+
+    def clear(self) -> None:
+        """Drop all queued attempts, which return False without connecting."""
+        for queue in self._queues.values():
+            for _, _, future in queue:
+                if not future.done():
+                    self._queued -= 1
+                    future.set_result(False)
+            queue.clear()
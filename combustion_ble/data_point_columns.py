@@ -0,0 +1,258 @@
+"""Columnar storage of logged probe data points."""
+
+from array import array
+from bisect import bisect_left, bisect_right
+from typing import Any, Iterable, Iterator, Optional
+
+from combustion_ble.ble_data.prediction_status import _PREDICTION_STATE_MODE_TYPE
+from combustion_ble.ble_data.probe_temperatures import (
+    PACKED_TEMPERATURES_LENGTH,
+    ProbeTemperatures,
+)
+from combustion_ble.ble_data.virtual_sensors import VirtualSensors
+from combustion_ble.logged_probe_data_count import LoggedProbeDataPoint
+
+DataPointRow = tuple[int, bytes, int, int, int, int, int]
+"""A data point encoded as it is stored in the columns: sequence number, packed temperatures,
+virtual sensors byte, prediction state/mode/type byte, raw prediction set point, prediction
+seconds and raw estimated core temperature."""
+
+
+def encode_data_point(data_point: LoggedProbeDataPoint) -> DataPointRow:
+    """Encode a fully populated data point into a row of column values."""
+    assert data_point.sequence_num is not None
+    assert data_point.temperatures is not None
+    return (
+        data_point.sequence_num,
+        data_point.temperatures.raw_data,
+        data_point.virtual_core.value
+        | data_point.virtual_surface.value << 3
+        | data_point.virtual_ambient.value << 5,
+        data_point.prediction_state.value
+        | data_point.prediction_mode.value << 4
+        | data_point.prediction_type.value << 6,
+        round(data_point.prediction_set_point_temperature * 10),
+        int(data_point.prediction_value_seconds),
+        round((data_point.estimated_core_temperature + 20.0) * 10),
+    )
+
+
+DATA_POINT_SIZE = 4 + PACKED_TEMPERATURES_LENGTH + 1 + 1 + 2 + 4 + 2
+"""Number of bytes taken by a data point in the columns."""
+
+
+class DataPointColumns:
+    """Logged data points stored as contiguous columns, sorted by sequence number.
+
+    Each data point takes 27 bytes: the sequence number, the eight temperatures packed as on the
+    wire, and the virtual sensor and prediction fields as their raw integer values. Columns are
+    ``array`` and ``bytearray`` objects, which over-allocate as they grow so appends are amortized
+    O(1). ``LoggedProbeDataPoint`` objects are only built when a data point is read.
+    """
+
+    __slots__ = (
+        "sequence_numbers",
+        "_temperatures",
+        "_virtual_sensors",
+        "_prediction_state_mode_type",
+        "_prediction_set_points",
+        "_prediction_seconds",
+        "_estimated_core_temperatures",
+    )
+
+    def __init__(self) -> None:
+        self.sequence_numbers = array("I")
+        """Sequence numbers of the stored data points, in ascending order."""
+
+        self._temperatures = bytearray()
+        self._virtual_sensors = bytearray()
+        self._prediction_state_mode_type = bytearray()
+        self._prediction_set_points = array("H")
+        self._prediction_seconds = array("I")
+        self._estimated_core_temperatures = array("H")
+
+    def __len__(self) -> int:
+        return len(self.sequence_numbers)
+
+    def __contains__(self, sequence_number: int) -> bool:
+        index = bisect_left(self.sequence_numbers, sequence_number)
+        return (
+            index < len(self.sequence_numbers) and self.sequence_numbers[index] == sequence_number
+        )
+
+    def __getitem__(self, index: int) -> LoggedProbeDataPoint:
+        sequence_number = self.sequence_numbers[index]
+        if index < 0:
+            index += len(self.sequence_numbers)
+        offset = index * PACKED_TEMPERATURES_LENGTH
+        virtual_sensors = VirtualSensors.from_byte(self._virtual_sensors[index])
+        prediction_state, prediction_mode, prediction_type = _PREDICTION_STATE_MODE_TYPE[
+            self._prediction_state_mode_type[index]
+        ]
+        return LoggedProbeDataPoint(
+            sequence_number,
+            ProbeTemperatures(
+                bytes(self._temperatures[offset : offset + PACKED_TEMPERATURES_LENGTH])
+            ),
+            virtual_sensors.virtual_core,
+            virtual_sensors.virtual_surface,
+            virtual_sensors.virtual_ambient,
+            prediction_state,
+            prediction_mode,
+            prediction_type,
+            self._prediction_set_points[index] * 0.1,
+            self._prediction_seconds[index],
+            self._estimated_core_temperatures[index] * 0.1 - 20.0,
+        )
+
+    def __iter__(self) -> Iterator[LoggedProbeDataPoint]:
+        for index in range(len(self.sequence_numbers)):
+            yield self[index]
+
+    def index_range(self, min_sequence_number: int, max_sequence_number: int) -> tuple[int, int]:
+        """Return the start and stop indexes of the data points with sequence numbers in
+        ``[min_sequence_number, max_sequence_number]``."""
+        return (
+            bisect_left(self.sequence_numbers, min_sequence_number),
+            bisect_right(self.sequence_numbers, max_sequence_number),
+        )
+
+    def raw_columns(self, start: int, stop: int) -> tuple[Any, ...]:
+        """Return copies of the columns for the data points from index `start` to `stop`, in the
+        order of the values in a `DataPointRow`. Packed temperatures take 13 bytes per data point.
+        """
+        return (
+            self.sequence_numbers[start:stop],
+            bytes(
+                self._temperatures[
+                    start * PACKED_TEMPERATURES_LENGTH : stop * PACKED_TEMPERATURES_LENGTH
+                ]
+            ),
+            bytes(self._virtual_sensors[start:stop]),
+            bytes(self._prediction_state_mode_type[start:stop]),
+            self._prediction_set_points[start:stop],
+            self._prediction_seconds[start:stop],
+            self._estimated_core_temperatures[start:stop],
+        )
+
+    @classmethod
+    def from_raw_columns(cls, columns: tuple[Any, ...]) -> "DataPointColumns":
+        """Build columns from values laid out as returned by `raw_columns`, sorted by sequence
+        number."""
+        result = cls()
+        (
+            result.sequence_numbers,
+            temperatures,
+            virtual_sensors,
+            prediction_state_mode_type,
+            result._prediction_set_points,
+            result._prediction_seconds,
+            result._estimated_core_temperatures,
+        ) = columns
+        result._temperatures = bytearray(temperatures)
+        result._virtual_sensors = bytearray(virtual_sensors)
+        result._prediction_state_mode_type = bytearray(prediction_state_mode_type)
+        return result
+
+    def packed_temperatures(self) -> Iterator[bytes]:
+        """Yield the packed temperatures of each data point, in order."""
+        temperatures = self._temperatures
+        for offset in range(0, len(temperatures), PACKED_TEMPERATURES_LENGTH):
+            yield bytes(temperatures[offset : offset + PACKED_TEMPERATURES_LENGTH])
+
+    def rows(self) -> Iterator[DataPointRow]:
+        """Yield each data point as a `DataPointRow`, in order."""
+        return zip(
+            self.sequence_numbers,
+            self.packed_temperatures(),
+            self._virtual_sensors,
+            self._prediction_state_mode_type,
+            self._prediction_set_points,
+            self._prediction_seconds,
+            self._estimated_core_temperatures,
+        )
+
+    @property
+    def nbytes(self) -> int:
+        """Number of bytes of data point values held by the columns."""
+        return len(self.sequence_numbers) * DATA_POINT_SIZE
+
+    @property
+    def last_sequence_number(self) -> Optional[int]:
+        """Highest stored sequence number."""
+        return self.sequence_numbers[-1] if self.sequence_numbers else None
+
+    def append(self, row: DataPointRow) -> None:
+        """Append a row whose sequence number is higher than any stored one."""
+        self.sequence_numbers.append(row[0])
+        self._temperatures += row[1]
+        self._virtual_sensors.append(row[2])
+        self._prediction_state_mode_type.append(row[3])
+        self._prediction_set_points.append(row[4])
+        self._prediction_seconds.append(row[5])
+        self._estimated_core_temperatures.append(row[6])
+
+    def merge(self, rows: Iterable[DataPointRow]) -> int:
+        """Merge rows in any order into the columns, skipping sequence numbers that are already
+        stored. Returns the number of rows added.
+
+        The rows are sorted and merged in a single pass, copying the stored data between two
+        insertion points as whole slices.
+        """
+        sequence_numbers = self.sequence_numbers
+        last = self.last_sequence_number
+        insertions: list[tuple[int, DataPointRow]] = []
+        appended: list[DataPointRow] = []
+        previous = None
+        for row in sorted(rows, key=lambda row: row[0]):
+            sequence_number = row[0]
+            if sequence_number == previous:
+                continue
+            previous = sequence_number
+            if last is None or sequence_number > last:
+                appended.append(row)
+                continue
+            index = bisect_left(sequence_numbers, sequence_number)
+            if sequence_numbers[index] != sequence_number:
+                insertions.append((index, row))
+
+        if insertions:
+            self._insert(insertions)
+        for row in appended:
+            self.append(row)
+        return len(insertions) + len(appended)
+
+    def _insert(self, insertions: list[tuple[int, DataPointRow]]) -> None:
+        old: tuple[Any, ...] = (
+            self.sequence_numbers,
+            self._temperatures,
+            self._virtual_sensors,
+            self._prediction_state_mode_type,
+            self._prediction_set_points,
+            self._prediction_seconds,
+            self._estimated_core_temperatures,
+        )
+        new = tuple(column[:0] for column in old)
+        strides = (1, PACKED_TEMPERATURES_LENGTH, 1, 1, 1, 1, 1)
+
+        start = 0
+        for index, row in insertions:
+            for column, old_column, stride, value in zip(new, old, strides, row):
+                column += old_column[start * stride : index * stride]
+                if stride == 1:
+                    column.append(value)
+                else:
+                    column += value
+            start = index
+        for column, old_column, stride in zip(new, old, strides):
+            column += old_column[start * stride :]
+
+        (
+            self.sequence_numbers,
+            self._temperatures,
+            self._virtual_sensors,
+            self._prediction_state_mode_type,
+            self._prediction_set_points,
+            self._prediction_seconds,
+            self._estimated_core_temperatures,
+        ) = new
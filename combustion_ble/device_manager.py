@@ -1,10 +1,12 @@
 """Device Manager."""
 
 import asyncio
+from datetime import datetime
 from typing import Callable, Optional
 
 from bleak import AdvertisementDataCallback
 
+from combustion_ble.advertising_filter import AdvertisingFilter
 from combustion_ble.ble_data.advertising_data import (
     AdvertisingData,
     CombustionProductType,
@@ -13,25 +15,32 @@ from combustion_ble.ble_data.hop_count import HopCount
 from combustion_ble.ble_data.probe_status import ProbeStatus
 from combustion_ble.ble_manager import BleManager, BleManagerDelegate, BluetoothMode
 from combustion_ble.connection_manager import ConnectionManager
+from combustion_ble.connection_pool import ConnectionPool, Usefulness
+from combustion_ble.connection_scheduler import ConnectionPriority, ConnectionScheduler
+from combustion_ble.device_registry import DeviceRecord, DeviceRegistry
 from combustion_ble.devices.device import Device
 from combustion_ble.devices.meat_net_node import MeatNetNode
 from combustion_ble.devices.probe import Probe
 from combustion_ble.exceptions import DFUNotImplementedError
+from combustion_ble.log_store import LogStore, LogStoreWriter
 from combustion_ble.logger import LOGGER
 from combustion_ble.message_handlers import MessageHandlers
+from combustion_ble.reconnect_policy import ReconnectPolicy
+from combustion_ble.retention import RetentionPolicy
 from combustion_ble.uart import (
     LogRequest,
     LogResponse,
     ReadOverTemperatureRequest,
     ReadOverTemperatureResponse,
     Response,
+    ResponseFramer,
     SessionInfoRequest,
     SessionInfoResponse,
     SessionInformation,
     SetColorResponse,
     SetIDResponse,
     SetPredictionResponse,
-    responses_from_data,
+    UARTFramer,
 )
 from combustion_ble.uart.meatnet import (
     NodeProbeStatusRequest,
@@ -48,8 +57,9 @@ from combustion_ble.uart.meatnet import (
     NodeRequest,
     NodeResponse,
     NodeSetPredictionResponse,
-    NodeUARTMessage,
+    NodeUARTFramer,
 )
+from combustion_ble.utilities.asyncio_utils import ensure_future
 
 DeviceListener = Callable[[list[Device], list[Device]], None]
 
@@ -94,9 +104,20 @@ class DeviceManager(BleManagerDelegate):
         if DeviceManager.shared:
             raise RuntimeError("An instance already exists.")
         self.devices: dict[str, Device] = {}
+        self._devices_by_ble_identifier: dict[str, Device] = {}
         self.connection_manager = ConnectionManager(self)
         self.message_handlers = MessageHandlers()
         self.device_listeners: list[DeviceListener] = []
+        self.uart_framers: dict[str, UARTFramer] = {}
+        """UART message framers, by BLE identifier of the connected device."""
+        self.log_store: Optional[LogStoreWriter] = None
+        """Store that temperature logs are persisted to, if configured."""
+        self.retention_policy: Optional[RetentionPolicy] = None
+        """Limits on the temperature logs and devices kept in memory, if configured."""
+        self.reconnect_policies: dict[type[Device], ReconnectPolicy] = {Device: ReconnectPolicy()}
+        """Backoff of automatic reconnections, by device class."""
+        self.device_registry: Optional[DeviceRegistry] = None
+        """Registry that known devices are saved to, if configured."""
         DeviceManager.shared = self
         BleManager.shared.delegate = self
         self.timer_task: asyncio.Task | None = asyncio.create_task(self._start_timers())
@@ -121,6 +142,12 @@ class DeviceManager(BleManagerDelegate):
             self.timer_task.cancel()
             self.timer_task = None
 
+        # Save the registry while connections are still maintained, to restore them on restart.
+        try:
+            self._save_device_registry()
+        except Exception:
+            LOGGER.exception("Error saving the device registry during DeviceManager shutdown.")
+
         # Attempt to disconnect from all devices.
         for key in self.devices:
             try:
@@ -141,9 +168,19 @@ class DeviceManager(BleManagerDelegate):
         except Exception:
             LOGGER.exception("Error stopping BleManager during DeviceManager shutdown.")
 
+        if self.log_store:
+            try:
+                await self.log_store.close()
+            except Exception:
+                LOGGER.exception("Error closing the log store during DeviceManager shutdown.")
+            self.log_store = None
+
     async def _start_timers(self):
         while True:
             self._update_device_stale_status()
+            self._apply_retention_policy()
+            self._apply_connection_pool()
+            self._apply_device_registry()
             self.message_handlers.check_for_timeout()
             await asyncio.sleep(1)
 
@@ -152,6 +189,183 @@ class DeviceManager(BleManagerDelegate):
         for key, device in self.devices.items():
             device._update_device_stale()
 
+    def _apply_retention_policy(self):
+        for probe in self.get_probes():
+            probe._seal_past_temperature_logs()
+        policy = self.retention_policy
+        if policy is None:
+            return
+        for probe, log in policy.sessions_to_evict(self.get_probes()):
+            LOGGER.debug("Evicting log of session [%d] of probe [%s]", log.id, probe)
+            probe._remove_temperature_log(log.id)
+        removed = policy.devices_to_remove(self.devices.values())
+        if removed:
+            self._remove_devices(removed)
+
+    def _apply_connection_pool(self):
+        pool = BleManager.shared.connection_pool
+        if pool.max_size is None and pool.idle_timeout is None:
+            return
+        connections, connecting = self._pooled_connections()
+        for identifier in pool.connections_to_release(connections, connecting=connecting):
+            LOGGER.debug("Releasing connection to [%s]", identifier)
+            ensure_future(
+                self._release_connection(identifier), name="device_manager[release_connection]"
+            )
+
+    def _pooled_connections(
+        self, exclude: Optional[Device] = None
+    ) -> tuple[list[tuple[str, Usefulness]], int]:
+        """Open direct connections with their usefulness, and the number of direct connections
+        being opened. Connections being opened may still be queued by the connection scheduler, so
+        there is nothing to release yet."""
+        connections = []
+        connecting = 0
+        for device in self.devices.values():
+            if not device.ble_identifier or not device.maintaining_connection or device is exclude:
+                continue
+            if device.connection_state == Device.ConnectionState.CONNECTED:
+                connections.append((device.ble_identifier, self._connection_usefulness(device)))
+            elif device.connection_state == Device.ConnectionState.CONNECTING:
+                connecting += 1
+        return connections, connecting
+
+    def _connection_usefulness(self, device: Device) -> Usefulness:
+        """MeatNet nodes are the most useful connections, as each relays several probes. Probes
+        that no connected node relays, then probes whose logs are not fully synced, are more useful
+        than the others, and stronger signals more useful than weaker ones."""
+        if isinstance(device, MeatNetNode):
+            return (True, True, True, device.rssi)
+        if not isinstance(device, Probe):
+            return (False, True, True, device.rssi)
+        covered = self._get_best_node_for_probe(device.serial_number) is not None
+        synced = device.log_sync_progress.percent >= 100
+        return (False, not covered, not synced, device.rssi)
+
+    def _apply_device_registry(self):
+        try:
+            self._save_device_registry()
+        except OSError:
+            LOGGER.exception("Error saving the device registry")
+
+    def _save_device_registry(self):
+        if self.device_registry is None:
+            return
+        self.device_registry.save(
+            self._device_record(device) for device in list(self.devices.values())
+        )
+
+    def _device_record(self, device: Device) -> DeviceRecord:
+        record = DeviceRecord(
+            (
+                CombustionProductType.MEAT_NET_NODE
+                if isinstance(device, MeatNetNode)
+                else CombustionProductType.PROBE
+            ),
+            device.unique_identifier,
+            ble_identifier=device.ble_identifier,
+            firmware_version=device.firmware_version,
+            hardware_revision=device.hardware_revision,
+            sku=device.sku,
+            manufacturing_lot=device.manufacturing_lot,
+            connected=device.maintaining_connection,
+            # Rounded so that the file is not rewritten for every advertisement.
+            last_seen=device.last_update_time.timestamp() // 60 * 60,
+        )
+        if device.ble_identifier:
+            record.gatt_handles = BleManager.shared._gatt_handles.get(device.ble_identifier, {})
+        if isinstance(device, MeatNetNode):
+            record.serial_number = device.serial_number_string
+        elif isinstance(device, Probe):
+            record.serial_number = device.serial_number_string
+            if session_information := device._session_information:
+                record.session_id = session_information.session_id
+                record.sample_period = session_information.sample_period
+            route = max(
+                (
+                    node
+                    for node in self.get_meatnet_nodes()
+                    if node.has_connection_to_probe(device.serial_number)
+                ),
+                key=lambda node: (
+                    node.connection_state == Device.ConnectionState.CONNECTED,
+                    node.rssi,
+                ),
+                default=None,
+            )
+            if route:
+                record.best_route = route.unique_identifier
+        return record
+
+    def _restore_devices(self, registry: DeviceRegistry, records: list[DeviceRecord]):
+        """Create the devices of the records, and reconnect to the ones a connection was maintained
+        to."""
+        now = datetime.now().timestamp()
+        restored: list[Device] = []
+        # Nodes first, so that probes can be added to the node that relayed them.
+        for record in sorted(
+            records, key=lambda record: record.product_type != CombustionProductType.MEAT_NET_NODE
+        ):
+            if record.unique_identifier in self.devices:
+                continue
+            metadata_valid = registry.metadata_valid(record, now)
+            device: Device
+            if record.product_type == CombustionProductType.MEAT_NET_NODE:
+                if not self.connection_manager.meat_net_enabled or not record.ble_identifier:
+                    continue
+                node = MeatNetNode(None, self, False, Device.MIN_RSSI, record.ble_identifier)
+                if metadata_valid:
+                    node.serial_number_string = record.serial_number
+                device = node
+            elif record.product_type == CombustionProductType.PROBE:
+                probe = Probe(
+                    None,
+                    self,
+                    identifier=record.ble_identifier,
+                    serial_number=int(record.unique_identifier),
+                )
+                if (
+                    metadata_valid
+                    and record.session_id is not None
+                    and record.sample_period is not None
+                ):
+                    probe._update_with_session_information(
+                        SessionInformation(record.session_id, record.sample_period)
+                    )
+                route = self.devices.get(record.best_route) if record.best_route else None
+                if isinstance(route, MeatNetNode):
+                    route.update_networked_probe(probe)
+                device = probe
+            else:
+                continue
+
+            if metadata_valid:
+                device.firmware_version = record.firmware_version
+                device.hardware_revision = record.hardware_revision
+                device.sku = record.sku
+                device.manufacturing_lot = record.manufacturing_lot
+                if record.ble_identifier and record.gatt_handles:
+                    BleManager.shared._gatt_handles[record.ble_identifier] = dict(
+                        record.gatt_handles
+                    )
+            device.last_update_time = datetime.fromtimestamp(record.last_seen)
+            self.devices[device.unique_identifier] = device
+            self._index_ble_identifier(device)
+            restored.append(device)
+            if record.connected and device.ble_identifier:
+                registry.reconnected += 1
+                ensure_future(device.connect(), name="device.connect[registry]")
+
+        if restored:
+            for listener in self.device_listeners:
+                listener(restored, [])
+
+    async def _release_connection(self, identifier: str):
+        """Disconnect from a device without giving up on it: a device that a connection is
+        maintained to reconnects through its reconnect policy, and is admitted to the pool again if
+        it is useful enough by then."""
+        await BleManager.shared.disconnect(identifier)
+
     def add_simulated_probe(self):
         # Placeholder for adding a simulated probe
         pass
@@ -159,20 +373,183 @@ class DeviceManager(BleManagerDelegate):
     def enable_meatnet(self):
         self.connection_manager.meat_net_enabled = True
 
+    def configure_advertising_filter(
+        self, min_interval: float = 0.0, max_entries: int = AdvertisingFilter.DEFAULT_MAX_ENTRIES
+    ) -> AdvertisingFilter:
+        """Configure how received advertisements are filtered before they are decoded.
+
+        Advertisements that repeat the previous payload of a device are never decoded again. With a
+        `min_interval`, advertisements received for a device within `min_interval` seconds of the
+        last one that was processed only update its RSSI. At most `max_entries` devices are
+        remembered. The returned filter exposes counters of received, decoded, coalesced and
+        dropped advertisements.
+        """
+        advertising_filter = BleManager.shared.advertising_filter
+        advertising_filter.min_interval = min_interval
+        advertising_filter.max_entries = max_entries
+        return advertising_filter
+
+    def configure_connection_scheduler(
+        self, max_concurrent: int = ConnectionScheduler.DEFAULT_MAX_CONCURRENT
+    ) -> ConnectionScheduler:
+        """Configure how many connection attempts may run at once on each Bluetooth adapter.
+
+        Further attempts are queued, MeatNet nodes first, then probes that are not reachable through
+        a connected node, then by signal strength. Raising the limit starts queued attempts right
+        away. The returned scheduler exposes the queue depth and counters and averages of
+        connection attempts, waits and time to connect. Raises ValueError if `max_concurrent` is not
+        positive.
+        """
+        scheduler = BleManager.shared.connection_scheduler
+        scheduler.max_concurrent = max_concurrent
+        return scheduler
+
+    def configure_reconnect_policy(
+        self,
+        device_type: type[Device] = Device,
+        initial_delay: float = ReconnectPolicy.DEFAULT_INITIAL_DELAY,
+        max_delay: float = ReconnectPolicy.DEFAULT_MAX_DELAY,
+        multiplier: float = ReconnectPolicy.DEFAULT_MULTIPLIER,
+        jitter: float = ReconnectPolicy.DEFAULT_JITTER,
+    ) -> ReconnectPolicy:
+        """Configure the backoff between automatic reconnections to devices of `device_type` and
+        its subclasses, for example `Probe` or `MeatNetNode`, that a connection is maintained to.
+
+        The delay starts at `initial_delay` seconds, is multiplied by `multiplier` after each attempt
+        that does not connect up to `max_delay`, and is reduced by a random fraction of up to
+        `jitter`. Devices count their `reconnect_attempts` and `reconnect_seconds`.
+        """
+        policy = ReconnectPolicy(initial_delay, max_delay, multiplier, jitter)
+        self.reconnect_policies[device_type] = policy
+        return policy
+
+    def _reconnect_policy(self, device: Device) -> ReconnectPolicy:
+        for device_type in type(device).__mro__:
+            if policy := self.reconnect_policies.get(device_type):
+                return policy
+        return self.reconnect_policies[Device]
+
+    def configure_connection_pool(
+        self, max_size: Optional[int] = None, idle_timeout: Optional[float] = None
+    ) -> ConnectionPool:
+        """Limit the direct connections kept open, so that connection slots of the Bluetooth
+        adapter remain for the most useful devices.
+
+        With a `max_size`, connecting to a device when the pool is full evicts the least useful
+        connection if it is less useful than the new one, and otherwise fails the attempt. MeatNet
+        nodes are the most useful, then probes no connected node relays, then probes still syncing
+        their logs, then stronger signals. Connections without status notifications or UART
+        traffic for `idle_timeout` seconds are released. Released devices are disconnected, and
+        reconnected to with the backoff of their reconnect policy. The returned pool exposes
+        utilization, eviction and idle release counters.
+        """
+        pool = BleManager.shared.connection_pool
+        pool.max_size = max_size
+        pool.idle_timeout = idle_timeout
+        return pool
+
+    def configure_device_registry(
+        self,
+        path: str,
+        max_age: float = DeviceRegistry.DEFAULT_MAX_AGE,
+        metadata_max_age: float = DeviceRegistry.DEFAULT_METADATA_MAX_AGE,
+    ) -> DeviceRegistry:
+        """Remember known probes and MeatNet nodes in the JSON file at `path`, for a warm start.
+
+        The devices saved by the previous run are created right away, and devices that a connection
+        was maintained to are reconnected to without waiting for their advertising. Their firmware,
+        hardware, model information, session and characteristic handles are used instead of being
+        read again if the device was heard from within `metadata_max_age` seconds. Devices not heard
+        from for `max_age` seconds are forgotten. Call `enable_meatnet` first to restore MeatNet
+        nodes. The registry is saved when devices change, and on `async_stop`. The returned
+        registry exposes load and save counters and the time to the first probe status.
+        """
+        registry = DeviceRegistry(path, max_age=max_age, metadata_max_age=metadata_max_age)
+        self.device_registry = registry
+        self._restore_devices(registry, registry.load())
+        return registry
+
+    def configure_log_store(self, store: LogStore) -> LogStoreWriter:
+        """Persist temperature logs to `store`, for example a `SQLiteLogStore`.
+
+        Must be called before devices are discovered. Data points are written in batches on a worker
+        thread. When a probe's session log is created, the data points already stored for that
+        probe and session are read back, and only the missing ones are requested from the probe.
+        """
+        self.log_store = LogStoreWriter(store)
+        return self.log_store
+
+    def configure_retention(
+        self,
+        max_session_age: Optional[float] = None,
+        max_sessions_per_probe: Optional[int] = None,
+        max_log_bytes: Optional[int] = None,
+        max_device_age: Optional[float] = None,
+        max_devices: Optional[int] = None,
+    ) -> RetentionPolicy:
+        """Limit the temperature logs and devices kept in memory, for long running applications.
+
+        Logs of past sessions are evicted by age (seconds since they were last updated), by count
+        per probe, or when all logs together take more than `max_log_bytes`. Their data points
+        remain in the log store, if one is configured. Devices that are not connected are removed
+        when they have not been heard from for `max_device_age` seconds, or beyond `max_devices`,
+        and device listeners are notified of their removal. Limits are applied every second.
+        """
+        self.retention_policy = RetentionPolicy(
+            max_session_age=max_session_age,
+            max_sessions_per_probe=max_sessions_per_probe,
+            max_log_bytes=max_log_bytes,
+            max_device_age=max_device_age,
+            max_devices=max_devices,
+        )
+        return self.retention_policy
+
     def enable_dfu_mode(self, enable):
         raise DFUNotImplementedError()
 
     def _add_device(self, device: Device):
         self.devices[device.unique_identifier] = device
+        self._index_ble_identifier(device)
         for listener in self.device_listeners:
             listener([device], [])
 
     def _clear_device(self, device: Device):
         if device.unique_identifier in self.devices:
             del self.devices[device.unique_identifier]
+            self._unindex_ble_identifier(device, device.ble_identifier)
             for listener in self.device_listeners:
                 listener([], [device])
 
+    def _remove_devices(self, devices: list[Device]):
+        """Forget devices that are no longer around, and notify device listeners once."""
+        for device in devices:
+            LOGGER.debug("Removing device [%s]", device)
+            if isinstance(device, Probe):
+                device.stop_session_request_timer()
+                self.connection_manager.clear_handlers_for_probe(
+                    device, msg="device_manager::remove_devices"
+                )
+            self.devices.pop(device.unique_identifier, None)
+            self._unindex_ble_identifier(device, device.ble_identifier)
+            if (
+                device.ble_identifier
+                and device.ble_identifier not in self._devices_by_ble_identifier
+            ):
+                self.uart_framers.pop(device.ble_identifier, None)
+                BleManager.shared.forget(device.ble_identifier)
+        for listener in self.device_listeners:
+            listener([], devices)
+
+    def _index_ble_identifier(self, device: Device, previous: Optional[str] = None):
+        """Index a device by its BLE identifier, replacing its `previous` identifier."""
+        self._unindex_ble_identifier(device, previous)
+        if device.ble_identifier:
+            self._devices_by_ble_identifier[device.ble_identifier] = device
+
+    def _unindex_ble_identifier(self, device: Device, identifier: Optional[str]):
+        if identifier and self._devices_by_ble_identifier.get(identifier) is device:
+            del self._devices_by_ble_identifier[identifier]
+
     def get_probes(self) -> list[Probe]:
         return [device for device in self.devices.values() if isinstance(device, Probe)]
 
@@ -227,8 +604,34 @@ class DeviceManager(BleManagerDelegate):
     async def _connect_to_device(self, device: Device):
         if device.ble_identifier:
             # If this device has a BLE identifier (advertisements are directly detected rather than through MeatNet), attempt to connect to it.
+            pool = BleManager.shared.connection_pool
+            if pool.max_size is not None:
+                connections, connecting = self._pooled_connections(exclude=device)
+                admitted, evicted = pool.admit(
+                    self._connection_usefulness(device), connections, connecting
+                )
+                if not admitted:
+                    LOGGER.debug("Connection pool is full, not connecting to [%s]", device)
+                    device._update_connection_state(Device.ConnectionState.FAILED)
+                    return
+                if evicted:
+                    LOGGER.debug("Evicting connection to [%s]", evicted)
+                    await self._release_connection(evicted)
             device._update_connection_state(Device.ConnectionState.CONNECTING)
-            await BleManager.shared.connect(device.ble_identifier)
+            await BleManager.shared.connect(
+                device.ble_identifier, priority=self._connection_priority(device)
+            )
+
+    def _connection_priority(self, device: Device) -> ConnectionPriority:
+        """MeatNet nodes are connected to first, as each relays several probes, then probes that no
+        connected node relays, then devices with the strongest signal."""
+        if isinstance(device, MeatNetNode):
+            return (0, False, -device.rssi)
+        covered = (
+            isinstance(device, Probe)
+            and self._get_best_node_for_probe(device.serial_number) is not None
+        )
+        return (1, covered, -device.rssi)
 
     async def _disconnect_from_device(self, device: Device):
         if device.ble_identifier:
@@ -237,11 +640,12 @@ class DeviceManager(BleManagerDelegate):
             await BleManager.shared.disconnect(device.ble_identifier)
 
     async def request_logs_from(self, device: Device, min_sequence: int, max_sequence: int):
+        """Request the log records of a Probe from `min_sequence` to `max_sequence`, inclusive."""
         if isinstance(device, Probe):
             target_device = self._get_best_route_to_probe(device.serial_number)
             if isinstance(target_device, Probe) and target_device.ble_identifier:
                 # Request logs directly from Probe
-                request = LogRequest(min_sequence=min_sequence, max_sequence=max_sequence - 1)
+                request = LogRequest(min_sequence=min_sequence, max_sequence=max_sequence)
                 await BleManager.shared.send_request(target_device.ble_identifier, request)
             elif isinstance(target_device, MeatNetNode) and target_device.ble_identifier:
                 # If the best route is through a Node, send it that way.
@@ -341,18 +745,7 @@ class DeviceManager(BleManagerDelegate):
         raise DFUNotImplementedError()
 
     def find_device_by_ble_identifier(self, identifier: str) -> Device | None:
-        found_device: Device | None = None
-        device = self.devices.get(identifier)
-        if device:
-            # This was a MeatNet Node as it was stored by its BLE UUID.
-            found_device = device
-        else:
-            # Search through Devices to see if any Probes have a matching BLE identifier.
-            for device in self.devices.values():
-                if device.ble_identifier and device.ble_identifier == identifier:
-                    found_device = device
-                    break
-        return found_device
+        return self._devices_by_ble_identifier.get(identifier)
 
     # Delegate methods
     def did_connect_to(self, identifier):
@@ -368,6 +761,7 @@ class DeviceManager(BleManagerDelegate):
 
     def did_disconnect_from(self, identifier: str):
         device = self.find_device_by_ble_identifier(identifier)
+        self.uart_framers.pop(identifier, None)
         if device:
             device._update_connection_state(Device.ConnectionState.DISCONNECTED)
             self.message_handlers.clear_handlers_for_device(identifier)
@@ -381,7 +775,7 @@ class DeviceManager(BleManagerDelegate):
             device.firmware_version = version
 
     def update_device_serial_number(self, identifier: str, serial_number: str):
-        if (device := self.find_device_by_ble_identifier(identifier) is not None) and isinstance(
+        if (device := self.find_device_by_ble_identifier(identifier)) and isinstance(
             device, MeatNetNode
         ):
             device.serial_number_string = serial_number
@@ -390,9 +784,32 @@ class DeviceManager(BleManagerDelegate):
         if device := self.find_device_by_ble_identifier(identifier):
             device.update_with_model_info(model_info)
 
+    def has_device_info(self, identifier: str, characteristic: str) -> bool:
+        """Device information is kept across reconnections, so it is only read once per device."""
+        device = self.find_device_by_ble_identifier(identifier)
+        if device is None:
+            return False
+        if characteristic == "fw_revision":
+            return device.firmware_version is not None
+        if characteristic == "hw_revision":
+            return device.hardware_revision is not None
+        if characteristic == "model_number":
+            return device.sku is not None and device.manufacturing_lot is not None
+        if characteristic == "serial_number":
+            # Probes advertise their serial number.
+            return not isinstance(device, MeatNetNode) or device.serial_number_string is not None
+        return False
+
+    def update_device_rssi(self, identifier: str, rssi: int):
+        if device := self.find_device_by_ble_identifier(identifier):
+            device._rssi.update(rssi)
+
     def update_device_with_status(self, identifier: str, status: ProbeStatus):
         probe = self.find_device_by_ble_identifier(identifier)
         if probe and isinstance(probe, Probe):
+            probe._received_direct_status()
+            if self.device_registry:
+                self.device_registry.received_status()
             probe._update_probe_status(status)
             self.connection_manager.received_status_for(probe, direct_connection=True)
 
@@ -400,6 +817,8 @@ class DeviceManager(BleManagerDelegate):
         self, serial_number: int, status: ProbeStatus, hop_count: HopCount
     ):
         if probe := self.find_probe_by_serial_number(serial_number):
+            if self.device_registry:
+                self.device_registry.received_status()
             probe._update_probe_status(status, hop_count)
             self.connection_manager.received_status_for(probe, direct_connection=False)
 
@@ -449,7 +868,10 @@ class DeviceManager(BleManagerDelegate):
         if advertising.serial_number != DeviceManager.INVALID_PROBE_SERIAL_NUMBER:
             unique_identifier = str(advertising.serial_number)
             if (probe := self.devices.get(unique_identifier)) and isinstance(probe, Probe):
+                previous_identifier = probe.ble_identifier
                 probe.update_with_advertising(advertising, is_connectable, rssi, identifier)
+                if probe.ble_identifier != previous_identifier:
+                    self._index_ble_identifier(probe, previous_identifier)
                 found_probe = probe
             else:
                 # If we don't yet have an entry for this Probe, create one.
@@ -464,28 +886,56 @@ class DeviceManager(BleManagerDelegate):
         if (probe := self.find_device_by_ble_identifier(identifier)) and isinstance(probe, Probe):
             probe._process_log_response(log_response)
 
+    def update_device_with_log_responses(self, identifier: str, log_responses: list[LogResponse]):
+        if (probe := self.find_device_by_ble_identifier(identifier)) and isinstance(probe, Probe):
+            probe._process_log_responses(
+                [log_response for log_response in log_responses if log_response.success]
+            )
+
     def update_device_with_session_information(
         self, identifier: str, session_information: SessionInformation
     ):
         if (probe := self.find_device_by_ble_identifier(identifier)) and isinstance(probe, Probe):
             probe._update_with_session_information(session_information)
 
-    def handle_uart_data(self, identifier: str, data: bytes):
-        """Processes data received over UART, which could be Responses and/or Requests depending on the source."""
+    def handle_uart_data(self, identifier: str, data: bytes | bytearray):
+        """Processes data received over UART, which could be Responses and/or Requests depending on the source.
+
+        Messages split across notifications are reassembled by a framer kept for each connection.
+        """
         if device := self.find_device_by_ble_identifier(identifier):
+            framer = self.uart_framers.get(identifier)
             if isinstance(device, Probe):
                 # If this was a Probe, treat all the data as responses
-                responses = responses_from_data(data)
-                for response in responses:
-                    self.handle_probe_uart_response(identifier, response)
+                if not isinstance(framer, ResponseFramer):
+                    framer = self.uart_framers[identifier] = ResponseFramer()
+                # Log responses in a notification are added to the Probe's log as a single batch
+                log_responses: list[LogResponse] = []
+                for response in framer.feed(data):
+                    if isinstance(response, LogResponse):
+                        log_responses.append(response)
+                    else:
+                        self.handle_probe_uart_response(identifier, response)
+                if log_responses:
+                    self.update_device_with_log_responses(identifier, log_responses)
             elif isinstance(device, MeatNetNode):
                 # If this was a Node, the data could be Responses and/or Requests
-                messages = NodeUARTMessage.from_data(data)
-                for message in messages:
-                    if isinstance(message, NodeRequest):
+                if not isinstance(framer, NodeUARTFramer):
+                    framer = self.uart_framers[identifier] = NodeUARTFramer()
+                # Log responses in a notification are added to each Probe's log as a single batch
+                node_log_responses: dict[int, list[NodeReadLogsResponse]] = {}
+                for message in framer.feed(data):
+                    if isinstance(message, NodeReadLogsResponse):
+                        node_log_responses.setdefault(message.probe_serial_number, []).append(
+                            message
+                        )
+                    elif isinstance(message, NodeRequest):
                         self.handle_node_uart_request(identifier, message)
                     elif isinstance(message, NodeResponse):
                         self.handle_node_uart_response(identifier, message)
+                for serial_number, responses in node_log_responses.items():
+                    if probe := self.find_probe_by_serial_number(serial_number=serial_number):
+                        probe._process_log_responses(responses)
 
     def handle_probe_uart_response(self, identifier: str, response: Response):
         """Probe direct message handling"""
@@ -0,0 +1,175 @@
+"""Persistence of the devices known to a previous run, for a warm start."""
+
+import json
+import os
+import time
+from typing import Any, Iterable, Optional
+
+from combustion_ble.ble_data.advertising_data import CombustionProductType
+from combustion_ble.logger import LOGGER
+
+
+class DeviceRecord:
+    """What is remembered about a probe or MeatNet node."""
+
+    __slots__ = (
+        "product_type",
+        "unique_identifier",
+        "ble_identifier",
+        "serial_number",
+        "firmware_version",
+        "hardware_revision",
+        "sku",
+        "manufacturing_lot",
+        "session_id",
+        "sample_period",
+        "best_route",
+        "connected",
+        "gatt_handles",
+        "last_seen",
+    )
+
+    def __init__(
+        self,
+        product_type: CombustionProductType,
+        unique_identifier: str,
+        ble_identifier: Optional[str] = None,
+        serial_number: Optional[str] = None,
+        firmware_version: Optional[str] = None,
+        hardware_revision: Optional[str] = None,
+        sku: Optional[str] = None,
+        manufacturing_lot: Optional[str] = None,
+        session_id: Optional[int] = None,
+        sample_period: Optional[int] = None,
+        best_route: Optional[str] = None,
+        connected: bool = False,
+        gatt_handles: Optional[dict[str, int]] = None,
+        last_seen: float = 0.0,
+    ) -> None:
+        self.product_type = product_type
+        self.unique_identifier = unique_identifier
+        self.ble_identifier = ble_identifier
+        self.serial_number = serial_number
+        self.firmware_version = firmware_version
+        self.hardware_revision = hardware_revision
+        self.sku = sku
+        self.manufacturing_lot = manufacturing_lot
+        self.session_id = session_id
+        self.sample_period = sample_period
+        self.best_route = best_route
+        """Unique identifier of the MeatNet node that relayed the probe."""
+        self.connected = connected
+        """Whether a connection was maintained to the device."""
+        self.gatt_handles = gatt_handles or {}
+        """Handles of the characteristics used, by UUID."""
+        self.last_seen = last_seen
+        """Time the device was last heard from, as a `time.time()` timestamp."""
+
+    def as_dict(self) -> dict[str, Any]:
+        record = {name: getattr(self, name) for name in self.__slots__}
+        record["product_type"] = self.product_type.name
+        return record
+
+    @staticmethod
+    def from_dict(record: dict[str, Any]) -> "DeviceRecord":
+        return DeviceRecord(
+            **{
+                **record,
+                "product_type": CombustionProductType[record["product_type"]],
+            }
+        )
+
+
+class DeviceRegistry:
+    """Known devices, saved to a JSON file and loaded on the next start.
+
+    Records of devices not heard from for ``max_age`` seconds are dropped when loading. Device
+    information, session and characteristic handles are only trusted for ``metadata_max_age``
+    seconds after the device was last heard from, and are read again from older devices.
+    """
+
+    VERSION = 1
+    DEFAULT_MAX_AGE = 30 * 24 * 3600.0
+    DEFAULT_METADATA_MAX_AGE = 24 * 3600.0
+
+    def __init__(
+        self,
+        path: str,
+        max_age: float = DEFAULT_MAX_AGE,
+        metadata_max_age: float = DEFAULT_METADATA_MAX_AGE,
+    ) -> None:
+        self.path = path
+        self.max_age = max_age
+        """Number of seconds after which a device that is not heard from is forgotten."""
+
+        self.metadata_max_age = metadata_max_age
+        """Number of seconds after which the remembered information of a device is read again."""
+
+        self._saved: Optional[str] = None
+        self._loaded_at: Optional[float] = None
+
+        self.loaded = 0
+        """Number of records loaded."""
+
+        self.expired = 0
+        """Number of records dropped when loading because the device was not heard from recently."""
+
+        self.reconnected = 0
+        """Number of loaded devices reconnected to without waiting for their advertising."""
+
+        self.saves = 0
+        """Number of times the registry file was written."""
+
+        self.time_to_first_status: Optional[float] = None
+        """Number of seconds from loading the registry to the first probe status received."""
+
+    def load(self, now: Optional[float] = None) -> list[DeviceRecord]:
+        """Return the records saved by a previous run, except expired ones. A missing or unreadable
+        file is an empty registry. `now` is a `time.time()` timestamp."""
+        if now is None:
+            now = time.time()
+        self._loaded_at = time.monotonic()
+        try:
+            with open(self.path, encoding="utf-8") as file:
+                content = json.load(file)
+            if content.get("version") != self.VERSION:
+                raise ValueError(f"Unsupported version [{content.get('version')}]")
+            records = [DeviceRecord.from_dict(record) for record in content["devices"]]
+        except FileNotFoundError:
+            return []
+        except (OSError, ValueError, KeyError, TypeError):
+            LOGGER.warning("Ignoring unreadable device registry [%s]", self.path, exc_info=True)
+            return []
+
+        loaded = [record for record in records if now - record.last_seen <= self.max_age]
+        self.loaded += len(loaded)
+        self.expired += len(records) - len(loaded)
+        return loaded
+
+    def metadata_valid(self, record: DeviceRecord, now: Optional[float] = None) -> bool:
+        """Whether the remembered information of a device can be used without reading it again."""
+        if now is None:
+            now = time.time()
+        return now - record.last_seen <= self.metadata_max_age
+
+    def save(self, records: Iterable[DeviceRecord]) -> bool:
+        """Write the records, replacing the file atomically, if they changed since the last write.
+        Returns whether the file was written."""
+        content = json.dumps(
+            {"version": self.VERSION, "devices": [record.as_dict() for record in records]},
+            sort_keys=True,
+        )
+        if content == self._saved:
+            return False
+        temporary_path = f"{self.path}.tmp"
+        with open(temporary_path, "w", encoding="utf-8") as file:
+            file.write(content)
+        os.replace(temporary_path, self.path)
+        self._saved = content
+        self.saves += 1
+        return True
+
+    def received_status(self) -> None:
+        """Record that a probe status was received."""
+        if self.time_to_first_status is None and self._loaded_at is not None:
+            self.time_to_first_status = time.monotonic() - self._loaded_at
@@ -1,8 +1,9 @@
+import asyncio
+import time
 from datetime import datetime
 from typing import TYPE_CHECKING, Optional
 
 from combustion_ble.exceptions import DFUNotImplementedError
-from combustion_ble.utilities.asyncio_utils import ensure_future
 from combustion_ble.utilities.monitor import Monitorable, RemoveListener, UpdateListener
 
 if TYPE_CHECKING:
@@ -55,6 +56,17 @@ class Device:
         self.dfu_service_controller = None
         self.device_manager: "DeviceManager" = device_manager
 
+        self.reconnect_attempts = 0
+        """Number of automatic reconnection attempts made."""
+        self._consecutive_reconnects = 0
+        self._reconnect_seconds = 0.0
+        self._reconnecting_since: Optional[float] = None
+        self._reconnect_task: Optional[asyncio.Task] = None
+
+        self.time_to_first_status: Optional[float] = None
+        """Number of seconds from the last connection to the first status notification on it."""
+        self._connected_at: Optional[float] = None
+
     @property
     def rssi(self) -> int:
         """The current RSSI."""
@@ -64,17 +76,61 @@ class Device:
         """Add a listener for RSSI changes."""
         return self._rssi.add_update_listener(listener)
 
+    @property
+    def reconnect_seconds(self) -> float:
+        """Number of seconds spent reconnecting after the connection was lost, including the
+        current outage."""
+        if self._reconnecting_since is None:
+            return self._reconnect_seconds
+        return self._reconnect_seconds + time.monotonic() - self._reconnecting_since
+
     def _update_connection_state(self, state: str):
         self.connection_state = state
 
-        if self.connection_state == Device.ConnectionState.DISCONNECTED:
-            self.firmware_version = None
-
-        if self.maintaining_connection and (
+        if self.connection_state == Device.ConnectionState.CONNECTED:
+            self._connected_at = time.monotonic()
+            self._stop_reconnecting()
+        elif self.maintaining_connection and (
             self.connection_state == Device.ConnectionState.DISCONNECTED
             or self.connection_state == Device.ConnectionState.FAILED
         ):
-            ensure_future(self.connect(), name="device.connect[update_connection_state]")
+            self._schedule_reconnect()
+
+    def _received_direct_status(self):
+        if self._connected_at is not None:
+            self.time_to_first_status = time.monotonic() - self._connected_at
+            self._connected_at = None
+
+    def _schedule_reconnect(self):
+        """Reconnect after the delay given by the reconnect policy for this device."""
+        if self._reconnect_task and not self._reconnect_task.done():
+            return
+        policy = self.device_manager._reconnect_policy(self)
+        delay = policy.delay(self._consecutive_reconnects)
+        if self._reconnecting_since is None:
+            self._reconnecting_since = time.monotonic()
+        self._reconnect_task = asyncio.create_task(self._reconnect_after(delay))
+
+    async def _reconnect_after(self, delay: float):
+        await asyncio.sleep(delay)
+        self._reconnect_task = None
+        if (
+            self.maintaining_connection
+            and self.connection_state != Device.ConnectionState.CONNECTED
+        ):
+            self._consecutive_reconnects += 1
+            self.reconnect_attempts += 1
+            await self.connect()
+
+    def _stop_reconnecting(self):
+        """Cancel a pending reconnection and reset the backoff."""
+        if self._reconnect_task and not self._reconnect_task.done():
+            self._reconnect_task.cancel()
+        self._reconnect_task = None
+        self._consecutive_reconnects = 0
+        if self._reconnecting_since is not None:
+            self._reconnect_seconds += time.monotonic() - self._reconnecting_since
+            self._reconnecting_since = None
 
     def _update_device_stale(self):
         self.stale = (datetime.now() - self.last_update_time).total_seconds() > self.STALE_TIMEOUT
@@ -105,6 +161,7 @@ class Device:
 
     async def disconnect(self):
         self.maintaining_connection = False
+        self._stop_reconnecting()
         await self.device_manager._disconnect_from_device(self)
 
     def run_software_upgrade(self, dfu_file):
@@ -1,4 +1,5 @@
-from typing import TYPE_CHECKING
+from datetime import datetime
+from typing import TYPE_CHECKING, Optional
 
 from combustion_ble.ble_data.advertising_data import AdvertisingData
 from combustion_ble.devices.device import Device
@@ -12,7 +13,7 @@ if TYPE_CHECKING:
 class MeatNetNode(Device):
     def __init__(
         self,
-        advertising: AdvertisingData,
+        advertising: Optional[AdvertisingData],
         device_manager: "DeviceManager",
         is_connectable: bool,
         rssi: int,
@@ -24,16 +25,25 @@ class MeatNetNode(Device):
             ble_identifier=identifier,
             rssi=rssi,
         )
-        self.serial_number_string = None
+        self.serial_number_string: Optional[str] = None
         self.probes: dict[int, Probe] = {}
         self.dfu_type = DFUDeviceType.UNKNOWN
-        self.update_with_advertising(advertising, is_connectable, rssi)
+        if advertising is not None:
+            self.update_with_advertising(advertising, is_connectable, rssi)
 
     def update_with_advertising(
         self, advertising: AdvertisingData, is_connectable: bool, rssi: int
     ):
         self._rssi.update(rssi)
         self.is_connectable = is_connectable
+        self.last_update_time = datetime.now()
+
+    def _update_connection_state(self, state: str):
+        if state == self.ConnectionState.CONNECTED:
+            # The probes relayed by this node are reachable again.
+            for probe in self.probes.values():
+                probe._log_sync.reconnected()
+        super()._update_connection_state(state)
 
     def update_networked_probe(self, probe: "Probe"):
         if probe is not None:
@@ -7,16 +7,18 @@ from typing import TYPE_CHECKING, Coroutine, Optional
 from combustion_ble.ble_data import AdvertisingData, CombustionProductType
 from combustion_ble.ble_data.battery_status_virtual_sensors import BatteryStatus
 from combustion_ble.ble_data.hop_count import HopCount
-from combustion_ble.ble_data.mode_id import ProbeColor, ProbeID, ProbeMode
+from combustion_ble.ble_data.mode_id import ModeId, ProbeColor, ProbeID, ProbeMode
 from combustion_ble.ble_data.probe_status import ProbeStatus
 from combustion_ble.ble_data.probe_temperatures import ProbeTemperatures
 from combustion_ble.ble_data.virtual_sensors import VirtualSensors
 from combustion_ble.devices.device import Device
 from combustion_ble.instant_read_filter import InstantReadFilter
+from combustion_ble.log_stream import LogStream, OverflowPolicy
+from combustion_ble.log_sync import LogSync, LogSyncProgress
 from combustion_ble.logged_probe_data_count import LoggedProbeDataPoint
 from combustion_ble.prediction.prediction_info import PredictionInfo
 from combustion_ble.prediction.prediction_manager import PredictionManager
-from combustion_ble.probe_temperature_log import ProbeTemperatureLog
+from combustion_ble.probe_temperature_log import LogsUpdate, ProbeTemperatureLog
 from combustion_ble.uart import LogResponse, SessionInformation
 from combustion_ble.uart.meatnet import NodeReadLogsResponse
 from combustion_ble.utilities.asyncio_utils import ensure_future
@@ -24,6 +26,7 @@ from combustion_ble.utilities.monitor import Monitorable, RemoveListener, Update
 
 if TYPE_CHECKING:
     from ..device_manager import DeviceManager
+    from ..log_store import LogStoreWriter
 
 
 DEADBAND_RANGE_IN_CELSIUS = 0.05
@@ -85,37 +88,45 @@ class Probe(Device):
 
     def __init__(
         self,
-        advertising: AdvertisingData,
+        advertising: Optional[AdvertisingData],
         device_manager: "DeviceManager",
         is_connectable=None,
         rssi=None,
         identifier: str | None = None,
+        serial_number: Optional[int] = None,
     ):
+        """Create a probe from its advertising data, or from its `serial_number` alone for a probe
+        known from a previous run."""
+        if advertising is not None:
+            serial_number = advertising.serial_number
+        assert serial_number is not None, "Either advertising or serial_number is required."
         super().__init__(
-            unique_identifier=str(advertising.serial_number),
+            unique_identifier=str(serial_number),
             ble_identifier=identifier,
             device_manager=device_manager,
             rssi=rssi,
         )
-        self._serial_number = advertising.serial_number
+        self._serial_number = serial_number
         self._serial_number_string = f"{self._serial_number:08X}"
 
-        self._id = advertising.mode_id.id
-        self._color = advertising.mode_id.color
+        mode_id = advertising.mode_id if advertising is not None else ModeId.default_values()
+        self._id = mode_id.id
+        self._color = mode_id.color
         self._current_temperatures: Monitorable[Optional[ProbeTemperatures]] = Monitorable(None)
         self._instant_read_celsius: Optional[float] = None
         self._instant_read_fahrenheit: Optional[float] = None
         self._instant_read_temperature: Optional[float] = None
         self._min_sequence_number: Optional[int] = None
         self._max_sequence_number: Optional[int] = None
-        self._percent_of_logs_synced: Optional[int] = None
         self._battery_status = Monitorable(BatteryStatus.OK)
         self._virtual_sensors: Optional[VirtualSensors] = None
         self._prediction_info: Monitorable[Optional[PredictionInfo]] = Monitorable(None)
         self._virtual_temperatures: Monitorable[VirtualTemperatures] = Monitorable(
             VirtualTemperatures()
         )
-        self._temperature_logs: list[ProbeTemperatureLog] = []
+        self._temperature_logs: dict[int, ProbeTemperatureLog] = {}
+        self._logs_updated: Monitorable[Optional[LogsUpdate]] = Monitorable(None)
+        self._log_sync = LogSync(self._request_logs)
         self._overheating: Monitorable[Overheating] = Monitorable(
             Overheating(is_overheating=False, overheating_sensors=[])
         )
@@ -131,9 +142,11 @@ class Probe(Device):
         self._session_request_task: Optional[asyncio.Task] = None
 
         self._prediction_manager.add_update_listener(self._publish_prediction_info)
+        self._logs_updated.add_update_listener(self._log_sync.logs_updated)
 
         # Update the probe with advertising data
-        self.update_with_advertising(advertising, is_connectable, rssi, identifier)
+        if advertising is not None:
+            self.update_with_advertising(advertising, is_connectable, rssi, identifier)
 
         # Start timer to re-request session information every 3 minutes
         self.start_session_request_timer()
@@ -224,6 +237,8 @@ class Probe(Device):
     def _update_connection_state(self, state):
         if state == self.ConnectionState.DISCONNECTED:
             self._session_information = None
+        elif state == self.ConnectionState.CONNECTED:
+            self._log_sync.reconnected()
         super()._update_connection_state(state)
 
     def _update_device_stale(self):
@@ -287,7 +302,7 @@ class Probe(Device):
                     hop_count = advertising.hop_count
 
                 if self._update_instant_read(
-                    advertising.temperatures.values[0],
+                    advertising.temperatures.celsius(0),
                     advertising.mode_id.id,
                     advertising.mode_id.color,
                     advertising.battery_status_virtual_sensors.battery_status,
@@ -320,28 +335,29 @@ class Probe(Device):
         if not self.current_temperatures:
             return
 
+        temperatures = self.current_temperatures.values
         any_over_temp = False
         overheating_sensor_list: list[int] = []
 
         # Check T1-T2
         for i in range(0, 2):
-            if self.current_temperatures.values[i] >= self.OVERHEATING_T1_T2_THRESHOLD:
+            if temperatures[i] >= self.OVERHEATING_T1_T2_THRESHOLD:
                 any_over_temp = True
                 overheating_sensor_list.append(i)
 
         # Check T3
-        if self.current_temperatures.values[2] >= self.OVERHEATING_T3_THRESHOLD:
+        if temperatures[2] >= self.OVERHEATING_T3_THRESHOLD:
             any_over_temp = True
             overheating_sensor_list.append(2)
 
         # Check T4
-        if self.current_temperatures.values[3] >= self.OVERHEATING_T4_THRESHOLD:
+        if temperatures[3] >= self.OVERHEATING_T4_THRESHOLD:
             any_over_temp = True
             overheating_sensor_list.append(3)
 
         # Check T5-T8
         for i in range(4, 8):
-            if self.current_temperatures.values[i] >= self.OVERHEATING_T5_T8_THRESHOLD:
+            if temperatures[i] >= self.OVERHEATING_T5_T8_THRESHOLD:
                 any_over_temp = True
                 overheating_sensor_list.append(i)
 
@@ -393,7 +409,7 @@ class Probe(Device):
                 updated = True
         elif device_status.mode_id.mode == ProbeMode.INSTANT_READ:
             updated = self._update_instant_read(
-                device_status.temperatures.values[0],
+                device_status.temperatures.celsius(0),
                 probe_id=device_status.mode_id.id,
                 probe_color=device_status.mode_id.color,
                 probe_battery_status=device_status.battery_status_virtual_sensors.battery_status,
@@ -408,17 +424,9 @@ class Probe(Device):
         if updated:
             current = self._get_current_temperature_log()
             if current:
-                self._update_log_percent()
-                missing_range = current.missing_range(
-                    device_status.min_sequence_number, device_status.max_sequence_number
+                self._log_sync.update(
+                    current, device_status.min_sequence_number, device_status.max_sequence_number
                 )
-                if missing_range:
-                    ensure_future(
-                        self.device_manager.request_logs_from(
-                            self, min_sequence=missing_range[0], max_sequence=missing_range[1]
-                        ),
-                        name="request_logs_from[probe]",
-                    )
 
         self._last_status_notification_time = datetime.now()
         self._update_status_notifications_stale()
@@ -449,53 +457,114 @@ class Probe(Device):
     def _update_with_session_information(self, session_information: SessionInformation):
         self._session_information = session_information
 
-    def _update_log_percent(self) -> None:
-        current_log = self._get_current_temperature_log()
-        max_sequence_number = self._max_sequence_number
-        min_sequence_number = self._min_sequence_number
-        if max_sequence_number is None or min_sequence_number is None or current_log is None:
-            return
+    @property
+    def log_sync_progress(self) -> LogSyncProgress:
+        """Progress of the synchronization of the current temperature log from the probe."""
+        return self._log_sync.progress
 
-        number_logs_from_probe = current_log.logs_in_range(
-            [min_sequence_number, max_sequence_number]
+    async def _request_logs(self, min_sequence: int, max_sequence: int):
+        await self.device_manager.request_logs_from(
+            self, min_sequence=min_sequence, max_sequence=max_sequence
         )
-        number_logs_on_probe = int(max_sequence_number - min_sequence_number + 1)
-        if number_logs_from_probe == number_logs_on_probe:
-            self._percent_of_logs_synced = 100
-        else:
-            self._percent_of_logs_synced = int(
-                float(number_logs_from_probe) / float(number_logs_on_probe) * 100
-            )
 
     def _is_old_status_update(self, device_status: ProbeStatus) -> bool:
         current_temp_log = self._get_current_temperature_log()
         if current_temp_log:
-            max = current_temp_log.data_points[-1]
-            if max.sequence_num is None:
+            newest_sequence_number = current_temp_log.newest_sequence_number
+            if newest_sequence_number is None:
                 return False
-            return device_status.max_sequence_number < max.sequence_num
+            return device_status.max_sequence_number < newest_sequence_number
         return False
 
     def _get_current_temperature_log(self) -> Optional[ProbeTemperatureLog]:
         if not self._session_information:
             return None
-        return next(
-            (
-                log
-                for log in self._temperature_logs
-                if log.session_information.session_id == self._session_information.session_id
-            ),
-            None,
-        )
+        return self._temperature_logs.get(self._session_information.session_id)
+
+    def add_logs_updated_listener(
+        self, listener: UpdateListener[Optional[LogsUpdate]]
+    ) -> RemoveListener:
+        """Add a listener called once for each batch of data points added to a temperature log."""
+        return self._logs_updated.add_update_listener(listener)
+
+    def iter_log(
+        self,
+        since_sequence: Optional[int] = None,
+        resume_token: Optional[str] = None,
+        max_queue: int = LogStream.DEFAULT_MAX_QUEUE,
+        overflow: OverflowPolicy = OverflowPolicy.DROP_OLDEST,
+    ) -> LogStream:
+        """Iterate asynchronously over the data points of the probe's log.
+
+        Yields `LogStreamItem`s, first for the data points already logged with sequence numbers
+        above `since_sequence`, in order, then for data points as they are added. Pass the
+        `resume_token` of the last item received to continue an earlier iteration instead. Live data
+        points wait in a queue of at most `max_queue` items, and `overflow` decides what happens
+        when it is full.
+
+        The stream listens to the probe until it is closed. Iterate it within ``async with``, or
+        call its `close` method, so it stops as soon as the consumer does.
+
+        .. code-block:: python
+
+            async with probe.iter_log(since_sequence=0) as stream:
+                async for item in stream:
+                    send(item.data_point, item.resume_token)
+        """
+        return LogStream(self, since_sequence, resume_token, max_queue, overflow)
+
+    def _create_temperature_log(
+        self, session_information: SessionInformation
+    ) -> ProbeTemperatureLog:
+        # Logs of previous sessions are no longer updated, so they are kept compressed.
+        for previous_log in self._temperature_logs.values():
+            previous_log.seal()
+
+        store = self.device_manager.log_store
+        log = ProbeTemperatureLog(session_information, self._serial_number, store)
+        log.add_logs_updated_listener(self._logs_updated.update)
+        self._temperature_logs[log.id] = log
+        if store:
+            log.restoring = True
+            ensure_future(
+                self._restore_temperature_log(log, store), name="restore_temperature_log[probe]"
+            )
+        return log
+
+    def _seal_past_temperature_logs(self) -> None:
+        """Seal the logs of previous sessions again, dropping the data points decompressed by reads
+        and compressing data points added since."""
+        current_log = self._get_current_temperature_log()
+        if current_log is None:
+            return
+        for log in self._temperature_logs.values():
+            if log is not current_log:
+                log.seal()
+
+    def _remove_temperature_log(self, session_id: int) -> None:
+        """Drop the log of a past session from memory. Its data points remain in the log store, if
+        one is configured."""
+        log = self._temperature_logs.get(session_id)
+        if log is not None and log is not self._get_current_temperature_log():
+            del self._temperature_logs[session_id]
+
+    async def _restore_temperature_log(
+        self, log: ProbeTemperatureLog, store: "LogStoreWriter"
+    ) -> None:
+        """Add the data points of `log` that were written to the log store in a previous run."""
+        try:
+            rows = await store.load(self._serial_number, log.id)
+        finally:
+            log.restoring = False
+        log.restore(rows)
 
     def _add_data_to_log(self, data_point: LoggedProbeDataPoint) -> None:
         current = self._get_current_temperature_log()
         if current:
             current.append_data_point(data_point=data_point)
         elif self._session_information:
-            log = ProbeTemperatureLog(self._session_information)
+            log = self._create_temperature_log(self._session_information)
             log.append_data_point(data_point=data_point)
-            self._temperature_logs.append(log)
 
     def _process_log_response(self, log_response: LogResponse | NodeReadLogsResponse):
         # Process log response
@@ -504,6 +573,23 @@ class Probe(Device):
         elif isinstance(log_response, NodeReadLogsResponse):
             self._add_data_to_log(LoggedProbeDataPoint.from_node_read_logs_response(log_response))
 
+    def _process_log_responses(self, log_responses: list[LogResponse] | list[NodeReadLogsResponse]):
+        """Process a batch of log responses, adding them to the current log at once."""
+        if not log_responses:
+            return
+        current = self._get_current_temperature_log()
+        if current is None:
+            self._process_log_response(log_responses[0])
+            log_responses = log_responses[1:]
+            current = self._get_current_temperature_log()
+            if current is None:
+                return
+
+        current.insert_log_records(
+            (log_response.sequence_number, log_response.log_record)
+            for log_response in log_responses
+        )
+
     def _update_status_notifications_stale(self):
         """Updates the status of whether the status notifications are stale.
         This is based on the time elapsed since the last status notification.
@@ -0,0 +1,181 @@
+"""Compressed encoding of temperature log columns.
+
+Adjacent samples rarely differ by more than a few raw counts, so each temperature channel, the
+sequence numbers and the estimated core temperature are stored as zigzag-encoded deltas in
+variable-length integers, which mostly take a single byte. Virtual sensors, prediction state and the
+prediction set point rarely change, and are stored as runs of ``(value, length)`` pairs; so are the
+deltas of the sequence numbers and of the prediction seconds, which mostly repeat.
+
+A segment is a version byte followed by a stream of varints: the number of data points, then for
+each section the number of varints in the section and the varints themselves. All the varints of a
+segment are decoded in a single pass, then each section is expanded back to its column.
+"""
+
+import re
+from array import array
+from functools import partial
+from itertools import accumulate, chain, repeat
+from operator import lshift, or_
+from typing import Any
+
+from combustion_ble.ble_data.probe_temperatures import (
+    PACKED_TEMPERATURES_LENGTH,
+    RAW_TEMPERATURE_BITS,
+    RAW_TEMPERATURE_MASK,
+    TEMPERATURE_COUNT,
+)
+
+SEGMENT_VERSION = 1
+
+_TEMPERATURE_SHIFTS = tuple(
+    range(0, TEMPERATURE_COUNT * RAW_TEMPERATURE_BITS, RAW_TEMPERATURE_BITS)
+)
+
+
+# Zigzag values of the deltas of raw temperatures, which are below 2 ** 14, decode by lookup.
+_UNZIGZAG = [(zigzag >> 1) ^ -(zigzag & 1) for zigzag in range(1 << (RAW_TEMPERATURE_BITS + 1))]
+
+_to_packed_bytes = partial(int.to_bytes, length=PACKED_TEMPERATURES_LENGTH, byteorder="little")
+
+_MULTI_BYTE_VARINT = re.compile(rb"[\x80-\xff]+[\x00-\x7f]")
+
+
+def _write_varint(out: bytearray, value: int) -> None:
+    while value >= 0x80:
+        out.append(value & 0x7F | 0x80)
+        value >>= 7
+    out.append(value)
+
+
+def _write_section(out: bytearray, values: list[int]) -> None:
+    _write_varint(out, len(values))
+    for value in values:
+        _write_varint(out, value)
+
+
+def _deltas(values) -> list[int]:
+    """Zigzag-encoded differences between consecutive values, starting from 0."""
+    result = []
+    previous = 0
+    for value in values:
+        delta = value - previous
+        result.append(delta << 1 if delta >= 0 else (-delta << 1) - 1)
+        previous = value
+    return result
+
+
+def _runs(values) -> list[int]:
+    """Flattened ``(value, length)`` pairs of the runs of equal values."""
+    result: list[int] = []
+    iterator = iter(values)
+    for previous in iterator:
+        length = 1
+        for value in iterator:
+            if value == previous:
+                length += 1
+                continue
+            result += (previous, length)
+            previous = value
+            length = 1
+        result += (previous, length)
+    return result
+
+
+def _undeltas(section: list[int]) -> list[int]:
+    if section and max(section) < len(_UNZIGZAG):
+        return list(accumulate(map(_UNZIGZAG.__getitem__, section)))
+    return list(accumulate((zigzag >> 1) ^ -(zigzag & 1) for zigzag in section))
+
+
+def _unruns(section: list[int]) -> list[int]:
+    return list(chain.from_iterable(map(repeat, section[::2], section[1::2])))
+
+
+def encode_columns(columns: tuple[Any, ...]) -> bytes:
+    """Encode columns laid out as returned by `DataPointColumns.raw_columns`, with sequence numbers
+    in ascending order."""
+    (
+        sequence_numbers,
+        temperatures,
+        virtual_sensors,
+        prediction_state_mode_type,
+        prediction_set_points,
+        prediction_seconds,
+        estimated_core_temperatures,
+    ) = columns
+    out = bytearray((SEGMENT_VERSION,))
+    _write_varint(out, len(sequence_numbers))
+
+    _write_section(out, _runs(_deltas(sequence_numbers)))
+    packed = [
+        int.from_bytes(temperatures[offset : offset + PACKED_TEMPERATURES_LENGTH], "little")
+        for offset in range(0, len(temperatures), PACKED_TEMPERATURES_LENGTH)
+    ]
+    for shift in _TEMPERATURE_SHIFTS:
+        _write_section(out, _deltas(value >> shift & RAW_TEMPERATURE_MASK for value in packed))
+    _write_section(out, _runs(virtual_sensors))
+    _write_section(out, _runs(prediction_state_mode_type))
+    _write_section(out, _runs(prediction_set_points))
+    _write_section(out, _runs(_deltas(prediction_seconds)))
+    _write_section(out, _deltas(estimated_core_temperatures))
+    return bytes(out)
+
+
+def _read_varints(data: bytes) -> list[int]:
+    if data and data[-1] >= 0x80:
+        raise ValueError("Truncated log segment.")
+    # Most varints are a single byte, which is its own value: bytes between multi-byte varints are
+    # copied as they are.
+    values: list[int] = []
+    position = 0
+    for match in _MULTI_BYTE_VARINT.finditer(data):
+        start, end = match.span()
+        values += data[position:start]
+        value = 0
+        shift = 0
+        for byte in data[start:end]:
+            value |= (byte & 0x7F) << shift
+            shift += 7
+        values.append(value)
+        position = end
+    values += data[position:]
+    return values
+
+
+def decode_columns(data: bytes) -> tuple[Any, ...]:
+    """Decode a segment produced by `encode_columns` back into columns."""
+    if not data or data[0] != SEGMENT_VERSION:
+        raise ValueError("Unsupported log segment version.")
+    values = _read_varints(data[1:])
+    count = values[0]
+    position = 1
+
+    def section() -> list[int]:
+        nonlocal position
+        length = values[position]
+        start = position + 1
+        position = start + length
+        if position > len(values):
+            raise ValueError("Truncated log segment.")
+        return values[start:position]
+
+    sequence_numbers = array("I", _undeltas(_unruns(section())))
+    channels = [_undeltas(section()) for _ in _TEMPERATURE_SHIFTS]
+    packed = channels[0]
+    for channel, shift in zip(channels[1:], _TEMPERATURE_SHIFTS[1:]):
+        packed = list(map(or_, packed, map(lshift, channel, repeat(shift))))
+    temperatures = b"".join(map(_to_packed_bytes, packed))
+    columns = (
+        sequence_numbers,
+        temperatures,
+        bytes(_unruns(section())),
+        bytes(_unruns(section())),
+        array("H", _unruns(section())),
+        array("I", _undeltas(_unruns(section()))),
+        array("H", _undeltas(section())),
+    )
+    if len(temperatures) != count * PACKED_TEMPERATURES_LENGTH or any(
+        len(columns[index]) != count for index in (0, 2, 3, 4, 5, 6)
+    ):
+        raise ValueError("Corrupt log segment.")
+    return columns
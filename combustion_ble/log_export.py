@@ -0,0 +1,304 @@
+"""Streaming export of temperature logs to CSV, NumPy structured arrays and Arrow IPC/Parquet.
+
+The NumPy and Arrow exporters need the optional ``numpy`` and ``pyarrow`` packages, which can be
+installed with the ``export`` extra.
+"""
+
+from datetime import datetime
+from typing import IO, Any, Iterator, Optional
+
+from combustion_ble.ble_data.probe_temperatures import (
+    PACKED_TEMPERATURES_LENGTH,
+    RAW_TEMPERATURE_BITS,
+    RAW_TEMPERATURE_MASK,
+    TEMPERATURE_COUNT,
+)
+from combustion_ble.probe_temperature_log import ProbeTemperatureLog
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover
+    np = None  # type: ignore[assignment]
+
+DEFAULT_CHUNK_SIZE = 65536
+"""Number of data points exported at once."""
+
+TEMPERATURE_FIELDS = tuple(f"t{sensor}" for sensor in range(1, TEMPERATURE_COUNT + 1))
+
+EXPORT_FIELDS = (
+    "sequence_number",
+    "timestamp",
+    *TEMPERATURE_FIELDS,
+    "virtual_core",
+    "virtual_surface",
+    "virtual_ambient",
+    "prediction_state",
+    "prediction_mode",
+    "prediction_type",
+    "prediction_set_point_temperature",
+    "prediction_value_seconds",
+    "estimated_core_temperature",
+)
+"""Exported fields. Timestamps are POSIX timestamps in seconds, temperatures are in Celsius, virtual
+sensors are thermistor numbers (1-based) and prediction state, mode and type are enum values.
+
+Timestamps are empty (NaN in NumPy arrays, null in Arrow files) when the start time of the log is
+not known, for example for a log that was only restored from a log store or backfilled."""
+
+_TEMPERATURE_SHIFTS = range(0, TEMPERATURE_COUNT * RAW_TEMPERATURE_BITS, RAW_TEMPERATURE_BITS)
+
+
+class _Chunk:
+    __slots__ = ("columns", "first_timestamp", "seconds_per_sample")
+
+    def __init__(
+        self, columns: tuple[Any, ...], first_timestamp: Optional[float], seconds_per_sample: float
+    ):
+        self.columns = columns
+        self.first_timestamp = first_timestamp
+        self.seconds_per_sample = seconds_per_sample
+
+
+def _iter_chunks(
+    log: ProbeTemperatureLog,
+    start: Optional[datetime],
+    end: Optional[datetime],
+    chunk_size: int,
+) -> Iterator[_Chunk]:
+    if log.start_time is None and start is None and end is None:
+        # Without a time range, the whole log is exported even if its start time is unknown.
+        min_sequence_number, max_sequence_number = 0, 0xFFFFFFFF
+        session_start = None
+    else:
+        min_sequence_number, max_sequence_number = log.sequence_range(start, end)
+        assert log.start_time is not None
+        session_start = log.start_time.timestamp()
+    seconds_per_sample = log.session_information.sample_period / 1000
+
+    first, stop = log.columns.index_range(min_sequence_number, max_sequence_number)
+    for index in range(first, stop, chunk_size):
+        columns = log.columns.raw_columns(index, min(index + chunk_size, stop))
+        yield _Chunk(columns, session_start, seconds_per_sample)
+
+
+def export_csv(
+    log: ProbeTemperatureLog,
+    file: IO[str],
+    start: Optional[datetime] = None,
+    end: Optional[datetime] = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> int:
+    """Write the data points of `log` between `start` and `end` to `file` as CSV, with a header row
+    of `EXPORT_FIELDS`. Returns the number of data points written.
+
+    All exported values are numbers, so rows are formatted directly rather than through the `csv`
+    module, using precomputed strings for the raw values of each field.
+    """
+    file.write(",".join(EXPORT_FIELDS) + "\n")
+
+    count = 0
+    for chunk in _iter_chunks(log, start, end, chunk_size):
+        file.write(_csv_text(chunk))
+        count += len(chunk.columns[0])
+    return count
+
+
+_TEMPERATURE_STRINGS = [f"{raw * 0.05 - 20.0:.2f}" for raw in range(RAW_TEMPERATURE_MASK + 1)]
+_VIRTUAL_SENSORS_STRINGS = [
+    f"{(byte & 0x7) + 1},{(byte >> 3 & 0x3) + 4},{(byte >> 5 & 0x3) + 5}" for byte in range(256)
+]
+_PREDICTION_STRINGS = [f"{byte & 0xF},{byte >> 4 & 0x3},{byte >> 6 & 0x3}" for byte in range(256)]
+_SET_POINT_STRINGS = [f"{raw * 0.1:.1f}" for raw in range(1 << 10)]
+_CORE_TEMPERATURE_STRINGS = [f"{raw * 0.1 - 20.0:.1f}" for raw in range(1 << 11)]
+
+
+def _csv_text(chunk: _Chunk) -> str:
+    (
+        sequence_numbers,
+        temperatures,
+        virtual_sensors,
+        prediction_state_mode_type,
+        prediction_set_points,
+        prediction_seconds,
+        estimated_core_temperatures,
+    ) = chunk.columns
+    session_start = chunk.first_timestamp
+    seconds_per_sample = chunk.seconds_per_sample
+    from_bytes = int.from_bytes
+
+    # Fields are formatted a column at a time, then joined into lines.
+    packed = [
+        from_bytes(temperatures[offset : offset + PACKED_TEMPERATURES_LENGTH], "little")
+        for offset in range(0, len(temperatures), PACKED_TEMPERATURES_LENGTH)
+    ]
+    temperature_strings = _TEMPERATURE_STRINGS
+    if session_start is None:
+        timestamps = [""] * len(sequence_numbers)
+    else:
+        timestamps = [
+            f"{session_start + sequence * seconds_per_sample:.3f}" for sequence in sequence_numbers
+        ]
+    columns = [
+        list(map(str, sequence_numbers)),
+        timestamps,
+        *[
+            [temperature_strings[value >> shift & RAW_TEMPERATURE_MASK] for value in packed]
+            for shift in _TEMPERATURE_SHIFTS
+        ],
+        [_VIRTUAL_SENSORS_STRINGS[byte] for byte in virtual_sensors],
+        [_PREDICTION_STRINGS[byte] for byte in prediction_state_mode_type],
+        [_SET_POINT_STRINGS[raw] for raw in prediction_set_points],
+        list(map(str, prediction_seconds)),
+        [_CORE_TEMPERATURE_STRINGS[raw] for raw in estimated_core_temperatures],
+    ]
+    return "\n".join(map(",".join, zip(*columns))) + "\n"
+
+
+def _require_numpy():
+    if np is None:
+        raise ImportError("numpy is required to export to NumPy and Arrow formats.")
+
+
+def numpy_dtype():
+    """Return the NumPy dtype of exported structured arrays."""
+    _require_numpy()
+    return np.dtype(
+        [
+            ("sequence_number", np.uint32),
+            ("timestamp", np.float64),
+            *[(field, np.float64) for field in TEMPERATURE_FIELDS],
+            ("virtual_core", np.uint8),
+            ("virtual_surface", np.uint8),
+            ("virtual_ambient", np.uint8),
+            ("prediction_state", np.uint8),
+            ("prediction_mode", np.uint8),
+            ("prediction_type", np.uint8),
+            ("prediction_set_point_temperature", np.float64),
+            ("prediction_value_seconds", np.uint32),
+            ("estimated_core_temperature", np.float64),
+        ]
+    )
+
+
+def _to_numpy(chunk: _Chunk):
+    (
+        sequence_numbers,
+        temperatures,
+        virtual_sensors,
+        prediction_state_mode_type,
+        prediction_set_points,
+        prediction_seconds,
+        estimated_core_temperatures,
+    ) = chunk.columns
+    result = np.empty(len(sequence_numbers), dtype=numpy_dtype())
+
+    sequence = np.frombuffer(sequence_numbers, dtype=np.uint32)
+    result["sequence_number"] = sequence
+    if chunk.first_timestamp is None:
+        result["timestamp"] = np.nan
+    else:
+        result["timestamp"] = chunk.first_timestamp + sequence * chunk.seconds_per_sample
+
+    # Split the 104 bits of packed temperatures into two little-endian 64-bit words.
+    packed = np.zeros((len(sequence), 16), dtype=np.uint8)
+    packed[:, :PACKED_TEMPERATURES_LENGTH] = np.frombuffer(temperatures, dtype=np.uint8).reshape(
+        -1, PACKED_TEMPERATURES_LENGTH
+    )
+    words = packed.view("<u8")
+    low, high = words[:, 0], words[:, 1]
+    mask = np.uint64(RAW_TEMPERATURE_MASK)
+    for field, shift in zip(TEMPERATURE_FIELDS, _TEMPERATURE_SHIFTS):
+        if shift + RAW_TEMPERATURE_BITS <= 64:
+            raw = (low >> np.uint64(shift)) & mask
+        elif shift >= 64:
+            raw = (high >> np.uint64(shift - 64)) & mask
+        else:
+            raw = ((low >> np.uint64(shift)) | (high << np.uint64(64 - shift))) & mask
+        result[field] = raw * 0.05 - 20.0
+
+    virtual = np.frombuffer(virtual_sensors, dtype=np.uint8)
+    result["virtual_core"] = (virtual & 0x7) + 1
+    result["virtual_surface"] = (virtual >> 3 & 0x3) + 4
+    result["virtual_ambient"] = (virtual >> 5 & 0x3) + 5
+
+    prediction = np.frombuffer(prediction_state_mode_type, dtype=np.uint8)
+    result["prediction_state"] = prediction & 0xF
+    result["prediction_mode"] = prediction >> 4 & 0x3
+    result["prediction_type"] = prediction >> 6 & 0x3
+
+    result["prediction_set_point_temperature"] = (
+        np.frombuffer(prediction_set_points, dtype=np.uint16) * 0.1
+    )
+    result["prediction_value_seconds"] = np.frombuffer(prediction_seconds, dtype=np.uint32)
+    result["estimated_core_temperature"] = (
+        np.frombuffer(estimated_core_temperatures, dtype=np.uint16) * 0.1 - 20.0
+    )
+    return result
+
+
+def iter_numpy(
+    log: ProbeTemperatureLog,
+    start: Optional[datetime] = None,
+    end: Optional[datetime] = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> Iterator[Any]:
+    """Yield the data points of `log` between `start` and `end` as NumPy structured arrays of up to
+    `chunk_size` data points, with the fields of `EXPORT_FIELDS`."""
+    _require_numpy()
+    for chunk in _iter_chunks(log, start, end, chunk_size):
+        yield _to_numpy(chunk)
+
+
+def to_numpy(
+    log: ProbeTemperatureLog, start: Optional[datetime] = None, end: Optional[datetime] = None
+) -> Any:
+    """Return the data points of `log` between `start` and `end` as a single NumPy structured
+    array."""
+    chunks = list(iter_numpy(log, start, end))
+    return np.concatenate(chunks) if chunks else np.empty(0, dtype=numpy_dtype())
+
+
+def export_arrow(
+    log: ProbeTemperatureLog,
+    path: str,
+    start: Optional[datetime] = None,
+    end: Optional[datetime] = None,
+    format: str = "ipc",
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> int:
+    """Write the data points of `log` between `start` and `end` to `path`, as an Arrow IPC file
+    (``format="ipc"``) or a Parquet file (``format="parquet"``), one record batch per chunk.
+    Returns the number of data points written."""
+    _require_numpy()
+    try:
+        import pyarrow as pa
+    except ImportError as error:
+        raise ImportError("pyarrow is required to export to Arrow formats.") from error
+
+    schema = pa.schema([(name, pa.from_numpy_dtype(numpy_dtype()[name])) for name in EXPORT_FIELDS])
+    if format == "ipc":
+        writer = pa.ipc.new_file(path, schema)
+    elif format == "parquet":
+        import pyarrow.parquet as pq
+
+        writer = pq.ParquetWriter(path, schema)
+    else:
+        raise ValueError(f"Unsupported Arrow format [{format}]")
+
+    count = 0
+    try:
+        for array in iter_numpy(log, start, end, chunk_size):
+            writer.write_batch(
+                pa.RecordBatch.from_arrays(
+                    [
+                        # Unknown timestamps are written as nulls.
+                        pa.array(np.ascontiguousarray(array[name]), from_pandas=name == "timestamp")
+                        for name in EXPORT_FIELDS
+                    ],
+                    schema=schema,
+                )
+            )
+            count += len(array)
+    finally:
+        writer.close()
+    return count
@@ -0,0 +1,105 @@
+"""Batch decoding of the log records received in log responses.
+
+A log record is the fixed-width part of a `LogResponse` or `NodeReadLogsResponse` payload: the
+sequence number, the packed temperatures and the packed prediction log. Records are decoded straight
+into `DataPointRow` values, without building the intermediate temperature, prediction log and data
+point objects. With the optional ``numpy`` package, large batches are decoded with vectorized bit
+operations over a single contiguous buffer.
+"""
+
+from typing import Iterable
+
+from combustion_ble.ble_data.prediction_log import (
+    _PREDICTION_STATE_MODE_TYPE as _PREDICTION_LOG_STATE_MODE_TYPE,
+)
+from combustion_ble.ble_data.probe_temperatures import PACKED_TEMPERATURES_LENGTH
+from combustion_ble.ble_data.virtual_sensors import _VIRTUAL_SENSORS
+from combustion_ble.data_point_columns import DataPointRow
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover
+    np = None  # type: ignore[assignment]
+
+LOG_RECORD_LENGTH = 4 + PACKED_TEMPERATURES_LENGTH + 7
+"""Length in bytes of a log record."""
+
+NUMPY_MIN_RECORDS = 64
+"""Smallest batch decoded with NumPy; smaller batches are faster to decode one record at a time."""
+
+_TEMPERATURES_START = 4
+_PREDICTION_LOG_START = _TEMPERATURES_START + PACKED_TEMPERATURES_LENGTH
+
+# The virtual sensors and the prediction state, mode and type are stored as the values of their
+# enums, which replace reserved raw values, so they are normalized by lookup.
+_VIRTUAL_SENSORS_BYTE = bytes(
+    sensors.virtual_core.value
+    | sensors.virtual_surface.value << 3
+    | sensors.virtual_ambient.value << 5
+    for sensors in _VIRTUAL_SENSORS
+)
+_STATE_MODE_TYPE_BYTE = bytes(
+    state.value | mode.value << 4 | prediction_type.value << 6
+    for state, mode, prediction_type in _PREDICTION_LOG_STATE_MODE_TYPE
+)
+
+
+def decode_log_record(record: bytes) -> DataPointRow:
+    """Decode a single log record into a row of column values."""
+    if len(record) != LOG_RECORD_LENGTH:
+        raise ValueError(f"Invalid log record length [{len(record)}]")
+    p0, p1, p2, p3, p4, p5, p6 = record[_PREDICTION_LOG_START:]
+    return (
+        int.from_bytes(record[:_TEMPERATURES_START], "little"),
+        bytes(record[_TEMPERATURES_START:_PREDICTION_LOG_START]),
+        _VIRTUAL_SENSORS_BYTE[p0],
+        _STATE_MODE_TYPE_BYTE[p1 << 1 | p0 >> 7],
+        (p3 & 0x01) << 9 | p2 << 1 | p1 >> 7,
+        (p5 & 0x03) << 15 | p4 << 7 | p3 >> 1,
+        (p6 & 0x1F) << 6 | p5 >> 2,
+    )
+
+
+def _decode_log_records_numpy(records: bytes) -> list[DataPointRow]:
+    data = np.frombuffer(records, dtype=np.uint8).reshape(-1, LOG_RECORD_LENGTH)
+    sequence_numbers = np.ascontiguousarray(data[:, :_TEMPERATURES_START]).view("<u4").ravel()
+    temperatures = data[:, _TEMPERATURES_START:_PREDICTION_LOG_START].tobytes()
+    p0, p1, p2, p3, p4, p5, p6 = data[:, _PREDICTION_LOG_START:].astype(np.uint32).T
+
+    virtual_sensors = np.frombuffer(_VIRTUAL_SENSORS_BYTE, dtype=np.uint8)[p0]
+    state_mode_type = np.frombuffer(_STATE_MODE_TYPE_BYTE, dtype=np.uint8)[p1 << 1 | p0 >> 7]
+    set_points = (p3 & 0x01) << 9 | p2 << 1 | p1 >> 7
+    seconds = (p5 & 0x03) << 15 | p4 << 7 | p3 >> 1
+    core_temperatures = (p6 & 0x1F) << 6 | p5 >> 2
+
+    return list(
+        zip(
+            sequence_numbers.tolist(),
+            [
+                temperatures[offset : offset + PACKED_TEMPERATURES_LENGTH]
+                for offset in range(0, len(temperatures), PACKED_TEMPERATURES_LENGTH)
+            ],
+            virtual_sensors.tolist(),
+            state_mode_type.tolist(),
+            set_points.tolist(),
+            seconds.tolist(),
+            core_temperatures.tolist(),
+        )
+    )
+
+
+def decode_log_records(records: Iterable[bytes]) -> list[DataPointRow]:
+    """Decode a batch of log records into rows of column values, in the same order.
+
+    The records are joined into a contiguous buffer and, when NumPy is installed and the batch has
+    at least `NUMPY_MIN_RECORDS` records, decoded for the whole batch at once.
+    """
+    buffer = b"".join(records)
+    if len(buffer) % LOG_RECORD_LENGTH:
+        raise ValueError(f"Invalid log records length [{len(buffer)}]")
+    if np is not None and len(buffer) >= NUMPY_MIN_RECORDS * LOG_RECORD_LENGTH:
+        return _decode_log_records_numpy(buffer)
+    return [
+        decode_log_record(buffer[offset : offset + LOG_RECORD_LENGTH])
+        for offset in range(0, len(buffer), LOG_RECORD_LENGTH)
+    ]
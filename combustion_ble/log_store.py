@@ -0,0 +1,324 @@
+"""Persistent storage of temperature logs, keyed by probe serial number and session id."""
+
+import asyncio
+import os
+import sqlite3
+from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterable, Iterator, Optional
+
+from combustion_ble.data_point_columns import DataPointColumns, DataPointRow
+from combustion_ble.log_codec import decode_columns, encode_columns
+from combustion_ble.logger import LOGGER
+from combustion_ble.utilities.asyncio_utils import ensure_future
+
+LogKey = tuple[int, int]
+"""Probe serial number and session id of a temperature log."""
+
+
+class LogStore(ABC):
+    """Storage backend for temperature logs.
+
+    Methods are blocking, and are called from a single worker thread by ``LogStoreWriter``.
+    """
+
+    @abstractmethod
+    def write(self, batch: dict[LogKey, tuple[int, list[DataPointRow]]]) -> None:
+        """Write rows of data points, by log. Each log comes with its sample period. Rows that are
+        already stored are ignored."""
+
+    @abstractmethod
+    def load(self, serial_number: int, session_id: int) -> list[DataPointRow]:
+        """Return the stored rows of a log, in any order."""
+
+    @abstractmethod
+    def sessions(self, serial_number: int) -> list[int]:
+        """Return the ids of the stored sessions of a probe."""
+
+    def close(self) -> None:
+        """Release the resources held by the store."""
+
+
+class SQLiteLogStore(LogStore):
+    """Log store backed by an SQLite database file."""
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        with self._connection:
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS sessions ("
+                "serial_number INTEGER NOT NULL, "
+                "session_id INTEGER NOT NULL, "
+                "sample_period INTEGER NOT NULL, "
+                "PRIMARY KEY (serial_number, session_id)"
+                ") WITHOUT ROWID"
+            )
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS data_points ("
+                "serial_number INTEGER NOT NULL, "
+                "session_id INTEGER NOT NULL, "
+                "sequence_number INTEGER NOT NULL, "
+                "temperatures BLOB NOT NULL, "
+                "virtual_sensors INTEGER NOT NULL, "
+                "prediction_state_mode_type INTEGER NOT NULL, "
+                "prediction_set_point INTEGER NOT NULL, "
+                "prediction_seconds INTEGER NOT NULL, "
+                "estimated_core_temperature INTEGER NOT NULL, "
+                "PRIMARY KEY (serial_number, session_id, sequence_number)"
+                ") WITHOUT ROWID"
+            )
+
+    def write(self, batch: dict[LogKey, tuple[int, list[DataPointRow]]]) -> None:
+        with self._connection:
+            for (serial_number, session_id), (sample_period, rows) in batch.items():
+                self._connection.execute(
+                    "INSERT OR IGNORE INTO sessions VALUES (?, ?, ?)",
+                    (serial_number, session_id, sample_period),
+                )
+                self._connection.executemany(
+                    "INSERT OR IGNORE INTO data_points VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                    ((serial_number, session_id, *row) for row in rows),
+                )
+
+    def load(self, serial_number: int, session_id: int) -> list[DataPointRow]:
+        return self._connection.execute(
+            "SELECT sequence_number, temperatures, virtual_sensors, prediction_state_mode_type, "
+            "prediction_set_point, prediction_seconds, estimated_core_temperature "
+            "FROM data_points WHERE serial_number = ? AND session_id = ?",
+            (serial_number, session_id),
+        ).fetchall()
+
+    def sessions(self, serial_number: int) -> list[int]:
+        rows = self._connection.execute(
+            "SELECT session_id FROM sessions WHERE serial_number = ?", (serial_number,)
+        ).fetchall()
+        return [session_id for (session_id,) in rows]
+
+    def close(self) -> None:
+        self._connection.close()
+
+
+def _encode_rows(rows: Iterable[DataPointRow]) -> bytes:
+    columns = DataPointColumns()
+    columns.merge(rows)
+    return encode_columns(columns.raw_columns(0, len(columns)))
+
+
+def _write_varint(file, value: int) -> None:
+    data = bytearray()
+    while value >= 0x80:
+        data.append(value & 0x7F | 0x80)
+        value >>= 7
+    data.append(value)
+    file.write(data)
+
+
+def _read_varint(file) -> Optional[int]:
+    value = 0
+    shift = 0
+    while True:
+        byte = file.read(1)
+        if not byte:
+            return None
+        value |= (byte[0] & 0x7F) << shift
+        if byte[0] < 0x80:
+            return value
+        shift += 7
+
+
+class SegmentLogStore(LogStore):
+    """Log store keeping each log in its own append-only file of compressed segments.
+
+    Each write appends one segment per log, encoded by `combustion_ble.log_codec`. Once
+    ``COMPACT_SEGMENTS`` segments have been appended to a file, they are read back and rewritten as a
+    single segment, so live data points written a few at a time end up compressed in large
+    segments. Compaction writes a new file and replaces the old one, so a crash never loses
+    segments that were already written.
+    """
+
+    MAGIC = b"CBLS"
+    COMPACT_SEGMENTS = 64
+
+    def __init__(self, directory: str) -> None:
+        self.directory = directory
+        os.makedirs(directory, exist_ok=True)
+        # Offsets of the segments appended to each file since it was last compacted.
+        self._appended: dict[LogKey, list[int]] = {}
+
+    def _path(self, serial_number: int, session_id: int) -> str:
+        return os.path.join(self.directory, f"{serial_number:08X}-{session_id:08X}.seg")
+
+    def _segments(self, file, offset: Optional[int] = None) -> Iterator[bytes]:
+        if offset is None:
+            if file.read(len(self.MAGIC)) != self.MAGIC:
+                raise ValueError(f"Not a log segment file [{file.name}]")
+            _read_varint(file)
+        else:
+            file.seek(offset)
+        while (length := _read_varint(file)) is not None:
+            segment = file.read(length)
+            if len(segment) < length:
+                # Ignore a segment cut short, for example by a crash while it was written.
+                return
+            yield segment
+
+    def _segment_offsets(self, file) -> tuple[list[int], int]:
+        """Return the offsets of the complete segments of a file, and the offset where they end."""
+        size = os.fstat(file.fileno()).st_size
+        file.seek(len(self.MAGIC))
+        _read_varint(file)
+        offsets = []
+        end = file.tell()
+        while (length := _read_varint(file)) is not None and file.tell() + length <= size:
+            offsets.append(end)
+            end = file.seek(length, os.SEEK_CUR)
+        return offsets, end
+
+    def write(self, batch: dict[LogKey, tuple[int, list[DataPointRow]]]) -> None:
+        for key, (sample_period, rows) in batch.items():
+            path = self._path(*key)
+            with open(path, "ab") as file:
+                if file.tell() == 0:
+                    file.write(self.MAGIC)
+                    _write_varint(file, sample_period)
+                    self._appended[key] = []
+                elif key not in self._appended:
+                    # First write to a file since the store was opened: all its segments may be
+                    # compacted, and a segment cut short by a crash is dropped before appending.
+                    with open(path, "rb") as reader:
+                        self._appended[key], end = self._segment_offsets(reader)
+                    file.truncate(end)
+                    # Truncating does not move the position of a file opened for appending.
+                    file.seek(end)
+                appended = self._appended[key]
+                appended.append(file.tell())
+                segment = _encode_rows(rows)
+                _write_varint(file, len(segment))
+                file.write(segment)
+
+            if len(appended) >= self.COMPACT_SEGMENTS:
+                self._compact(path, appended[0])
+                appended.clear()
+
+    def _compact(self, path: str, offset: int) -> None:
+        temporary_path = f"{path}.tmp"
+        with open(path, "rb") as file, open(temporary_path, "wb") as compacted:
+            rows = [
+                row
+                for segment in self._segments(file, offset)
+                for row in DataPointColumns.from_raw_columns(decode_columns(segment)).rows()
+            ]
+            file.seek(0)
+            remaining = offset
+            while remaining and (data := file.read(min(remaining, 1 << 20))):
+                remaining -= compacted.write(data)
+            segment = _encode_rows(rows)
+            _write_varint(compacted, len(segment))
+            compacted.write(segment)
+            compacted.flush()
+            os.fsync(compacted.fileno())
+        os.replace(temporary_path, path)
+
+    def load(self, serial_number: int, session_id: int) -> list[DataPointRow]:
+        path = self._path(serial_number, session_id)
+        if not os.path.exists(path):
+            return []
+        columns = DataPointColumns()
+        with open(path, "rb") as file:
+            for segment in self._segments(file):
+                columns.merge(DataPointColumns.from_raw_columns(decode_columns(segment)).rows())
+        return list(columns.rows())
+
+    def sessions(self, serial_number: int) -> list[int]:
+        prefix = f"{serial_number:08X}-"
+        return [
+            int(name[len(prefix) : -len(".seg")], 16)
+            for name in os.listdir(self.directory)
+            if name.startswith(prefix) and name.endswith(".seg")
+        ]
+
+
+class LogStoreWriter:
+    """Batches writes to a `LogStore`, and runs all store operations on a worker thread.
+
+    Rows are buffered in memory and written together every ``FLUSH_INTERVAL`` seconds, or as soon as
+    ``FLUSH_MAX_ROWS`` rows are waiting, so the event loop never blocks on disk I/O.
+    """
+
+    FLUSH_INTERVAL = 1.0
+    FLUSH_MAX_ROWS = 2000
+
+    def __init__(self, store: LogStore) -> None:
+        self.store = store
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="combustion_ble_log")
+        self._pending: dict[LogKey, tuple[int, list[DataPointRow]]] = {}
+        self._pending_rows = 0
+        self._flush_timer: Optional[asyncio.TimerHandle] = None
+
+        self.rows_written = 0
+        """Number of rows handed to the store."""
+
+    async def _run(self, func, *args):
+        return await asyncio.get_running_loop().run_in_executor(self._executor, func, *args)
+
+    def write(
+        self, serial_number: int, session_id: int, sample_period: int, rows: list[DataPointRow]
+    ) -> None:
+        """Queue rows of data points to be written."""
+        if not rows:
+            return
+        _, pending = self._pending.setdefault((serial_number, session_id), (sample_period, []))
+        pending.extend(rows)
+        self._pending_rows += len(rows)
+
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            # Without an event loop, write right away.
+            self._write(self._take_pending())
+            return
+
+        if self._pending_rows >= self.FLUSH_MAX_ROWS:
+            ensure_future(self.flush(), name="flush[log_store]")
+        elif self._flush_timer is None:
+            self._flush_timer = loop.call_later(
+                self.FLUSH_INTERVAL, lambda: ensure_future(self.flush(), name="flush[log_store]")
+            )
+
+    def _take_pending(self) -> dict[LogKey, tuple[int, list[DataPointRow]]]:
+        if self._flush_timer:
+            self._flush_timer.cancel()
+            self._flush_timer = None
+        batch = self._pending
+        self._pending = {}
+        self._pending_rows = 0
+        return batch
+
+    def _write(self, batch: dict[LogKey, tuple[int, list[DataPointRow]]]) -> None:
+        if not batch:
+            return
+        try:
+            self.store.write(batch)
+        except Exception:
+            LOGGER.exception("Error writing temperature logs to the log store.")
+            return
+        self.rows_written += sum(len(rows) for _, rows in batch.values())
+
+    async def flush(self) -> None:
+        """Write all queued rows."""
+        await self._run(self._write, self._take_pending())
+
+    async def load(self, serial_number: int, session_id: int) -> list[DataPointRow]:
+        """Read the stored rows of a log."""
+        return await self._run(self.store.load, serial_number, session_id)
+
+    async def sessions(self, serial_number: int) -> list[int]:
+        """Read the ids of the stored sessions of a probe."""
+        return await self._run(self.store.sessions, serial_number)
+
+    async def close(self) -> None:
+        """Write all queued rows, and close the store."""
+        await self.flush()
+        await self._run(self.store.close)
+        self._executor.shutdown()
@@ -0,0 +1,329 @@
+"""Asynchronous iteration over the data points of a probe's temperature logs."""
+
+import asyncio
+import weakref
+from collections import deque
+from enum import Enum
+from typing import TYPE_CHECKING, Optional
+
+from combustion_ble.exceptions import CombustionError
+from combustion_ble.logged_probe_data_count import LoggedProbeDataPoint
+from combustion_ble.probe_temperature_log import (
+    LogsUpdate,
+    LogView,
+    ProbeTemperatureLog,
+)
+from combustion_ble.utilities.interval_set import IntervalSet
+from combustion_ble.utilities.monitor import RemoveListener
+
+if TYPE_CHECKING:
+    from combustion_ble.devices.probe import Probe
+
+_MAX_SEQUENCE_NUMBER = 0xFFFFFFFF
+
+
+class OverflowPolicy(Enum):
+    """What a `LogStream` does with a live data point when its queue is full."""
+
+    DROP_OLDEST = "drop_oldest"
+    """Drop the oldest queued data point to make room."""
+
+    DROP_NEWEST = "drop_newest"
+    """Drop the new data point."""
+
+    RAISE = "raise"
+    """Stop the stream: the next iteration raises `LogStreamOverflowError`."""
+
+
+class LogStreamOverflowError(CombustionError):
+    """Raised by a `LogStream` whose queue overflowed with the ``RAISE`` policy. Iteration can be
+    resumed from the log with `resume_token`."""
+
+    def __init__(self, resume_token: str) -> None:
+        super().__init__("Log stream queue overflowed")
+        self.resume_token = resume_token
+
+
+class LogStreamItem:
+    """Data point yielded by a `LogStream`."""
+
+    __slots__ = ("session_id", "data_point", "resume_token")
+
+    def __init__(self, session_id: int, data_point: LoggedProbeDataPoint, resume_token: str):
+        self.session_id = session_id
+        """Session of the log the data point belongs to."""
+
+        self.data_point = data_point
+
+        self.resume_token = resume_token
+        """Token to pass to `Probe.iter_log` to continue after this data point."""
+
+    @property
+    def sequence_number(self) -> int:
+        assert self.data_point.sequence_num is not None
+        return self.data_point.sequence_num
+
+
+def _resume_token(session_id: int, cursor: int, missing: list[tuple[int, int]]) -> str:
+    token = f"{session_id}:{cursor}"
+    if missing:
+        token += ":" + ",".join(f"{start}-{end}" for start, end in missing)
+    return token
+
+
+def _parse_resume_token(token: str) -> tuple[int, int, list[tuple[int, int]]]:
+    """Return the session, the highest sequence number yielded, and the runs of sequence numbers
+    below it that were not yielded."""
+    try:
+        session_id, cursor, *runs = token.split(":")
+        if len(runs) > 1:
+            raise ValueError
+        missing = [
+            (int(start), int(end))
+            for start, end in (run.split("-") for run in (runs[0].split(",") if runs else []))
+        ]
+        # Runs are ascending, and below the cursor.
+        next_starts = [start for start, _ in missing[1:]] + [int(cursor)]
+        if any(
+            not start <= end < next_start for (start, end), next_start in zip(missing, next_starts)
+        ):
+            raise ValueError
+        return int(session_id), int(cursor), missing
+    except ValueError:
+        raise ValueError(f"Invalid resume token [{token}]") from None
+
+
+def _complement(runs: list[tuple[int, int]], start: int, end: int) -> list[tuple[int, int]]:
+    """Runs of ``[start, end]`` outside of `runs`, which are ascending and within it."""
+    result = []
+    for run_start, run_end in runs:
+        if run_start > start:
+            result.append((start, run_start - 1))
+        start = run_end + 1
+    if start <= end:
+        result.append((start, end))
+    return result
+
+
+class LogStream:
+    """Asynchronous iterator over the data points of a probe's log, created by `Probe.iter_log`.
+
+    The data points already in the log with sequence numbers above the start position are yielded
+    first, in sequence number order, read lazily from the log. Data points added to the log after
+    that are yielded as they arrive, through a queue of at most ``max_queue`` data points; when the
+    queue is full, ``overflow`` decides what is dropped. When the probe starts a new session, the
+    stream moves on to the log of the new session from its first data point, dropping the queued
+    data points of the previous one.
+
+    Each data point is yielded once. The resume token of an item records its session, the highest
+    sequence number yielded so far, and the runs of sequence numbers below it that were not yielded
+    yet, so a new stream created with it yields exactly the data points the previous one did not,
+    including those backfilled later.
+
+    A stream holds a listener on the probe until it is closed, or garbage collected. Use it as an
+    asynchronous context manager, or call `close`, to stop it as soon as it is no longer iterated.
+    """
+
+    DEFAULT_MAX_QUEUE = 1024
+    HISTORY_CHUNK_SIZE = 256
+    """Number of data points read from the log at once while yielding history."""
+
+    def __init__(
+        self,
+        probe: "Probe",
+        since_sequence: Optional[int] = None,
+        resume_token: Optional[str] = None,
+        max_queue: int = DEFAULT_MAX_QUEUE,
+        overflow: OverflowPolicy = OverflowPolicy.DROP_OLDEST,
+    ) -> None:
+        if max_queue <= 0:
+            raise ValueError("max_queue must be positive.")
+        self._probe = probe
+        self.max_queue = max_queue
+        self.overflow = overflow
+
+        self.dropped = 0
+        """Number of live data points dropped because the queue was full or the session changed."""
+
+        current = probe._get_current_temperature_log()
+        self._session_id: Optional[int] = current.id if current else None
+        since = cursor = -1 if since_sequence is None else since_sequence
+        self._delivered = IntervalSet()
+        if resume_token is not None:
+            self._session_id, cursor, missing = _parse_resume_token(resume_token)
+            since = missing[0][0] - 1 if missing else cursor
+            self._delivered = IntervalSet.from_runs(_complement(missing, since + 1, cursor))
+        self._since = since
+        self._cursor = cursor
+        self._queue: deque[LoggedProbeDataPoint] = deque()
+        self._overflowed = False
+        self._waiter: Optional[asyncio.Future] = None
+
+        # Next sequence number to read from the log, while history is being yielded.
+        self._history_position: Optional[int] = since + 1 if self._log() is not None else None
+        self._history: deque[LoggedProbeDataPoint] = deque()
+        self._remove_listener: Optional[RemoveListener] = self._listen()
+
+    def _listen(self) -> RemoveListener:
+        """Listen to the probe's log updates without keeping the stream alive, so a stream that is
+        dropped without being closed stops receiving data points."""
+        stream = weakref.ref(self)
+
+        def listener(update: Optional[LogsUpdate]) -> None:
+            if (current := stream()) is not None:
+                current._logs_updated(update)
+            else:
+                remove()
+
+        remove = self._probe.add_logs_updated_listener(listener)
+        return remove
+
+    def _log(self) -> Optional[ProbeTemperatureLog]:
+        if self._session_id is None:
+            return None
+        return self._probe._temperature_logs.get(self._session_id)
+
+    @property
+    def queued(self) -> int:
+        """Number of live data points waiting to be yielded."""
+        return len(self._queue)
+
+    def close(self) -> None:
+        """Stop receiving data points, ending the iteration."""
+        if self._remove_listener:
+            self._remove_listener()
+            self._remove_listener = None
+        self._queue.clear()
+        self._history_position = None
+        self._history.clear()
+        self._wake()
+
+    async def aclose(self) -> None:
+        """Stop receiving data points, ending the iteration."""
+        self.close()
+
+    async def __aenter__(self) -> "LogStream":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        self.close()
+
+    def _wake(self) -> None:
+        if self._waiter and not self._waiter.done():
+            self._waiter.set_result(None)
+
+    def _follow(self, log: ProbeTemperatureLog) -> None:
+        """Move on to the log of a new session, from its first data point."""
+        if self._session_id is not None:
+            self._since = self._cursor = -1
+        self._session_id = log.id
+        self._delivered = IntervalSet()
+        self.dropped += len(self._queue)
+        self._queue.clear()
+        self._history_position = self._since + 1
+        self._history.clear()
+
+    def _logs_updated(self, update: Optional[LogsUpdate]) -> None:
+        if update is None:
+            return
+        if update.session_id != self._session_id:
+            current = self._probe._get_current_temperature_log()
+            if current is not None and current.id == update.session_id:
+                self._follow(current)
+                self._wake()
+            return
+
+        log = self._log()
+        if log is None:
+            return
+        start = max(update.min_sequence_number, self._since + 1)
+        end = update.max_sequence_number
+        if self._history_position is not None:
+            # Data points from the history position on are read with the history.
+            end = min(end, self._history_position - 1)
+        for run_start, run_end in self._delivered.missing_runs(start, end):
+            for data_point in LogView(log, run_start, run_end):
+                self._enqueue(data_point)
+        self._wake()
+
+    def _enqueue(self, data_point: LoggedProbeDataPoint) -> None:
+        queue = self._queue
+        if self._overflowed:
+            self.dropped += 1
+            return
+        if len(queue) >= self.max_queue:
+            self.dropped += 1
+            if self.overflow == OverflowPolicy.DROP_NEWEST:
+                return
+            if self.overflow == OverflowPolicy.RAISE:
+                self._overflowed = True
+                self.dropped += len(queue)
+                queue.clear()
+                return
+            queue.popleft()
+        queue.append(data_point)
+
+    def _item(self, data_point: LoggedProbeDataPoint) -> Optional[LogStreamItem]:
+        sequence_number = data_point.sequence_num
+        assert sequence_number is not None and self._session_id is not None
+        if not self._delivered.add(sequence_number):
+            return None
+        self._cursor = max(self._cursor, sequence_number)
+        return LogStreamItem(self._session_id, data_point, self._resume_token())
+
+    def _resume_token(self) -> str:
+        assert self._session_id is not None
+        missing = list(self._delivered.missing_runs(self._since + 1, self._cursor))
+        return _resume_token(self._session_id, self._cursor, missing)
+
+    def __aiter__(self) -> "LogStream":
+        return self
+
+    async def __anext__(self) -> LogStreamItem:
+        while True:
+            if self._remove_listener is None:
+                raise StopAsyncIteration
+
+            if self._history:
+                item = self._item(self._history.popleft())
+                if item:
+                    return item
+                continue
+
+            if self._history_position is not None:
+                log = self._log()
+                if log is not None:
+                    # Skip the data points a resumed stream already yielded.
+                    position = self._delivered.first_missing(
+                        self._history_position, _MAX_SEQUENCE_NUMBER
+                    )
+                    assert position is not None
+                    view = LogView(log, position, _MAX_SEQUENCE_NUMBER)
+                    self._history.extend(view[: self.HISTORY_CHUNK_SIZE])
+                if self._history:
+                    last = self._history[-1].sequence_num
+                    assert last is not None
+                    self._history_position = last + 1
+                    continue
+                self._history_position = None
+                current = self._probe._get_current_temperature_log()
+                if current is not None and current.id != self._session_id:
+                    # Resumed in a past session, which is now complete.
+                    self._follow(current)
+                continue
+
+            if self._overflowed:
+                self._overflowed = False
+                raise LogStreamOverflowError(self._resume_token())
+
+            if self._queue:
+                item = self._item(self._queue.popleft())
+                if item:
+                    return item
+                continue
+
+            self._waiter = asyncio.get_running_loop().create_future()
+            try:
+                await self._waiter
+            finally:
+                self._waiter = None
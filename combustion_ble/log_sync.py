@@ -0,0 +1,251 @@
+"""Flow-controlled synchronization of a probe's temperature log."""
+
+import time
+from collections import deque
+from typing import Any, Callable, Coroutine, Optional
+
+from combustion_ble.logger import LOGGER
+from combustion_ble.probe_temperature_log import LogsUpdate, ProbeTemperatureLog
+from combustion_ble.utilities.asyncio_utils import ensure_future
+
+RequestLogs = Callable[[int, int], Coroutine[Any, Any, Any]]
+"""Sends a request for the log records from a minimum to a maximum sequence number, inclusive."""
+
+
+class LogSyncProgress:
+    """Progress of a temperature log synchronization."""
+
+    __slots__ = ("synced", "total", "records_per_second", "eta_seconds")
+
+    def __init__(
+        self,
+        synced: int = 0,
+        total: int = 0,
+        records_per_second: float = 0.0,
+        eta_seconds: Optional[float] = None,
+    ) -> None:
+        self.synced = synced
+        """Number of records on the probe that are in the log."""
+
+        self.total = total
+        """Number of records on the probe."""
+
+        self.records_per_second = records_per_second
+        """Rate at which records were recently received."""
+
+        self.eta_seconds = eta_seconds
+        """Estimated number of seconds until all records are synced, if records are being received."""
+
+    @property
+    def percent(self) -> int:
+        """Percentage of the records on the probe that are in the log."""
+        if self.total <= 0 or self.synced >= self.total:
+            return 100
+        return int(self.synced / self.total * 100)
+
+
+class _Chunk:
+    __slots__ = ("start", "end", "sent_at", "attempts")
+
+    def __init__(self, start: int, end: int) -> None:
+        self.start = start
+        self.end = end
+        self.sent_at = 0.0
+        self.attempts = 0
+
+
+class LogSync:
+    """Requests the records missing from a probe's temperature log, a few chunks at a time.
+
+    The missing sequence numbers are split into chunks of ``CHUNK_SIZE`` records, aligned on
+    multiples of ``CHUNK_SIZE``. At most ``window`` chunks are requested at once. The window grows by
+    one chunk for each window of chunks that completes, and is halved when a chunk times out, so the
+    number of outstanding requests follows the rate at which the route to the probe answers them.
+
+    Nothing is requested while the log is being restored from a log store, so only the records that
+    were not stored are requested afterwards.
+
+    A chunk that receives no records for ``REQUEST_TIMEOUT`` seconds is requested again, for the
+    records it is still missing, up to ``MAX_ATTEMPTS`` times. Chunks that are still incomplete after
+    that are left alone for ``ABANDONED_RETRY_DELAY`` seconds, or until the probe is reachable again
+    after a reconnection, and then requested again.
+    """
+
+    CHUNK_SIZE = 128
+    INITIAL_WINDOW = 2
+    MIN_WINDOW = 1
+    MAX_WINDOW = 16
+    REQUEST_TIMEOUT = 5.0
+    MAX_ATTEMPTS = 5
+    ABANDONED_RETRY_DELAY = 120.0
+    THROUGHPUT_INTERVAL = 10.0
+    """Number of seconds of history used to measure throughput."""
+
+    def __init__(self, request_logs: RequestLogs) -> None:
+        self._request_logs = request_logs
+        self._log: Optional[ProbeTemperatureLog] = None
+        self._min_sequence_number = 0
+        self._max_sequence_number = -1
+
+        self._in_flight: dict[int, _Chunk] = {}
+        self._abandoned: dict[int, float] = {}
+        """Time at which chunks were given up on, by chunk index."""
+
+        self.window = float(self.INITIAL_WINDOW)
+        """Number of chunks that may be requested at once."""
+
+        self.requests_sent = 0
+        """Number of chunk requests sent, including retries."""
+
+        self.timeouts = 0
+        """Number of chunk requests that timed out."""
+
+        self._samples: deque[tuple[float, int]] = deque()
+
+    @property
+    def in_flight(self) -> int:
+        """Number of chunks currently requested."""
+        return len(self._in_flight)
+
+    @property
+    def progress(self) -> LogSyncProgress:
+        """Progress of the synchronization of the current log."""
+        total = self._max_sequence_number - self._min_sequence_number + 1
+        if self._log is None or total <= 0:
+            return LogSyncProgress()
+
+        synced = self._log.logs_in_range([self._min_sequence_number, self._max_sequence_number])
+        records_per_second = 0.0
+        if len(self._samples) > 1:
+            (first_time, first_count), (last_time, last_count) = self._samples[0], self._samples[-1]
+            if last_time > first_time:
+                records_per_second = (last_count - first_count) / (last_time - first_time)
+
+        eta_seconds = None
+        if synced >= total:
+            eta_seconds = 0.0
+        elif records_per_second > 0:
+            eta_seconds = (total - synced) / records_per_second
+
+        return LogSyncProgress(synced, total, records_per_second, eta_seconds)
+
+    def reset(self) -> None:
+        """Forget all requests, for example when the log session changes."""
+        self._log = None
+        self._in_flight.clear()
+        self._abandoned.clear()
+        self._samples.clear()
+        self.window = float(self.INITIAL_WINDOW)
+
+    def reconnected(self) -> None:
+        """Request all incomplete chunks again, as the route to the probe was restored. Requests
+        sent before the reconnection may have been lost, and chunks given up on may now succeed."""
+        self._in_flight.clear()
+        self._abandoned.clear()
+
+    def update(
+        self, log: ProbeTemperatureLog, min_sequence_number: int, max_sequence_number: int
+    ) -> None:
+        """Update the range of records held by the probe, and request missing records if the window
+        allows. Called for each status notification."""
+        if log is not self._log:
+            self.reset()
+            self._log = log
+        self._min_sequence_number = min_sequence_number
+        self._max_sequence_number = max_sequence_number
+
+        now = time.monotonic()
+        self._sample(now)
+        self._check_timeouts(now)
+        self._fill_window(now)
+
+    def logs_updated(self, update: Optional[LogsUpdate]) -> None:
+        """Listener for the records added to the log, completing the chunks they belong to."""
+        log = self._log
+        if update is None or log is None or update.session_id != log.id:
+            return
+
+        now = time.monotonic()
+        for index, chunk in list(self._in_flight.items()):
+            if update.max_sequence_number < chunk.start or chunk.end < update.min_sequence_number:
+                continue
+            if log.sequence_numbers.first_missing(chunk.start, chunk.end) is None:
+                del self._in_flight[index]
+                # Additive increase: one more chunk for each window of completed chunks.
+                self.window = min(self.window + 1 / self.window, float(self.MAX_WINDOW))
+            else:
+                # Records are still arriving for this chunk, so it has not timed out.
+                chunk.sent_at = now
+
+        self._sample(now)
+        self._fill_window(now)
+
+    def _sample(self, now: float) -> None:
+        if self._log is None:
+            return
+        samples = self._samples
+        samples.append((now, self._log.synced_count))
+        while len(samples) > 2 and now - samples[0][0] > self.THROUGHPUT_INTERVAL:
+            samples.popleft()
+
+    def _check_timeouts(self, now: float) -> None:
+        assert self._log is not None
+        sequence_numbers = self._log.sequence_numbers
+        for index, chunk in list(self._in_flight.items()):
+            if now - chunk.sent_at < self.REQUEST_TIMEOUT:
+                continue
+            if sequence_numbers.first_missing(chunk.start, chunk.end) is None:
+                del self._in_flight[index]
+                continue
+            self.timeouts += 1
+            # Multiplicative decrease.
+            self.window = max(self.window / 2, float(self.MIN_WINDOW))
+            if chunk.attempts >= self.MAX_ATTEMPTS:
+                LOGGER.debug(
+                    "Giving up on log records [%d, %d] after [%d] attempts",
+                    chunk.start,
+                    chunk.end,
+                    chunk.attempts,
+                )
+                del self._in_flight[index]
+                self._abandoned[index] = now
+            else:
+                self._send(chunk, now)
+
+    def _fill_window(self, now: float) -> None:
+        log = self._log
+        if log is None or log.restoring:
+            return
+
+        chunk_size = self.CHUNK_SIZE
+        for start, end in log.sequence_numbers.missing_runs(
+            self._min_sequence_number, self._max_sequence_number
+        ):
+            index = start // chunk_size
+            while index * chunk_size <= end:
+                if len(self._in_flight) >= int(self.window):
+                    return
+                abandoned_at = self._abandoned.get(index)
+                if abandoned_at is not None and now - abandoned_at >= self.ABANDONED_RETRY_DELAY:
+                    del self._abandoned[index]
+                    abandoned_at = None
+                if index not in self._in_flight and abandoned_at is None:
+                    chunk = self._in_flight[index] = _Chunk(
+                        max(index * chunk_size, self._min_sequence_number),
+                        min((index + 1) * chunk_size - 1, self._max_sequence_number),
+                    )
+                    self._send(chunk, now)
+                index += 1
+
+    def _send(self, chunk: _Chunk, now: float) -> None:
+        assert self._log is not None
+        sequence_numbers = self._log.sequence_numbers
+        start = sequence_numbers.first_missing(chunk.start, chunk.end)
+        end = sequence_numbers.last_missing(chunk.start, chunk.end)
+        if start is None or end is None:
+            return
+
+        chunk.sent_at = now
+        chunk.attempts += 1
+        self.requests_sent += 1
+        ensure_future(self._request_logs(start, end), name="request_logs[log_sync]")
@@ -1,116 +1,447 @@
 import asyncio
+import time
 from datetime import datetime, timedelta
-from typing import Optional
+from typing import Iterable, Iterator, Optional, Sequence, overload
 
+from combustion_ble.ble_data.probe_temperatures import (
+    RAW_TEMPERATURE_BITS,
+    RAW_TEMPERATURE_MASK,
+    TEMPERATURE_COUNT,
+)
+from combustion_ble.data_point_columns import (
+    DataPointColumns,
+    DataPointRow,
+    encode_data_point,
+)
+from combustion_ble.log_codec import decode_columns, encode_columns
+from combustion_ble.log_records import decode_log_records
+from combustion_ble.log_store import LogStoreWriter
 from combustion_ble.logged_probe_data_count import LoggedProbeDataPoint
+from combustion_ble.temperature_rollup import RollupBucket, TemperatureRollup
 from combustion_ble.uart import SessionInformation
+from combustion_ble.utilities.interval_set import IntervalSet
+from combustion_ble.utilities.lttb import lttb
+from combustion_ble.utilities.monitor import Monitorable, RemoveListener, UpdateListener
+
+
+class LogsUpdate:
+    """Data points added to a temperature log at once."""
+
+    __slots__ = ("session_id", "count", "min_sequence_number", "max_sequence_number")
+
+    def __init__(
+        self, session_id: int, count: int, min_sequence_number: int, max_sequence_number: int
+    ) -> None:
+        self.session_id = session_id
+        """Session of the updated log."""
+
+        self.count = count
+        """Number of data points added."""
+
+        self.min_sequence_number = min_sequence_number
+        """Lowest sequence number added."""
+
+        self.max_sequence_number = max_sequence_number
+        """Highest sequence number added."""
+
+
+class LogView(Sequence[LoggedProbeDataPoint]):
+    """Lazy view of the data points of a log with sequence numbers in ``[min_sequence_number,
+    max_sequence_number]``, in sequence number order.
+
+    Data points are read from the log when accessed, so data points backfilled into the range are
+    included. Locating the range in the log takes O(log n).
+    """
+
+    __slots__ = ("log", "min_sequence_number", "max_sequence_number")
+
+    def __init__(
+        self, log: "ProbeTemperatureLog", min_sequence_number: int, max_sequence_number: int
+    ) -> None:
+        self.log = log
+        self.min_sequence_number = min_sequence_number
+        self.max_sequence_number = max_sequence_number
+
+    def _index_range(self) -> tuple[int, int]:
+        return self.log.columns.index_range(self.min_sequence_number, self.max_sequence_number)
+
+    def __len__(self) -> int:
+        start, stop = self._index_range()
+        return stop - start
+
+    @overload
+    def __getitem__(self, index: int) -> LoggedProbeDataPoint: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> Sequence[LoggedProbeDataPoint]: ...
+
+    def __getitem__(self, index):
+        start, stop = self._index_range()
+        if isinstance(index, slice):
+            first, last, step = index.indices(stop - start)
+            if step != 1:
+                return [self.log.columns[start + i] for i in range(first, last, step)]
+            if first >= last:
+                return LogView(self.log, 0, -1)
+            sequence_numbers = self.log.columns.sequence_numbers
+            return LogView(
+                self.log, sequence_numbers[start + first], sequence_numbers[start + last - 1]
+            )
+
+        if index < 0:
+            index += stop - start
+        if not 0 <= index < stop - start:
+            raise IndexError("LogView index out of range")
+        return self.log.columns[start + index]
+
+    def __iter__(self) -> Iterator[LoggedProbeDataPoint]:
+        columns = self.log.columns
+        start, stop = columns.index_range(self.min_sequence_number, self.max_sequence_number)
+        for index in range(start, stop):
+            yield columns[index]
 
 
 class ProbeTemperatureLog:
     ACCUMULATOR_STABILIZATION_TIME = 0.2
     ACCUMULATOR_MAX = 500
 
-    def __init__(self, session_info: SessionInformation):
+    def __init__(
+        self,
+        session_info: SessionInformation,
+        serial_number: int = 0,
+        store: Optional[LogStoreWriter] = None,
+    ):
         self.session_information = session_info
-        self.data_points_dict: dict[int, LoggedProbeDataPoint] = {}
-        self.data_point_accumulator = set[LoggedProbeDataPoint]()
-        self.accumulator_timer: Optional[asyncio.Task] = None
+        self.serial_number = serial_number
+        self.store = store
+        """Store that data points added to the log are written to."""
+
+        self.restoring = False
+        """Whether data points are being read back from the store."""
+
+        self.updated_at = time.monotonic()
+        """Monotonic time at which data points were last added to the log."""
+
+        self._columns = DataPointColumns()
+        self._sealed: Optional[bytes] = None
+        self._decoded: Optional[DataPointColumns] = None
+        self.sequence_numbers = IntervalSet()
+        """Index of the sequence numbers stored in `columns`."""
+
+        self._rollups: dict[int, TemperatureRollup] = {}
+        self.data_point_accumulator: dict[int, DataPointRow] = {}
+        self.log_record_accumulator: dict[int, bytes] = {}
+        """Raw log records waiting to be merged, decoded as a single batch."""
+        self.accumulator_timer: Optional[asyncio.TimerHandle] = None
+        self._accumulator_deadline = 0.0
         self.start_time: Optional[datetime] = None
+        self._logs_updated: Monitorable[Optional[LogsUpdate]] = Monitorable(None)
+
+    def add_logs_updated_listener(
+        self, listener: UpdateListener[Optional[LogsUpdate]]
+    ) -> RemoveListener:
+        """Add a listener called once for each batch of data points added to the log."""
+        return self._logs_updated.add_update_listener(listener)
+
+    @property
+    def columns(self) -> DataPointColumns:
+        """Columns holding the data points of the log. Reading a sealed log decompresses a copy of
+        its data points, kept until the log is sealed again."""
+        if self._sealed is not None and self._decoded is None:
+            self._decoded = DataPointColumns.from_raw_columns(decode_columns(self._sealed))
+        return self._decoded if self._decoded is not None else self._columns
+
+    def _writable_columns(self) -> DataPointColumns:
+        """Columns to add data points to, unsealing a sealed log."""
+        if self._sealed is not None:
+            self._columns = self.columns
+            self._sealed = None
+            self._decoded = None
+        return self._columns
+
+    @property
+    def sealed(self) -> bool:
+        """Whether the data points of the log are held compressed."""
+        return self._sealed is not None
+
+    @property
+    def sealed_size(self) -> int:
+        """Number of bytes taken by the compressed data points of a sealed log."""
+        return len(self._sealed) if self._sealed is not None else 0
+
+    @property
+    def nbytes(self) -> int:
+        """Number of bytes taken by the data points of the log, compressed or not."""
+        if self._sealed is None:
+            return self._columns.nbytes
+        return len(self._sealed) + (self._decoded.nbytes if self._decoded is not None else 0)
+
+    def seal(self) -> None:
+        """Compress the data points of a log that is no longer updated, such as the log of a past
+        session. Data points read from a sealed log are decompressed to a copy, which sealing again
+        drops. Adding data points unseals the log."""
+        if self._sealed is not None:
+            self._decoded = None
+            return
+        if not len(self._columns):
+            return
+        self.insert_accumulated_data_points()
+        columns = self._columns
+        self._sealed = encode_columns(columns.raw_columns(0, len(columns)))
+        self._columns = DataPointColumns()
+
+    def __getitem__(self, index: int) -> LoggedProbeDataPoint:
+        """Return the data point at `index`, in sequence number order."""
+        return self.columns[index]
+
+    def timestamp_of(self, sequence_number: int) -> Optional[datetime]:
+        """Return the time at which the data point with `sequence_number` was logged, if the start
+        time of the log is known."""
+        if self.start_time is None:
+            return None
+        return self.start_time + timedelta(
+            milliseconds=sequence_number * self.session_information.sample_period
+        )
+
+    def sequence_range(
+        self, start: Optional[datetime] = None, end: Optional[datetime] = None
+    ) -> tuple[int, int]:
+        """Return the lowest and highest sequence numbers logged between `start` and `end`,
+        inclusive. Raises ValueError if the start time of the log is not known yet."""
+        if self.start_time is None:
+            raise ValueError("The start time of the log is not known yet.")
+        # Microseconds per sample; sample periods are in milliseconds.
+        period = max(self.session_information.sample_period, 1) * 1000
+        min_sequence_number = 0
+        max_sequence_number = 0xFFFFFFFF
+        if start is not None:
+            offset = (start - self.start_time) // timedelta(microseconds=1)
+            min_sequence_number = max(-(-offset // period), 0)
+        if end is not None:
+            offset = (end - self.start_time) // timedelta(microseconds=1)
+            max_sequence_number = offset // period
+        return min_sequence_number, max_sequence_number
+
+    def points_between(self, start: datetime, end: datetime) -> LogView:
+        """Return a view of the data points logged between `start` and `end`, inclusive."""
+        return LogView(self, *self.sequence_range(start, end))
+
+    def latest(self, count: int) -> LogView:
+        """Return a view of the `count` data points with the highest sequence numbers. The view
+        covers the sequence numbers from the lowest to the highest of those data points, so data
+        points backfilled into gaps of that range later are included, and it may then hold more
+        than `count` data points."""
+        sequence_numbers = self.columns.sequence_numbers
+        if count <= 0 or not sequence_numbers:
+            return LogView(self, 0, -1)
+        return LogView(
+            self, sequence_numbers[-min(count, len(sequence_numbers))], sequence_numbers[-1]
+        )
 
     @property
     def data_points(self) -> list[LoggedProbeDataPoint]:
         """Return a list of data points, sorted by sequence number (oldest -> newest)."""
-        return sorted(
-            list(self.data_points_dict.values()),
-            key=lambda x: x.sequence_num if x.sequence_num else -1,
-        )
+        return list(self.columns)
+
+    @property
+    def newest_sequence_number(self) -> Optional[int]:
+        """Highest sequence number in the log."""
+        return self.sequence_numbers.max
+
+    @property
+    def synced_count(self) -> int:
+        """Number of data points in the log."""
+        return len(self.sequence_numbers)
 
     def missing_range(self, sequence_range_start: int, sequence_range_end: int):
-        lower_bound = None
-        for search in range(sequence_range_start, sequence_range_end + 1):
-            if search not in self.data_points_dict:
-                lower_bound = search
-                break
-
-        if lower_bound is not None:
-            upper_bound = None
-            if lower_bound < sequence_range_end:
-                for search in reversed(range(lower_bound + 1, sequence_range_end + 1)):
-                    if search not in self.data_points_dict:
-                        upper_bound = search
-                        break
-
-            if upper_bound is not None:
-                return lower_bound, upper_bound
-            else:
-                return lower_bound, sequence_range_end
-
-        return None
+        """Return the lowest and highest sequence numbers within the range that are missing from
+        the log, or None if the log holds the whole range."""
+        lower_bound = self.sequence_numbers.first_missing(sequence_range_start, sequence_range_end)
+        if lower_bound is None:
+            return None
+        upper_bound = self.sequence_numbers.last_missing(lower_bound, sequence_range_end)
+        assert upper_bound is not None
+        return lower_bound, upper_bound
 
     def logs_in_range(self, sequence_numbers) -> int:
-        records = 0
-        if not self.data_points_dict:
-            return records
+        return self.sequence_numbers.count_in_range(sequence_numbers[0], sequence_numbers[1])
 
-        points = list(sorted(self.data_points_dict.keys()))
-        min = None
-        max = None
-        for i in range(len(points)):
-            if min is None and points[i] >= sequence_numbers[0]:
-                min = i
-                break
+    def rollup(
+        self,
+        bucket_seconds: int = 60,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+    ) -> list[RollupBucket]:
+        """Return the minimum, mean and maximum temperature of each sensor per bucket of
+        `bucket_seconds`, for the buckets between `start` and `end`. Raises ValueError if a range is
+        given and the start time of the log is not known yet.
 
-        if min is not None:
-            for i in reversed(range(len(points))):
-                if max is None and points[i] <= sequence_numbers[1]:
-                    max = i
-                    break
+        The rollup for a bucket size is built from the log the first time it is queried, and is then
+        updated as data points are added, so queries take O(number of buckets).
+        """
+        if self.start_time is None and (start is not None or end is not None):
+            raise ValueError("The start time of the log is not known yet.")
+        rollup = self._rollups.get(bucket_seconds)
+        if rollup is None:
+            rollup = TemperatureRollup(bucket_seconds, self.session_information.sample_period)
+            rollup.add(self.columns.rows())
+            self._rollups[bucket_seconds] = rollup
 
-        if min is not None and max is not None:
-            records = max - min + 1
+        first = 0
+        last = None
+        if self.start_time is not None:
+            if start is not None:
+                first = int((start - self.start_time).total_seconds() // bucket_seconds)
+            if end is not None:
+                last = int((end - self.start_time).total_seconds() // bucket_seconds)
+        return rollup.buckets(self.start_time, first, last)
 
-        return records
+    def downsample(self, threshold: int, sensor: int = 0) -> list[LoggedProbeDataPoint]:
+        """Return at most `threshold` data points that preserve the shape of the temperature curve
+        of `sensor` (0-based), selected with the largest-triangle-three-buckets algorithm."""
+        if not 0 <= sensor < TEMPERATURE_COUNT:
+            raise ValueError(f"Invalid sensor [{sensor}]")
+        shift = sensor * RAW_TEMPERATURE_BITS
+        values = [
+            int.from_bytes(temperatures, "little") >> shift & RAW_TEMPERATURE_MASK
+            for temperatures in self.columns.packed_temperatures()
+        ]
+        selected = lttb(self.columns.sequence_numbers, values, threshold)
+        return [self.columns[index] for index in selected]
 
     def insert_accumulated_data_points(self):
-        added = False
-        for dp in self.data_point_accumulator:
-            if dp.sequence_num not in self.data_points_dict:
-                assert dp.sequence_num is not None
-                self.data_points_dict[dp.sequence_num] = dp
-                added = True
+        if self.accumulator_timer:
+            self.accumulator_timer.cancel()
+            self.accumulator_timer = None
 
-        if added:
-            self.data_points_dict = dict(sorted(self.data_points_dict.items()))
+        accumulator = self.data_point_accumulator
+        self.data_point_accumulator = {}
+        if self.log_record_accumulator:
+            records = self.log_record_accumulator
+            self.log_record_accumulator = {}
+            for row in decode_log_records(records.values()):
+                accumulator[row[0]] = row
+        self._merge(accumulator)
 
-        self.data_point_accumulator.clear()
+    def restore(self, rows: Iterable[DataPointRow]):
+        """Add data points read back from the store, without writing them to it again."""
+        self._merge({row[0]: row for row in rows}, write=False)
 
-    def insert_data_point(self, new_data_point: LoggedProbeDataPoint):
-        if new_data_point in self.data_point_accumulator:
+    def _merge(self, rows: dict[int, DataPointRow], write: bool = True):
+        if not rows:
+            return
+        self._writable_columns().merge(rows.values())
+        added = [
+            sequence_number
+            for sequence_number in sorted(rows)
+            if self.sequence_numbers.add(sequence_number)
+        ]
+        if not added:
             return
 
-        self.data_point_accumulator.add(new_data_point)
+        self.updated_at = time.monotonic()
+        added_rows = [rows[sequence_number] for sequence_number in added]
+        for rollup in self._rollups.values():
+            rollup.add(added_rows)
+        if write and self.store:
+            self.store.write(
+                self.serial_number, self.id, self.session_information.sample_period, added_rows
+            )
+        self._logs_updated.update(LogsUpdate(self.id, len(added), added[0], added[-1]))
 
-        if self.accumulator_timer:
-            self.accumulator_timer.cancel()
+    def insert_data_points(self, data_points: Iterable[LoggedProbeDataPoint]):
+        """Add a batch of data points in any order, typically backfilled log records.
 
-        if len(self.data_point_accumulator) > self.ACCUMULATOR_MAX:
+        Data points are accumulated until none has been added for `ACCUMULATOR_STABILIZATION_TIME`
+        seconds, or more than `ACCUMULATOR_MAX` are waiting, and are then merged into the log in a
+        single pass.
+        """
+        accumulator = self.data_point_accumulator
+        records = self.log_record_accumulator
+        sequence_numbers = self.sequence_numbers
+        for data_point in data_points:
+            sequence_number = data_point.sequence_num
+            assert sequence_number is not None
+            if (
+                sequence_number not in accumulator
+                and sequence_number not in records
+                and sequence_number not in sequence_numbers
+            ):
+                accumulator[sequence_number] = encode_data_point(data_point)
+        self._accumulated()
+
+    def insert_log_records(self, records: Iterable[tuple[int, bytes]]):
+        """Add a batch of raw log records in any order, as `(sequence number, record)` pairs.
+
+        Records are accumulated like `insert_data_points`, and all the accumulated records are
+        decoded at once when they are merged, see `log_records.decode_log_records`.
+        """
+        accumulator = self.data_point_accumulator
+        accumulated_records = self.log_record_accumulator
+        sequence_numbers = self.sequence_numbers
+        for sequence_number, record in records:
+            if (
+                sequence_number not in accumulated_records
+                and sequence_number not in accumulator
+                and sequence_number not in sequence_numbers
+            ):
+                accumulated_records[sequence_number] = record
+        self._accumulated()
+
+    def _accumulated(self):
+        count = len(self.data_point_accumulator) + len(self.log_record_accumulator)
+        if count > self.ACCUMULATOR_MAX:
             self.insert_accumulated_data_points()
-        else:
-            self.accumulator_timer = asyncio.create_task(self.accumulator_timer_task())
+        elif count:
+            self._start_accumulator_timer()
 
-    async def accumulator_timer_task(self):
-        await asyncio.sleep(self.ACCUMULATOR_STABILIZATION_TIME)
-        await self.insert_accumulated_data_points()
+    def insert_data_point(self, new_data_point: LoggedProbeDataPoint):
+        self.insert_data_points((new_data_point,))
+
+    def _start_accumulator_timer(self):
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            # Without an event loop to wait on, merge right away.
+            self.insert_accumulated_data_points()
+            return
+
+        # A single timer is kept per log. New data points only push its deadline back, and the timer
+        # reschedules itself when it fires before the deadline.
+        self._accumulator_deadline = loop.time() + self.ACCUMULATOR_STABILIZATION_TIME
+        if self.accumulator_timer is None:
+            self.accumulator_timer = loop.call_at(
+                self._accumulator_deadline, self._accumulator_timer_fired, loop
+            )
+
+    def _accumulator_timer_fired(self, loop: asyncio.AbstractEventLoop):
+        self.accumulator_timer = None
+        if loop.time() < self._accumulator_deadline:
+            self.accumulator_timer = loop.call_at(
+                self._accumulator_deadline, self._accumulator_timer_fired, loop
+            )
+        else:
+            self.insert_accumulated_data_points()
 
     def append_data_point(self, data_point: LoggedProbeDataPoint):
-        if (
-            not self.data_points_dict
-            or data_point.sequence_num == max(self.data_points_dict.keys()) + 1
-        ):
+        newest_sequence_number = self.sequence_numbers.max
+        if newest_sequence_number is None or data_point.sequence_num == newest_sequence_number + 1:
             assert data_point.sequence_num is not None
-            self.data_points_dict[data_point.sequence_num] = data_point
+            row = encode_data_point(data_point)
+            self._writable_columns().append(row)
+            self.sequence_numbers.add(data_point.sequence_num)
+            self.updated_at = time.monotonic()
+            for rollup in self._rollups.values():
+                rollup.add((row,))
+            if self.store:
+                self.store.write(
+                    self.serial_number, self.id, self.session_information.sample_period, [row]
+                )
             if not self.start_time:
                 self.set_start_time(data_point)
+            self._logs_updated.update(
+                LogsUpdate(self.id, 1, data_point.sequence_num, data_point.sequence_num)
+            )
         else:
             self.insert_data_point(data_point)
 
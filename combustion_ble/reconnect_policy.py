@@ -0,0 +1,51 @@
+"""Backoff between automatic reconnection attempts."""
+
+import random
+from typing import Callable
+
+
+class ReconnectPolicy:
+    """Delays automatic reconnection attempts to a device that a connection is maintained to.
+
+    The delay before an attempt grows exponentially with the number of consecutive attempts that
+    did not connect, from ``initial_delay`` up to ``max_delay`` seconds. A random fraction of up to
+    ``jitter`` of the delay is removed, so devices that dropped together do not retry together. The
+    count of consecutive attempts is reset once the device connects.
+    """
+
+    DEFAULT_INITIAL_DELAY = 1.0
+    DEFAULT_MAX_DELAY = 60.0
+    DEFAULT_MULTIPLIER = 2.0
+    DEFAULT_JITTER = 0.5
+
+    def __init__(
+        self,
+        initial_delay: float = DEFAULT_INITIAL_DELAY,
+        max_delay: float = DEFAULT_MAX_DELAY,
+        multiplier: float = DEFAULT_MULTIPLIER,
+        jitter: float = DEFAULT_JITTER,
+    ) -> None:
+        if initial_delay < 0 or max_delay < initial_delay:
+            raise ValueError("Delays must satisfy 0 <= initial_delay <= max_delay.")
+        if multiplier < 1:
+            raise ValueError("multiplier must be at least 1.")
+        if not 0 <= jitter <= 1:
+            raise ValueError("jitter must be between 0 and 1.")
+        self.initial_delay = initial_delay
+        """Number of seconds before the first attempt after a disconnection."""
+
+        self.max_delay = max_delay
+        """Maximum number of seconds between two attempts."""
+
+        self.multiplier = multiplier
+        """Factor by which the delay grows after each attempt that does not connect."""
+
+        self.jitter = jitter
+        """Largest fraction of the delay removed at random."""
+
+    def delay(self, attempt: int, random: Callable[[], float] = random.random) -> float:
+        """Return the number of seconds to wait before an attempt, given the number of consecutive
+        attempts already made."""
+        # The exponent is capped so long outages do not overflow the float.
+        delay = min(self.initial_delay * self.multiplier ** min(attempt, 64), self.max_delay)
+        return delay * (1 - self.jitter * random())
@@ -0,0 +1,140 @@
+"""Limits on the temperature logs and devices kept in memory."""
+
+import time
+from datetime import datetime
+from typing import Iterable, Optional
+
+from combustion_ble.devices.device import Device
+from combustion_ble.devices.probe import Probe
+from combustion_ble.probe_temperature_log import ProbeTemperatureLog
+
+
+class RetentionPolicy:
+    """Selects the temperature logs and devices to drop from memory.
+
+    The log of a probe's current session is always kept. Logs of past sessions are evicted once
+    they have not been updated for ``max_session_age`` seconds, beyond the ``max_sessions_per_probe``
+    most recently updated logs of a probe, and, oldest first, while all the logs together take more
+    than ``max_log_bytes``. Devices that have not been heard from for ``max_device_age`` seconds
+    are removed, and so are the least recently heard devices beyond ``max_devices``; connected
+    devices and devices that a connection is being maintained to are never removed.
+
+    Limits set to None are not enforced. Selections take time linear in the number of devices and
+    logs, and only sort when a count or byte limit is exceeded, so they can run on every tick.
+    """
+
+    def __init__(
+        self,
+        max_session_age: Optional[float] = None,
+        max_sessions_per_probe: Optional[int] = None,
+        max_log_bytes: Optional[int] = None,
+        max_device_age: Optional[float] = None,
+        max_devices: Optional[int] = None,
+    ) -> None:
+        self.max_session_age = max_session_age
+        """Number of seconds after which a log that is not updated is evicted."""
+
+        self.max_sessions_per_probe = max_sessions_per_probe
+        """Maximum number of logs kept per probe, including the current one."""
+
+        self.max_log_bytes = max_log_bytes
+        """Maximum number of bytes of data points held by all logs."""
+
+        self.max_device_age = max_device_age
+        """Number of seconds after which a device that is not heard from is removed."""
+
+        self.max_devices = max_devices
+        """Maximum number of devices kept."""
+
+        self.evicted_sessions = 0
+        """Number of logs evicted."""
+
+        self.removed_devices = 0
+        """Number of devices removed."""
+
+    def sessions_to_evict(
+        self, probes: Iterable[Probe], now: Optional[float] = None
+    ) -> list[tuple[Probe, ProbeTemperatureLog]]:
+        """Return the logs to evict, with their probe. `now` is a `time.monotonic()` time."""
+        if now is None:
+            now = time.monotonic()
+        evicted: list[tuple[Probe, ProbeTemperatureLog]] = []
+        # Logs of past sessions that are kept, for the byte limit.
+        kept: list[tuple[Probe, ProbeTemperatureLog]] = []
+        total_bytes = 0
+
+        for probe in probes:
+            logs = probe._temperature_logs
+            if not logs:
+                continue
+            current = probe._get_current_temperature_log()
+            past = [log for log in logs.values() if log is not current]
+            if current is not None:
+                total_bytes += current.nbytes
+
+            if self.max_session_age is not None:
+                for log in past:
+                    if now - log.updated_at > self.max_session_age:
+                        evicted.append((probe, log))
+                past = [log for log in past if now - log.updated_at <= self.max_session_age]
+
+            if self.max_sessions_per_probe is not None:
+                keep = max(self.max_sessions_per_probe - (current is not None), 0)
+                if len(past) > keep:
+                    past.sort(key=lambda log: log.updated_at, reverse=True)
+                    evicted.extend((probe, log) for log in past[keep:])
+                    del past[keep:]
+
+            for log in past:
+                total_bytes += log.nbytes
+                kept.append((probe, log))
+
+        if self.max_log_bytes is not None and total_bytes > self.max_log_bytes:
+            kept.sort(key=lambda item: item[1].updated_at)
+            for probe, log in kept:
+                if total_bytes <= self.max_log_bytes:
+                    break
+                total_bytes -= log.nbytes
+                evicted.append((probe, log))
+
+        self.evicted_sessions += len(evicted)
+        return evicted
+
+    def devices_to_remove(
+        self, devices: Iterable[Device], now: Optional[datetime] = None
+    ) -> list[Device]:
+        """Return the devices to remove."""
+        if self.max_device_age is None and self.max_devices is None:
+            return []
+        if now is None:
+            now = datetime.now()
+
+        devices = list(devices)
+        removable = [
+            device
+            for device in devices
+            if not device.maintaining_connection
+            and device.connection_state
+            not in (Device.ConnectionState.CONNECTED, Device.ConnectionState.CONNECTING)
+        ]
+        removed = []
+        if self.max_device_age is not None:
+            removed = [
+                device
+                for device in removable
+                if (now - device.last_update_time).total_seconds() > self.max_device_age
+            ]
+
+        excess = (
+            len(devices) - len(removed) - self.max_devices if self.max_devices is not None else 0
+        )
+        if excess > 0:
+            removed_set = set(removed)
+            candidates = sorted(
+                (device for device in removable if device not in removed_set),
+                key=lambda device: device.last_update_time,
+            )
+            removed.extend(candidates[:excess])
+
+        self.removed_devices += len(removed)
+        return removed
@@ -0,0 +1,143 @@
+"""Time-bucketed min/mean/max rollups of logged temperatures."""
+
+from datetime import datetime, timedelta
+from typing import Iterable, Optional
+
+from combustion_ble.ble_data.probe_temperatures import (
+    RAW_TEMPERATURE_BITS,
+    RAW_TEMPERATURE_MASK,
+    TEMPERATURE_COUNT,
+    raw_to_celsius,
+)
+from combustion_ble.data_point_columns import DataPointRow
+
+_TEMPERATURE_SHIFTS = tuple(
+    range(0, TEMPERATURE_COUNT * RAW_TEMPERATURE_BITS, RAW_TEMPERATURE_BITS)
+)
+
+
+class RollupBucket:
+    """Aggregated temperatures of the data points logged during one bucket of time."""
+
+    __slots__ = ("index", "start_time", "count", "minimum", "mean", "maximum")
+
+    def __init__(
+        self,
+        index: int,
+        start_time: Optional[datetime],
+        count: int,
+        minimum: list[float],
+        mean: list[float],
+        maximum: list[float],
+    ) -> None:
+        self.index = index
+        """Position of the bucket since the start of the session."""
+
+        self.start_time = start_time
+        """Start of the bucket, if the start time of the log is known."""
+
+        self.count = count
+        """Number of data points in the bucket."""
+
+        self.minimum = minimum
+        """Lowest temperature of each sensor, in Celsius."""
+
+        self.mean = mean
+        """Mean temperature of each sensor, in Celsius."""
+
+        self.maximum = maximum
+        """Highest temperature of each sensor, in Celsius."""
+
+
+class TemperatureRollup:
+    """Minimum, sum and maximum of each temperature sensor, per bucket of `bucket_seconds`.
+
+    Buckets are aligned on the start of the session and indexed by position, so a data point lands
+    in its bucket in O(1) whatever order it arrives in, and backfilled data points update old
+    buckets in place. Values are kept as raw integers, and only converted to Celsius when queried.
+    """
+
+    __slots__ = ("bucket_seconds", "_bucket_points", "_counts", "_sums", "_minimums", "_maximums")
+
+    def __init__(self, bucket_seconds: int, sample_period: int) -> None:
+        if bucket_seconds <= 0:
+            raise ValueError("Bucket size must be positive.")
+        self.bucket_seconds = bucket_seconds
+        # Sample periods are in milliseconds; buckets hold this many sequence numbers.
+        self._bucket_points = bucket_seconds * 1000 / max(sample_period, 1)
+
+        self._counts: list[int] = []
+        # Per bucket and sensor, flattened: bucket * TEMPERATURE_COUNT + sensor.
+        self._sums: list[int] = []
+        self._minimums: list[int] = []
+        self._maximums: list[int] = []
+
+    def __len__(self) -> int:
+        """Number of buckets, including empty buckets before the last one."""
+        return len(self._counts)
+
+    def _grow(self, bucket_count: int) -> None:
+        added = bucket_count - len(self._counts)
+        self._counts.extend([0] * added)
+        self._sums.extend([0] * (added * TEMPERATURE_COUNT))
+        self._minimums.extend([RAW_TEMPERATURE_MASK + 1] * (added * TEMPERATURE_COUNT))
+        self._maximums.extend([-1] * (added * TEMPERATURE_COUNT))
+
+    def add(self, rows: Iterable[DataPointRow]) -> None:
+        """Add rows of data points that are not in the rollup yet."""
+        counts = self._counts
+        sums = self._sums
+        minimums = self._minimums
+        maximums = self._maximums
+        bucket_points = self._bucket_points
+        from_bytes = int.from_bytes
+
+        for row in rows:
+            bucket = int(row[0] / bucket_points)
+            if bucket >= len(counts):
+                self._grow(bucket + 1)
+            counts[bucket] += 1
+
+            packed = from_bytes(row[1], "little")
+            index = bucket * TEMPERATURE_COUNT
+            for shift in _TEMPERATURE_SHIFTS:
+                value = packed >> shift & RAW_TEMPERATURE_MASK
+                sums[index] += value
+                if value < minimums[index]:
+                    minimums[index] = value
+                if value > maximums[index]:
+                    maximums[index] = value
+                index += 1
+
+    def buckets(
+        self,
+        session_start: Optional[datetime] = None,
+        first: int = 0,
+        last: Optional[int] = None,
+    ) -> list[RollupBucket]:
+        """Return the non-empty buckets from index `first` to `last` inclusive, in order. Start
+        times are computed from `session_start` when it is given."""
+        counts = self._counts
+        stop = len(counts) if last is None else min(last + 1, len(counts))
+        result = []
+        for bucket in range(max(first, 0), stop):
+            count = counts[bucket]
+            if not count:
+                continue
+            start = bucket * TEMPERATURE_COUNT
+            end = start + TEMPERATURE_COUNT
+            result.append(
+                RollupBucket(
+                    bucket,
+                    (
+                        session_start + timedelta(seconds=bucket * self.bucket_seconds)
+                        if session_start
+                        else None
+                    ),
+                    count,
+                    [raw_to_celsius(value) for value in self._minimums[start:end]],
+                    [raw_to_celsius(total / count) for total in self._sums[start:end]],
+                    [raw_to_celsius(value) for value in self._maximums[start:end]],
+                )
+            )
+        return result
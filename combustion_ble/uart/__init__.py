@@ -9,11 +9,12 @@ from .read_over_temperature import (
 )
 from .request import Request
 from .response import Response
-from .response_from_data import responses_from_data
+from .response_from_data import ResponseFramer, responses_from_data
 from .session_info import SessionInfoRequest, SessionInfoResponse, SessionInformation
 from .set_color import SetColorRequest, SetColorResponse
 from .set_id import SetIDRequest, SetIDResponse
 from .set_prediction import SetPredictionRequest, SetPredictionResponse
+from .uart_framer import UARTFramer
 
 __all__ = [
     "LogRequest",
@@ -24,6 +25,7 @@ __all__ = [
     "Request",
     "responses_from_data",
     "Response",
+    "ResponseFramer",
     "SessionInformation",
     "SessionInfoRequest",
     "SessionInfoResponse",
@@ -33,4 +35,5 @@ __all__ = [
     "SetIDResponse",
     "SetPredictionRequest",
     "SetPredictionResponse",
+    "UARTFramer",
 ]
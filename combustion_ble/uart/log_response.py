@@ -1,3 +1,5 @@
+from functools import cached_property
+
 from combustion_ble.ble_data.prediction_log import PredictionLog
 from combustion_ble.ble_data.probe_temperatures import ProbeTemperatures
 from combustion_ble.uart.response import Response
@@ -8,18 +10,24 @@ class LogResponse(Response):
     SEQUENCE_RANGE = slice(Response.HEADER_LENGTH, Response.HEADER_LENGTH + 4)
     TEMPERATURE_RANGE = slice(Response.HEADER_LENGTH + 4, Response.HEADER_LENGTH + 17)
     PREDICTION_LOG_RANGE = slice(Response.HEADER_LENGTH + 17, Response.HEADER_LENGTH + 24)
+    LOG_RECORD_RANGE = slice(Response.HEADER_LENGTH, Response.HEADER_LENGTH + 24)
 
     def __init__(self, data, success, payload_length):
         self.sequence_number = int.from_bytes(data[LogResponse.SEQUENCE_RANGE], byteorder="little")
 
-        temp_data = data[LogResponse.TEMPERATURE_RANGE]
-        self.temperatures = ProbeTemperatures.from_raw_data(temp_data)
-
-        prediction_log_data = data[LogResponse.PREDICTION_LOG_RANGE]
-        self.prediction_log = PredictionLog.from_raw(prediction_log_data)
+        self.log_record = bytes(data[LogResponse.LOG_RECORD_RANGE])
+        """Raw sequence number, temperatures and prediction log, see `log_records`."""
 
         super().__init__(success, payload_length)
 
+    @cached_property
+    def temperatures(self) -> ProbeTemperatures:
+        return ProbeTemperatures.from_raw_data(self.log_record[4:17])
+
+    @cached_property
+    def prediction_log(self) -> PredictionLog:
+        return PredictionLog.from_raw(self.log_record[17:24])
+
     @classmethod
     def from_raw(cls, data, success, payload_length):
         if payload_length < cls.MINIMUM_PAYLOAD_LENGTH:
@@ -22,7 +22,7 @@ from .node_set_prediction_request import (
     NodeSetPredictionResponse,
 )
 from .node_sync_thermometer_list_request import NodeSyncThermometerListRequest
-from .node_uart_message import NodeUARTMessage
+from .node_uart_message import NodeUARTFramer, NodeUARTMessage
 
 __all__ = [
     "NodeHeartbeatRequest",
@@ -45,5 +45,6 @@ __all__ = [
     "NodeSetPredictionRequest",
     "NodeSetPredictionResponse",
     "NodeSyncThermometerListRequest",
+    "NodeUARTFramer",
     "NodeUARTMessage",
 ]
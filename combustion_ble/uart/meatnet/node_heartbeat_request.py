@@ -37,7 +37,7 @@ class NodeHeartbeatRequest(NodeRequest):
                 serial_number = f"{serial_raw:08X}"
             elif product_type == CombustionProductType.MEAT_NET_NODE:
                 try:
-                    serial_number = data[cls.NODE_SERIAL_RANGE].decode("utf-8")
+                    serial_number = bytes(data[cls.NODE_SERIAL_RANGE]).decode("utf-8")
                 except Exception:
                     serial_number = ""
 
@@ -56,7 +56,9 @@ class NodeHeartbeatRequest(NodeRequest):
         self.payload_length = payload_length
 
         # Extract serial number
-        self.serial_number = data[self.HEADER_LENGTH : self.HEADER_LENGTH + 10].decode("utf-8")
+        self.serial_number = bytes(data[self.HEADER_LENGTH : self.HEADER_LENGTH + 10]).decode(
+            "utf-8"
+        )
 
         # Extract MAC address
         mac_raw = data[self.HEADER_LENGTH + 10 : self.HEADER_LENGTH + 16]
@@ -15,7 +15,7 @@ class NodeReadFirmwareRevisionResponse(NodeResponse):
 
         # Extracting the firmware revision
         fw_revision_raw = data[self.FW_REVISION_RANGE]
-        self.fw_revision = fw_revision_raw.decode("utf-8").rstrip("\x00")
+        self.fw_revision = bytes(fw_revision_raw).decode("utf-8").rstrip("\x00")
 
         super().__init__(success, request_id, response_id, payload_length)
 
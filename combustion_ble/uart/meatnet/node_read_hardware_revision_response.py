@@ -15,7 +15,7 @@ class NodeReadHardwareRevisionResponse(NodeResponse):
 
         # Extracting the hardware revision
         hw_revision_raw = data[self.HW_REVISION_RANGE]
-        self.hw_revision = hw_revision_raw.decode("utf-8").rstrip("\x00")
+        self.hw_revision = bytes(hw_revision_raw).decode("utf-8").rstrip("\x00")
 
         super().__init__(success, request_id, response_id, payload_length)
 
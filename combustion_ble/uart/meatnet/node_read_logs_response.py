@@ -1,3 +1,5 @@
+from functools import cached_property
+
 from combustion_ble.ble_data.prediction_log import PredictionLog
 from combustion_ble.ble_data.probe_temperatures import ProbeTemperatures
 from combustion_ble.uart.meatnet.node_response import NodeResponse
@@ -10,6 +12,7 @@ class NodeReadLogsResponse(NodeResponse):
     SEQUENCE_RANGE = slice(HEADER_LENGTH + 4, HEADER_LENGTH + 8)
     TEMPERATURE_RANGE = slice(HEADER_LENGTH + 8, HEADER_LENGTH + 21)
     PREDICTION_LOG_RANGE = slice(HEADER_LENGTH + 21, HEADER_LENGTH + 28)
+    LOG_RECORD_RANGE = slice(HEADER_LENGTH + 4, HEADER_LENGTH + 28)
 
     def __init__(self, data, success, request_id, response_id, payload_length):
         serial_raw = data[self.SERIAL_RANGE]
@@ -18,14 +21,19 @@ class NodeReadLogsResponse(NodeResponse):
         sequence_raw = data[self.SEQUENCE_RANGE]
         self.sequence_number = int.from_bytes(sequence_raw, byteorder="little")
 
-        temp_data = data[self.TEMPERATURE_RANGE]
-        self.temperatures = ProbeTemperatures.from_raw_data(temp_data)
-
-        prediction_log_data = data[self.PREDICTION_LOG_RANGE]
-        self.prediction_log = PredictionLog.from_raw(prediction_log_data)
+        self.log_record = bytes(data[self.LOG_RECORD_RANGE])
+        """Raw sequence number, temperatures and prediction log, see `log_records`."""
 
         super().__init__(success, request_id, response_id, payload_length)
 
+    @cached_property
+    def temperatures(self) -> ProbeTemperatures:
+        return ProbeTemperatures.from_raw_data(self.log_record[4:17])
+
+    @cached_property
+    def prediction_log(self) -> PredictionLog:
+        return PredictionLog.from_raw(self.log_record[17:24])
+
     @classmethod
     def from_raw(cls, data, success, request_id, response_id, payload_length):
         if payload_length < cls.MINIMUM_PAYLOAD_LENGTH:
@@ -15,7 +15,7 @@ class NodeReadModelInfoResponse(NodeResponse):
 
         # Extracting the model info
         model_info_raw = data[self.MODEL_INFO_RANGE]
-        self.model_info = model_info_raw.decode("utf-8").rstrip("\x00")
+        self.model_info = bytes(model_info_raw).decode("utf-8").rstrip("\x00")
 
         super().__init__(success, request_id, response_id, payload_length)
 
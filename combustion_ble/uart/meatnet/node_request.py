@@ -2,7 +2,7 @@ import random
 from typing import Optional
 
 from combustion_ble.uart.meatnet.node_message_type import NodeMessageType
-from combustion_ble.utilities.crc16ccitt import crc16ccitt
+from combustion_ble.utilities.crc16ccitt import CRC16CCITT
 
 
 class NodeRequest:
@@ -24,20 +24,16 @@ class NodeRequest:
             self.payload_length = len(outgoing_payload)
             self.request_id = random.randint(1, 0xFFFFFFFF)
 
-            # Sync Bytes { 0xCA, 0xFE }
-            self.data += bytearray([0xCA, 0xFE])
-
-            # Prepare data for CRC calculation
-            crc_data = bytearray()
-            crc_data.append(message_type.value)
-            crc_data.extend(self.request_id.to_bytes(length=4, byteorder="little"))
-            crc_data.append(self.payload_length)
-            crc_data.extend(outgoing_payload)
-
-            # Calculate CRC
-            crc_value = crc16ccitt(crc_data)
-
-            self.data.extend(crc_value.to_bytes(length=2, byteorder="little"))
-
-            # Messaeg type, payload length, payload
-            self.data.extend(crc_data)
+            # Message type, request ID and payload length, followed by the payload, are
+            # covered by the CRC
+            header = bytearray()
+            header.append(message_type.value)
+            header += self.request_id.to_bytes(length=4, byteorder="little")
+            header.append(self.payload_length)
+            crc = CRC16CCITT(header).update(outgoing_payload)
+
+            # Sync Bytes { 0xCA, 0xFE }, CRC, header, payload
+            self.data += b"\xCA\xFE"
+            self.data += crc.to_bytes()
+            self.data += header
+            self.data += outgoing_payload
@@ -16,35 +16,52 @@ def node_request_from_data(data: bytes) -> NodeRequest | None:
         LOGGER.debug("Missing sync bytes in request")
         return None
 
-    message_type_raw = data[4]
-    message_type = None
-    if message_type_raw in NodeMessageType._value2member_map_:
-        message_type = NodeMessageType(message_type_raw)
-
-    if message_type is None:
-        LOGGER.debug("Unknown message type in request: [%s]", message_type_raw)
+    if len(data) < NodeRequest.HEADER_LENGTH:
+        LOGGER.debug("Request shorter than header")
         return None
 
-    # Request ID
-    request_id = struct.unpack(">I", data[5:9])[0]
-
     # Payload Length
     payload_length = data[9]
 
+    request_length = NodeRequest.HEADER_LENGTH + payload_length
+    if len(data) < request_length:
+        LOGGER.debug("Bad number of bytes")
+        return None
+
     # CRC Check
     crc = int.from_bytes(data[2:4], byteorder="little")
-    calculated_crc = crc16ccitt(data[4 : 10 + payload_length])
+    calculated_crc = crc16ccitt(memoryview(data)[4:request_length])
 
     if crc != calculated_crc:
         LOGGER.debug("Invalid CRC. Expected [%s] but found [%s]", calculated_crc, crc)
         return None
 
+    return node_request_from_frame(data)
+
+
+def node_request_from_frame(frame: bytes | memoryview) -> NodeRequest | None:
+    """Decode a single request whose sync bytes, length and CRC have already been validated."""
+    message_type_raw = frame[4]
+    message_type = None
+    if message_type_raw in NodeMessageType._value2member_map_:
+        message_type = NodeMessageType(message_type_raw)
+
+    if message_type is None:
+        LOGGER.debug("Unknown message type in request: [%s]", message_type_raw)
+        return None
+
+    # Request ID
+    request_id = struct.unpack(">I", frame[5:9])[0]
+
+    # Payload Length
+    payload_length = frame[9]
+
     if message_type == NodeMessageType.PROBE_STATUS:
-        return NodeProbeStatusRequest.from_raw(data, request_id, payload_length)
+        return NodeProbeStatusRequest.from_raw(frame, request_id, payload_length)
     elif message_type == NodeMessageType.HEARTBEAT:
-        return NodeHeartbeatRequest.from_raw(data, request_id, payload_length)
+        return NodeHeartbeatRequest.from_raw(frame, request_id, payload_length)
     elif message_type == NodeMessageType.SYNC_THERMOMETER_LIST:
-        return NodeSyncThermometerListRequest.from_raw(data, request_id, payload_length)
+        return NodeSyncThermometerListRequest.from_raw(frame, request_id, payload_length)
     elif (
         message_type == NodeMessageType.SESSION_INFO
         or message_type == NodeMessageType.CONNECTED
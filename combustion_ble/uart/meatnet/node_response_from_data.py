@@ -24,74 +24,89 @@ from combustion_ble.utilities.crc16ccitt import crc16ccitt
 
 def node_response_from_data(data: bytes):
     # Sync bytes
-    sync_bytes = data[0:2]
-    sync_string = "".join(format(x, "02x") for x in sync_bytes)
-    if sync_string != "cafe":
+    if data[:2] != b"\xCA\xFE":
         LOGGER.debug("NodeResponse::from_data(): Missing sync bytes in response")
         return None
 
+    if len(data) < NodeResponse.HEADER_LENGTH:
+        LOGGER.debug("NodeResponse::from_data(): Response shorter than header")
+        return None
+
+    # Verify that this is a Response by checking the response type flag
+    if data[4] & NodeResponse.RESPONSE_TYPE_FLAG != NodeResponse.RESPONSE_TYPE_FLAG:
+        # If that 'response type' bit isn't set, this is probably a Request.
+        return None
+
+    # Payload Length
+    payload_length = data[14]
+
+    response_length = payload_length + NodeResponse.HEADER_LENGTH
+    if len(data) < response_length:
+        LOGGER.debug("Bad number of bytes")
+        return None
+
+    # CRC covers everything from the message type through the end of the payload
+    crc = int.from_bytes(data[2:4], byteorder="little")
+    calculated_crc = crc16ccitt(memoryview(data)[4:response_length])
+
+    if crc != calculated_crc:
+        LOGGER.debug("NodeResponse::from_data(): Invalid CRC")
+        return None
+
+    return node_response_from_frame(data)
+
+
+def node_response_from_frame(frame: bytes | memoryview):
+    """Decode a single response whose sync bytes, length and CRC have already been validated."""
     # Message type
-    type_byte = data[4]
+    type_byte = frame[4]
 
     # Verify that this is a Response by checking the response type flag
     if type_byte & NodeResponse.RESPONSE_TYPE_FLAG != NodeResponse.RESPONSE_TYPE_FLAG:
         # If that 'response type' bit isn't set, this is probably a Request.
         return None
 
-    message_type = NodeMessageType(type_byte & ~NodeResponse.RESPONSE_TYPE_FLAG)
-    if message_type is None:
+    raw_message_type = type_byte & ~NodeResponse.RESPONSE_TYPE_FLAG
+    if raw_message_type not in NodeMessageType._value2member_map_:
         LOGGER.debug("NodeResponse::from_data(): Unknown message type in response")
         return None
+    message_type = NodeMessageType(raw_message_type)
 
     # Request ID
-    request_id = struct.unpack(">I", data[5:9])[0]
+    request_id = struct.unpack(">I", frame[5:9])[0]
 
     # Response ID
-    response_id = struct.unpack(">I", data[9:13])[0]
+    response_id = struct.unpack(">I", frame[9:13])[0]
 
     # Success/Fail
-    success = bool(data[13])
+    success = bool(frame[13])
 
     # Payload Length
-    payload_length = data[14]
-
-    # CRC
-    crc = int.from_bytes(data[2:4], byteorder="little")
-    crc_data = data[4 : 15 + payload_length]
-    calculated_crc = crc16ccitt(crc_data)
-
-    if crc != calculated_crc:
-        LOGGER.debug("NodeResponse::from_data(): Invalid CRC")
-        return None
-
-    response_length = payload_length + NodeResponse.HEADER_LENGTH
-    if len(data) < response_length:
-        LOGGER.debug("Bad number of bytes")
-        return None
+    payload_length = frame[14]
 
     if message_type == NodeMessageType.LOG:
         return NodeReadLogsResponse.from_raw(
-            data, success, request_id, response_id, int(payload_length)
+            frame, success, request_id, response_id, int(payload_length)
         )
     # TODO: NodeSetIDResponse (commented out in Swift impl)
     # TODO: NodeSetColorResponse (commented out in Swift impl)
     elif message_type == NodeMessageType.SESSION_INFO:
         return NodeReadSessionInfoResponse.from_raw(
-            data, success, request_id, response_id, int(payload_length)
+            frame, success, request_id, response_id, int(payload_length)
         )
     elif message_type == NodeMessageType.SET_PREDICTION:
         return NodeSetPredictionResponse(success, request_id, response_id, int(payload_length))
     elif message_type == NodeMessageType.PROBE_FIRMWARE_REVISION:
         return NodeReadFirmwareRevisionResponse.from_raw(
-            data, success, request_id, response_id, int(payload_length)
+            frame, success, request_id, response_id, int(payload_length)
         )
     elif message_type == NodeMessageType.PROBE_HARDWARE_REVISION:
         return NodeReadHardwareRevisionResponse.from_raw(
-            data, success, request_id, response_id, int(payload_length)
+            frame, success, request_id, response_id, int(payload_length)
         )
     elif message_type == NodeMessageType.PROBE_MODEL_INFORMATION:
         return NodeReadModelInfoResponse.from_raw(
-            data, success, request_id, response_id, int(payload_length)
+            frame, success, request_id, response_id, int(payload_length)
         )
     # TODO: NodeReadOverTemperatureResponse (commented out in Swift impl)
     else:
@@ -1,31 +1,39 @@
+from typing import Optional, Union
+
 from combustion_ble.uart.meatnet.node_request import NodeRequest
-from combustion_ble.uart.meatnet.node_request_from_data import node_request_from_data
+from combustion_ble.uart.meatnet.node_request_from_data import node_request_from_frame
 from combustion_ble.uart.meatnet.node_response import NodeResponse
-from combustion_ble.uart.meatnet.node_response_from_data import node_response_from_data
+from combustion_ble.uart.meatnet.node_response_from_data import node_response_from_frame
+from combustion_ble.uart.uart_framer import UARTFramer
 
+NodeMessage = Union[NodeRequest, NodeResponse]
 
-class NodeUARTMessage:
-    @staticmethod
-    def from_data(data):
-        messages = []
 
-        number_bytes_read = 0
+class NodeUARTFramer(UARTFramer[NodeMessage]):
+    """Reassembles the requests and responses received from a MeatNet Node over UART."""
 
-        while number_bytes_read < len(data):
-            bytes_to_decode = data[number_bytes_read:]
+    def frame_length(self, view: memoryview) -> Optional[int]:
+        if len(view) < NodeRequest.HEADER_LENGTH:
+            return None
+        if view[4] & NodeResponse.RESPONSE_TYPE_FLAG:
+            if len(view) < NodeResponse.HEADER_LENGTH:
+                return None
+            return NodeResponse.HEADER_LENGTH + view[14]
+        return NodeRequest.HEADER_LENGTH + view[9]
 
-            response = node_response_from_data(bytes_to_decode)
-            if response:
-                messages.append(response)
-                number_bytes_read += response.payload_length + NodeResponse.HEADER_LENGTH
+    def decode_frame(self, frame: memoryview) -> Optional[NodeMessage]:
+        if frame[4] & NodeResponse.RESPONSE_TYPE_FLAG:
+            return node_response_from_frame(frame)
 
-            else:
-                request = node_request_from_data(bytes_to_decode)
-                if request and request.payload_length:
-                    messages.append(request)
-                    number_bytes_read += request.payload_length + NodeRequest.HEADER_LENGTH
-                else:
-                    # Found invalid response or request, break out of while loop
-                    break
+        request = node_request_from_frame(frame)
+        if request and request.payload_length:
+            return request
+        return None
 
-        return messages
+
+class NodeUARTMessage:
+    @staticmethod
+    def from_data(data) -> list[NodeMessage]:
+        """Decode every request and response in `data`, skipping over any bytes that are not a
+        valid message."""
+        return NodeUARTFramer().feed(data)
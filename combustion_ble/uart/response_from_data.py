@@ -9,73 +9,81 @@ from combustion_ble.uart.session_info import SessionInfoResponse
 from combustion_ble.uart.set_color import SetColorResponse
 from combustion_ble.uart.set_id import SetIDResponse
 from combustion_ble.uart.set_prediction import SetPredictionResponse
+from combustion_ble.uart.uart_framer import UARTFramer
 from combustion_ble.utilities.crc16ccitt import crc16ccitt
 
 HEADER_LENGTH = 7
 
 
 def responses_from_data(data) -> list[Response]:
-    responses = []
-    number_bytes_read = 0
-
-    while number_bytes_read < len(data):
-        bytes_to_decode = data[number_bytes_read:]
-        response = response_from_data(bytes_to_decode)
-        if response:
-            responses.append(response)
-            number_bytes_read += response.payload_length + HEADER_LENGTH
-        else:
-            break
-
-    return responses
+    """Decode every response in `data`, skipping over any bytes that are not a valid response."""
+    return ResponseFramer().feed(data)
 
 
 def response_from_data(data) -> Optional[Response]:
     # Sync bytes
-    sync_bytes = data[:2]
-    sync_string = "".join(format(byte, "02x") for byte in sync_bytes)
-    if sync_string != "cafe":
+    if data[:2] != b"\xCA\xFE":
         LOGGER.debug("Response::from_data(): Missing sync bytes in response")
         return None
 
-    # Message type
-    # type_byte = data[4]
-    message_type = int(data[4])
-
-    # Success/Fail
-    success = bool(data[5])
+    if len(data) < Response.HEADER_LENGTH:
+        return None
 
     # Payload Length
     payload_length = data[6]
 
-    # CRC - Implement your own CRC16-CCITT calculation
+    response_length = payload_length + Response.HEADER_LENGTH
+    if len(data) < response_length:
+        return None
+
+    # CRC covers the message type, success flag, payload length and payload
     crc = int.from_bytes(data[2:4], byteorder="little")
-    crc_data_length = 3 + payload_length
-    crc_data = data[4 : 4 + crc_data_length]
-    calculated_crc = crc16ccitt(crc_data)
+    calculated_crc = crc16ccitt(memoryview(data)[4:response_length])
 
     if crc != calculated_crc:
         LOGGER.debug("Response::from_data(): Invalid CRC")
         return None
 
-    response_length = payload_length + Response.HEADER_LENGTH
-    if len(data) < response_length:
-        return None
+    return response_from_frame(data)
+
+
+def response_from_frame(frame) -> Optional[Response]:
+    """Decode a single response whose sync bytes, length and CRC have already been validated."""
+    # Message type
+    message_type = int(frame[4])
+
+    # Success/Fail
+    success = bool(frame[5])
+
+    # Payload Length
+    payload_length = frame[6]
 
     # Process based on message_type
     if message_type == MessageType.LOG:
-        return LogResponse.from_raw(data, success, int(payload_length))
+        return LogResponse.from_raw(frame, success, int(payload_length))
     elif message_type == MessageType.SET_ID:
         return SetIDResponse(success, int(payload_length))
     elif message_type == MessageType.SET_COLOR:
         return SetColorResponse(success, int(payload_length))
     elif message_type == MessageType.SESSION_INFO:
-        return SessionInfoResponse.from_raw(data, success, int(payload_length))
+        return SessionInfoResponse.from_raw(frame, success, int(payload_length))
     elif message_type == MessageType.SET_PREDICTION:
         return SetPredictionResponse(success, int(payload_length))
     elif message_type == MessageType.READ_OVER_TEMPERATURE:
-        return ReadOverTemperatureResponse(data, success, int(payload_length))
+        return ReadOverTemperatureResponse(frame, success, int(payload_length))
     else:
-        LOGGER.debug("Ignoring response of type", message_type)
+        LOGGER.debug("Ignoring response of type [%s]", message_type)
 
     return None
+
+
+class ResponseFramer(UARTFramer[Response]):
+    """Reassembles the responses received from a Probe over UART."""
+
+    def frame_length(self, view: memoryview) -> Optional[int]:
+        if len(view) < Response.HEADER_LENGTH:
+            return None
+        return Response.HEADER_LENGTH + view[6]
+
+    def decode_frame(self, frame: memoryview) -> Optional[Response]:
+        return response_from_frame(frame)
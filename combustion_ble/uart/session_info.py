@@ -1,14 +1,15 @@
 """Session Info"""
 
+from typing import NamedTuple
+
 from combustion_ble.uart.message_type import MessageType
 from combustion_ble.uart.request import Request
 from combustion_ble.uart.response import Response
 
 
-class SessionInformation:
-    def __init__(self, session_id: int, sample_period: int) -> None:
-        self.session_id = session_id
-        self.sample_period = sample_period
+class SessionInformation(NamedTuple):
+    session_id: int
+    sample_period: int
 
 
 class SessionInfoRequest(Request):
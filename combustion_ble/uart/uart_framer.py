@@ -0,0 +1,120 @@
+"""Reassembly of UART messages from a stream of BLE notifications."""
+
+from abc import ABC, abstractmethod
+from typing import Generic, Optional, TypeVar, Union
+
+from combustion_ble.logger import LOGGER
+from combustion_ble.utilities.crc16ccitt import crc16ccitt
+
+T = TypeVar("T")
+
+SYNC_BYTES = b"\xCA\xFE"
+
+
+class UARTFramer(ABC, Generic[T]):
+    """Stateful decoder for the messages received over a single UART connection.
+
+    Every UART message starts with the ``0xCAFE`` sync bytes followed by a little-endian CRC of the
+    rest of the message. A message may be split across several GATT notifications, and a single
+    notification may hold many messages. The framer scans for sync bytes, keeps an incomplete
+    message until the rest of it arrives, and resynchronizes on the next sync bytes after a CRC
+    failure.
+
+    Notifications are decoded in place through a ``memoryview``. Only the bytes of an incomplete
+    trailing message are copied, into the framer's receive buffer, and a buffer is never resized
+    once messages have been decoded from it.
+
+    Subclasses describe the message layout with ``frame_length()`` and decode validated frames with
+    ``decode_frame()``.
+    """
+
+    def __init__(self) -> None:
+        self._buffer = bytearray()
+
+        self.dropped_bytes = 0
+        """Number of bytes discarded because they were not part of a valid message."""
+
+        self.crc_errors = 0
+        """Number of candidate messages discarded because of a CRC mismatch."""
+
+        self.frames = 0
+        """Number of valid messages received."""
+
+    @property
+    def buffered_bytes(self) -> int:
+        """Number of bytes held while waiting for the rest of a message."""
+        return len(self._buffer)
+
+    @abstractmethod
+    def frame_length(self, view: memoryview) -> Optional[int]:
+        """Return the length of the message starting at ``view[0]``, or ``None`` if ``view`` does not
+        yet hold enough of the header to tell."""
+
+    @abstractmethod
+    def decode_frame(self, frame: memoryview) -> Optional[T]:
+        """Decode a single message whose sync bytes, length and CRC have already been validated."""
+
+    def reset(self) -> None:
+        """Discard any partially received message."""
+        self.dropped_bytes += len(self._buffer)
+        self._buffer = bytearray()
+
+    def feed(self, data: Union[bytes, bytearray]) -> list[T]:
+        """Add the contents of a notification, and return the messages it completes."""
+        if self._buffer:
+            self._buffer += data
+            source: Union[bytes, bytearray] = self._buffer
+        else:
+            source = data
+
+        messages: list[T] = []
+        dropped_bytes = self.dropped_bytes
+        end = len(source)
+        offset = 0
+        with memoryview(source) as view:
+            while offset < end:
+                sync = source.find(SYNC_BYTES, offset)
+                if sync < 0:
+                    # Hold on to a trailing first sync byte, the next notification may complete it.
+                    keep = 1 if source[end - 1] == SYNC_BYTES[0] else 0
+                    self.dropped_bytes += end - offset - keep
+                    offset = end - keep
+                    break
+                if sync != offset:
+                    self.dropped_bytes += sync - offset
+                    offset = sync
+
+                length = self.frame_length(view[offset:])
+                if length is None or offset + length > end:
+                    # Incomplete message, wait for the next notification.
+                    break
+
+                crc = view[offset + 2] | view[offset + 3] << 8
+                if crc != crc16ccitt(view[offset + 4 : offset + length]):
+                    # Skip these sync bytes and resynchronize on the next ones.
+                    self.crc_errors += 1
+                    self.dropped_bytes += len(SYNC_BYTES)
+                    offset += len(SYNC_BYTES)
+                    continue
+
+                self.frames += 1
+                message = self.decode_frame(view[offset : offset + length])
+                if message is not None:
+                    messages.append(message)
+                offset += length
+
+            # Copy out the unconsumed tail. Decoded messages may still reference `source`, so it
+            # is never resized in place.
+            if offset == end:
+                self._buffer = bytearray()
+            elif offset or source is not self._buffer:
+                self._buffer = bytearray(view[offset:])
+
+        if self.dropped_bytes != dropped_bytes:
+            LOGGER.debug(
+                "UART framer dropped [%d] bytes (total [%d] bytes, [%d] CRC errors)",
+                self.dropped_bytes - dropped_bytes,
+                self.dropped_bytes,
+                self.crc_errors,
+            )
+        return messages
@@ -1,15 +1,44 @@
-def crc16ccitt(data):
+"""CRC-16-CCITT checksum used by UART and MeatNet message framing."""
+
+from binascii import crc_hqx
+from typing import Union
+
+CRC16CCITT_INITIAL_VALUE = 0xFFFF
+
+BytesLike = Union[bytes, bytearray, memoryview]
+
+
+def crc16ccitt(data: BytesLike, crc: int = CRC16CCITT_INITIAL_VALUE) -> int:
     """Calculate the CRC-16-CCITT checksum of a byte array.
+
+    This is the CCITT-FALSE variant (polynomial 0x1021, initial value 0xFFFF). It is computed by
+    ``binascii.crc_hqx``, a table-driven implementation of the same polynomial written in C.
+
     :param data: The input data as a byte array.
+    :param crc: The running CRC value to continue from, for checksumming data in several parts.
     :return: The calculated CRC as an integer.
     """
-    poly = 0x1021
-    crc = 0xFFFF
+    return crc_hqx(data, crc)
+
+
+class CRC16CCITT:
+    """Incremental CRC-16-CCITT calculator.
+
+    Feeding data in several ``update()`` calls yields the same checksum as a single
+    ``crc16ccitt()`` call over the concatenated data, without having to build that concatenation.
+    """
+
+    __slots__ = ("value",)
+
+    def __init__(self, data: BytesLike = b"") -> None:
+        self.value: int = crc_hqx(data, CRC16CCITT_INITIAL_VALUE)
+        """The CRC of all data seen so far."""
 
-    for byte in data:
-        crc ^= byte << 8
-        for _ in range(8):
-            crc = (crc << 1) ^ poly if (crc & 0x8000) else crc << 1
-            crc &= 0xFFFF  # Truncate to 16 bits
+    def update(self, data: BytesLike) -> "CRC16CCITT":
+        """Add ``data`` to the checksum. Returns this instance so calls can be chained."""
+        self.value = crc_hqx(data, self.value)
+        return self
 
-    return crc
+    def to_bytes(self) -> bytes:
+        """The checksum in the little-endian wire format used by UART messages."""
+        return self.value.to_bytes(length=2, byteorder="little")
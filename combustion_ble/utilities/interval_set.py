@@ -0,0 +1,141 @@
+"""Set of integers stored as sorted, non-overlapping runs."""
+
+from bisect import bisect_left, bisect_right
+from typing import Iterator, Optional
+
+
+class IntervalSet:
+    """Set of integers, stored as sorted runs of consecutive values.
+
+    Suited to sequence numbers, which mostly arrive in order: a set of any number of consecutive
+    values takes a single run, and adding the value after the last one extends that run. Lookups and
+    gap queries are O(log r), with r the number of runs. The count of values and the highest value
+    are kept up to date and read in O(1).
+    """
+
+    __slots__ = ("_starts", "_ends", "_count")
+
+    def __init__(self) -> None:
+        self._starts: list[int] = []
+        self._ends: list[int] = []
+        self._count = 0
+
+    @classmethod
+    def from_runs(cls, runs: list[tuple[int, int]]) -> "IntervalSet":
+        """Build a set from inclusive ``(start, end)`` runs, sorted and not adjacent."""
+        result = cls()
+        result._starts = [start for start, _ in runs]
+        result._ends = [end for _, end in runs]
+        result._count = sum(end - start + 1 for start, end in runs)
+        return result
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __contains__(self, value: int) -> bool:
+        index = bisect_right(self._starts, value) - 1
+        return index >= 0 and value <= self._ends[index]
+
+    def __iter__(self) -> Iterator[int]:
+        for start, end in zip(self._starts, self._ends):
+            yield from range(start, end + 1)
+
+    @property
+    def min(self) -> Optional[int]:
+        """Lowest value in the set."""
+        return self._starts[0] if self._starts else None
+
+    @property
+    def max(self) -> Optional[int]:
+        """Highest value in the set."""
+        return self._ends[-1] if self._ends else None
+
+    @property
+    def runs(self) -> list[tuple[int, int]]:
+        """Runs of consecutive values, as inclusive ``(start, end)`` pairs in ascending order."""
+        return list(zip(self._starts, self._ends))
+
+    def clear(self) -> None:
+        self._starts.clear()
+        self._ends.clear()
+        self._count = 0
+
+    def add(self, value: int) -> bool:
+        """Add `value` to the set. Returns whether it was not already present."""
+        starts = self._starts
+        ends = self._ends
+
+        # Fast path for the next value in sequence.
+        if ends and ends[-1] == value - 1:
+            ends[-1] = value
+            self._count += 1
+            return True
+
+        index = bisect_right(starts, value) - 1
+        if index >= 0 and value <= ends[index]:
+            return False
+
+        extends_previous = index >= 0 and ends[index] == value - 1
+        extends_next = index + 1 < len(starts) and starts[index + 1] == value + 1
+        if extends_previous and extends_next:
+            ends[index] = ends[index + 1]
+            del starts[index + 1]
+            del ends[index + 1]
+        elif extends_previous:
+            ends[index] = value
+        elif extends_next:
+            starts[index + 1] = value
+        else:
+            starts.insert(index + 1, value)
+            ends.insert(index + 1, value)
+
+        self._count += 1
+        return True
+
+    def first_missing(self, start: int, end: int) -> Optional[int]:
+        """Lowest value in ``[start, end]`` that is not in the set, if any."""
+        index = bisect_right(self._starts, start) - 1
+        if index >= 0 and start <= self._ends[index]:
+            start = self._ends[index] + 1
+        return start if start <= end else None
+
+    def last_missing(self, start: int, end: int) -> Optional[int]:
+        """Highest value in ``[start, end]`` that is not in the set, if any."""
+        index = bisect_right(self._starts, end) - 1
+        if index >= 0 and end <= self._ends[index]:
+            end = self._starts[index] - 1
+        return end if start <= end else None
+
+    def missing_runs(self, start: int, end: int) -> Iterator[tuple[int, int]]:
+        """Runs of values in ``[start, end]`` that are not in the set, as inclusive pairs."""
+        index = bisect_right(self._starts, start) - 1
+        if index >= 0 and start <= self._ends[index]:
+            start = self._ends[index] + 1
+        index += 1
+
+        while start <= end:
+            if index >= len(self._starts) or self._starts[index] > end:
+                yield start, end
+                return
+            if self._starts[index] > start:
+                yield start, self._starts[index] - 1
+            start = self._ends[index] + 1
+            index += 1
+
+    def count_in_range(self, start: int, end: int) -> int:
+        """Number of values of the set in ``[start, end]``.
+
+        O(1) when the range covers the whole set, and otherwise O(log r) plus the number of runs
+        overlapping the range.
+        """
+        if not self._count or end < start:
+            return 0
+        if start <= self._starts[0] and self._ends[-1] <= end:
+            return self._count
+
+        first = bisect_left(self._ends, start)
+        last = bisect_right(self._starts, end)
+        count = 0
+        for index in range(first, last):
+            count += min(self._ends[index], end) - max(self._starts[index], start) + 1
+        return count
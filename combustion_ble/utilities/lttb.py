@@ -0,0 +1,49 @@
+"""Largest-triangle-three-buckets downsampling of a series of points."""
+
+from typing import Sequence
+
+
+def lttb(x: Sequence[float], y: Sequence[float], threshold: int) -> list[int]:
+    """Select `threshold` points of the series `(x, y)` that preserve its visual shape, using the
+    largest-triangle-three-buckets algorithm. `x` must be sorted.
+
+    Returns the indices of the selected points, in order. The first and last points are always
+    selected, and all indices are returned when the series has no more than `threshold` points.
+    """
+    count = len(x)
+    if len(y) != count:
+        raise ValueError("x and y must have the same length.")
+    if threshold >= count:
+        return list(range(count))
+    if threshold < 3:
+        raise ValueError("Threshold must be at least 3.")
+
+    # The points between the first and the last are split into threshold - 2 buckets, and the point
+    # of each bucket forming the largest triangle with the previously selected point and the
+    # average of the next bucket is selected.
+    bucket_size = (count - 2) / (threshold - 2)
+    selected = [0]
+    previous = 0
+    for bucket in range(threshold - 2):
+        start = int(bucket * bucket_size) + 1
+        stop = int((bucket + 1) * bucket_size) + 1
+        next_stop = min(int((bucket + 2) * bucket_size) + 1, count)
+
+        next_count = next_stop - stop
+        average_x = sum(x[stop:next_stop]) / next_count
+        average_y = sum(y[stop:next_stop]) / next_count
+
+        previous_x = x[previous]
+        previous_y = y[previous]
+        dx = previous_x - average_x
+        dy = average_y - previous_y
+        max_area = -1.0
+        for index in range(start, stop):
+            area = abs(dx * (y[index] - previous_y) - (previous_x - x[index]) * dy)
+            if area > max_area:
+                max_area = area
+                previous = index
+        selected.append(previous)
+
+    selected.append(count - 1)
+    return selected
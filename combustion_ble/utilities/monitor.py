@@ -37,5 +37,5 @@ class Monitorable(Generic[T]):
     def update(self, next_value: T) -> None:
         self._value = next_value
         self._last_update_time = datetime.now()
-        for listener in self._listeners:
+        for listener in list(self._listeners):
             listener(next_value)
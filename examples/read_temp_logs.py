@@ -15,7 +15,7 @@ from examples._example_utils import configure_logging
 def generate_data_points(probe: Probe) -> list[list[tuple[datetime, float]]]:
     data_points: list[list[tuple[datetime, float]]] = []
 
-    for log in probe._temperature_logs:
+    for log in probe._temperature_logs.values():
         # Skip log if start time has not been set
         if not (session_start_time := log.start_time):
             print("skipping logs without start time")
@@ -46,12 +46,13 @@ async def main():
         table = Table()
         if probes:
             probe = probes[0]
-            probe._update_log_percent()
+            progress = probe.log_sync_progress
+            eta = f"{progress.eta_seconds:.0f} s" if progress.eta_seconds is not None else "-"
             table = Table(
                 caption=(
-                    "Percent synced: " + str(probe._percent_of_logs_synced)
-                    if probe._percent_of_logs_synced
-                    else "0"
+                    f"Percent synced: {progress.percent} "
+                    f"({progress.synced}/{progress.total}, "
+                    f"{progress.records_per_second:.0f} records/s, ETA {eta})"
                 )
             )
             table.add_column("Timestamp")
@@ -0,0 +1,97 @@
+from types import SimpleNamespace
+
+import pytest
+
+from combustion_ble import advertising_filter as advertising_filter_module
+from combustion_ble.advertising_filter import AdvertisingFilter
+from combustion_ble.ble_manager import BleManager, BleManagerDelegate
+from combustion_ble.const import BT_MANUFACTURER_ID
+
+PROBE_ADVERTISEMENT = bytes.fromhex("01b10f0010" + "a4c5e02b11f8c1d8ac72cd9ba5" + "0d0240")
+OTHER_PROBE_ADVERTISEMENT = bytes.fromhex("01b20f0010" + "a4c5e02b11f8c1d8ac72cd9ba5" + "0d0240")
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = SimpleNamespace(now=0.0)
+    monkeypatch.setattr(advertising_filter_module.time, "monotonic", lambda: clock.now)
+    return clock
+
+
+def _with_temperatures(payload: bytes, byte: int) -> bytes:
+    return payload[:5] + bytes((byte,)) + payload[6:]
+
+
+def test_repeated_payloads_are_decoded_once(clock):
+    advertising_filter = AdvertisingFilter()
+
+    forward, first = advertising_filter.filter("A", PROBE_ADVERTISEMENT)
+    assert forward and first is not None and first.serial_number == 0x10000FB1
+    forward, repeated = advertising_filter.filter("A", PROBE_ADVERTISEMENT)
+    assert forward and repeated is first
+
+    forward, changed = advertising_filter.filter("A", _with_temperatures(PROBE_ADVERTISEMENT, 0))
+    assert forward and changed is not None and changed is not first
+    assert (advertising_filter.received, advertising_filter.decoded) == (3, 2)
+    assert advertising_filter.coalesced == 1
+
+
+def test_advertisements_are_rate_limited_per_device(clock):
+    advertising_filter = AdvertisingFilter(min_interval=1.0)
+
+    assert advertising_filter.filter("A", PROBE_ADVERTISEMENT)[0]
+    assert advertising_filter.filter("A", OTHER_PROBE_ADVERTISEMENT)[0]
+    clock.now = 0.5
+    assert advertising_filter.filter("A", _with_temperatures(PROBE_ADVERTISEMENT, 0)) == (
+        False,
+        None,
+    )
+    clock.now = 1.0
+    forward, advertising = advertising_filter.filter(
+        "A", _with_temperatures(PROBE_ADVERTISEMENT, 0)
+    )
+    assert forward and advertising is not None
+    assert advertising_filter.dropped == 1
+
+
+def test_least_recently_received_devices_are_forgotten(clock):
+    advertising_filter = AdvertisingFilter(max_entries=2)
+
+    advertising_filter.filter("A", PROBE_ADVERTISEMENT)
+    advertising_filter.filter("B", PROBE_ADVERTISEMENT)
+    advertising_filter.filter("A", PROBE_ADVERTISEMENT)
+    advertising_filter.filter("C", PROBE_ADVERTISEMENT)
+    assert len(advertising_filter) == 2
+
+    # "B" was evicted, so its advertisement is decoded again; "A" is still cached.
+    advertising_filter.filter("A", PROBE_ADVERTISEMENT)
+    advertising_filter.filter("B", PROBE_ADVERTISEMENT)
+    assert (advertising_filter.decoded, advertising_filter.coalesced) == (4, 2)
+
+
+class RecordingDelegate(BleManagerDelegate):
+    def __init__(self) -> None:
+        self.advertisements: list[str] = []
+        self.rssi_updates: list[tuple[str, int]] = []
+
+    def update_device_with_advertising(self, advertising, is_connectable, rssi, identifier):
+        self.advertisements.append(identifier)
+
+    def update_device_rssi(self, identifier: str, rssi: int):
+        self.rssi_updates.append((identifier, rssi))
+
+
+def test_rate_limited_advertisements_only_update_rssi(clock):
+    ble_manager = BleManager()
+    ble_manager.delegate = delegate = RecordingDelegate()
+    ble_manager.advertising_filter.min_interval = 1.0
+    device = SimpleNamespace(address="A", details=None)
+
+    for rssi in (-60, -70):
+        advertisement = SimpleNamespace(
+            manufacturer_data={BT_MANUFACTURER_ID: PROBE_ADVERTISEMENT}, rssi=rssi
+        )
+        ble_manager.detection_callback(device, advertisement)  # type: ignore[arg-type]
+
+    assert delegate.advertisements == ["A"]
+    assert delegate.rssi_updates == [("A", -70)]
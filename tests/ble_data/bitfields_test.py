@@ -0,0 +1,92 @@
+from enum import Enum
+from typing import TypeVar
+
+import pytest
+
+from combustion_ble.ble_data.battery_status_virtual_sensors import (
+    BatteryStatus,
+    BatteryStatusVirtualSensors,
+)
+from combustion_ble.ble_data.hop_count import HopCount
+from combustion_ble.ble_data.mode_id import ModeId, ProbeColor, ProbeID, ProbeMode
+from combustion_ble.ble_data.prediction_log import PredictionLog
+from combustion_ble.ble_data.prediction_mode import PredictionMode
+from combustion_ble.ble_data.prediction_state import PredictionState
+from combustion_ble.ble_data.prediction_status import PredictionStatus
+from combustion_ble.ble_data.prediction_type import PredictionType
+from combustion_ble.ble_data.virtual_sensors import (
+    VirtualAmbientSensor,
+    VirtualCoreSensor,
+    VirtualSensors,
+    VirtualSurfaceSensor,
+)
+
+E = TypeVar("E", bound=Enum)
+
+
+def _member(enum: type[E], raw: int, default: E) -> E:
+    try:
+        return enum(raw)
+    except ValueError:
+        return default
+
+
+def _virtual_sensors(byte: int) -> tuple[Enum, Enum, Enum]:
+    return (
+        _member(VirtualCoreSensor, byte & 0x7, VirtualCoreSensor.T1),
+        _member(VirtualSurfaceSensor, (byte >> 3) & 0x3, VirtualSurfaceSensor.T4),
+        _member(VirtualAmbientSensor, (byte >> 5) & 0x3, VirtualAmbientSensor.T5),
+    )
+
+
+def _sensors_of(sensors: VirtualSensors) -> tuple[Enum, Enum, Enum]:
+    return sensors.virtual_core, sensors.virtual_surface, sensors.virtual_ambient
+
+
+def test_single_byte_tables_match_the_bit_layout():
+    for byte in range(256):
+        mode_id = ModeId.from_byte(byte)
+        assert (mode_id.id, mode_id.color, mode_id.mode) == (
+            ProbeID((byte >> 5) & 0x7),
+            ProbeColor((byte >> 2) & 0x7),
+            ProbeMode(byte & 0x3),
+        )
+
+        assert _sensors_of(VirtualSensors.from_byte(byte)) == _virtual_sensors(byte)
+
+        battery = BatteryStatusVirtualSensors.from_byte(byte)
+        assert battery.battery_status == BatteryStatus(byte & 0x1)
+        assert _sensors_of(battery.virtual_sensors) == _virtual_sensors(byte >> 1)
+
+        assert HopCount.from_network_info_byte(byte) == HopCount((byte >> 6) & 0x3)
+
+        status = PredictionStatus.from_bytes(bytes((byte,)) + bytes(7))
+        assert (status.prediction_state, status.prediction_mode, status.prediction_type) == (
+            PredictionState(byte & 0xF),
+            PredictionMode((byte >> 4) & 0x3),
+            PredictionType((byte >> 6) & 0x3),
+        )
+
+
+def test_prediction_log_header_table_matches_the_bit_layout():
+    # The state is in bits 0-2 of the second byte and bit 7 of the first, the mode in bits 3-4 and
+    # the type in bits 5-6 of the second byte.
+    for first in range(256):
+        for second in range(256):
+            log = PredictionLog.from_raw(bytes((first, second)) + bytes(5))
+            assert _sensors_of(log.virtual_sensors) == _virtual_sensors(first)
+            assert (log.prediction_state, log.prediction_mode, log.prediction_type) == (
+                PredictionState((second & 0x7) << 1 | first >> 7),
+                PredictionMode((second >> 3) & 0x3),
+                PredictionType((second >> 5) & 0x3),
+            )
+            assert log.prediction_set_point_temperature == (second >> 7) * 0.1
+
+
+def test_shared_decoded_records_are_immutable():
+    mode_id = ModeId.from_byte(0)
+    with pytest.raises(AttributeError):
+        mode_id.color = ProbeColor.color2  # type: ignore[misc]
+    with pytest.raises(AttributeError):
+        del VirtualSensors.from_byte(0).virtual_core
+    assert ModeId.from_byte(0).color == ProbeColor.color1
@@ -0,0 +1,26 @@
+from combustion_ble.ble_data.probe_temperatures import ProbeTemperatures
+
+# Raw readings 0, 1, 400, 800, 1000, 2000, 4000 and 8191, packed as eight 13-bit values.
+RAW_VALUES = [0, 1, 400, 800, 1000, 2000, 4000, 8191]
+PACKED = sum(raw << (13 * i) for i, raw in enumerate(RAW_VALUES)).to_bytes(13, "little")
+
+
+def test_raw_values():
+    assert ProbeTemperatures.from_raw_data(PACKED).raw_values == RAW_VALUES
+
+
+def test_values_celsius():
+    temperatures = ProbeTemperatures.from_raw_data(PACKED)
+    expected = [raw * 0.05 - 20.0 for raw in RAW_VALUES]
+    assert temperatures.values_celsius == expected
+    assert temperatures.values == expected
+    assert [temperatures.celsius(i) for i in range(8)] == expected
+
+
+def test_from_reversed():
+    assert ProbeTemperatures.from_reversed(list(reversed(PACKED))).raw_data == PACKED
+
+
+def test_from_values():
+    values = ProbeTemperatures.from_raw_data(PACKED).values
+    assert ProbeTemperatures.from_values(values).raw_data == PACKED
@@ -0,0 +1,115 @@
+import asyncio
+from typing import Optional
+
+from combustion_ble.ble_manager import BleConnection, BleManager, BleManagerDelegate
+from combustion_ble.const import (
+    DEVICE_STATUS_CHARACTERISTIC,
+    FW_VERSION_CHARACTERISTIC,
+    HW_VERSION_CHARACTERISTIC,
+    MODEL_NUMBER_CHARACTERISTIC,
+    SERIAL_NUMBER_CHARACTERISTIC,
+    UART_RX_CHARACTERISTIC,
+    UART_TX_CHARACTERISTIC,
+)
+
+
+class FakeCharacteristic:
+    def __init__(self, uuid: str, handle: int) -> None:
+        self.uuid = uuid
+        self.handle = handle
+        self.descriptors = [object()]
+
+
+class FakeService:
+    def __init__(self, characteristics: list[FakeCharacteristic]) -> None:
+        self.characteristics = characteristics
+
+
+class FakeServices:
+    def __init__(self, characteristics: list[FakeCharacteristic]) -> None:
+        self.by_handle = {
+            characteristic.handle: characteristic for characteristic in characteristics
+        }
+        self.scans = 0
+
+    def __iter__(self):
+        self.scans += 1
+        return iter([FakeService(list(self.by_handle.values()))])
+
+    def get_characteristic(self, handle: int):
+        return self.by_handle.get(handle)
+
+
+class FakeClient:
+    def __init__(self, calls: list[str]) -> None:
+        self.calls = calls
+        self.is_connected = True
+        self.services = FakeServices(
+            [
+                FakeCharacteristic(uuid, handle)
+                for handle, uuid in enumerate(
+                    [
+                        FW_VERSION_CHARACTERISTIC,
+                        HW_VERSION_CHARACTERISTIC,
+                        SERIAL_NUMBER_CHARACTERISTIC,
+                        MODEL_NUMBER_CHARACTERISTIC,
+                        UART_TX_CHARACTERISTIC,
+                        UART_RX_CHARACTERISTIC,
+                        DEVICE_STATUS_CHARACTERISTIC,
+                    ]
+                )
+            ]
+        )
+
+    async def start_notify(self, characteristic, callback):
+        self.calls.append(f"notify {characteristic.uuid}")
+
+    async def write_gatt_char(self, characteristic, data, response):
+        self.calls.append(f"write {characteristic.uuid}")
+
+    async def read_gatt_char(self, characteristic, use_cached):
+        self.calls.append(f"read {characteristic.uuid}")
+        return b"value"
+
+
+class FakeDelegate(BleManagerDelegate):
+    def __init__(self) -> None:
+        self.firmware_version: Optional[str] = None
+
+    def has_device_info(self, identifier: str, characteristic: str) -> bool:
+        return characteristic == "fw_revision" and self.firmware_version is not None
+
+    def update_device_fw_version(self, identifier: str, fw_version: str):
+        self.firmware_version = fw_version
+
+
+def test_connection_setup_subscribes_first_and_reads_missing_device_info():
+    async def connect_twice():
+        ble_manager = BleManager()
+        ble_manager.delegate = FakeDelegate()
+        calls: list[list[str]] = []
+        clients = []
+        for _ in range(2):
+            calls.append([])
+            client = FakeClient(calls[-1])
+            clients.append(client)
+            ble_manager.connections["probe"] = BleConnection(client)  # type: ignore[arg-type]
+            await ble_manager._set_up_connection("probe", ble_manager.connections["probe"])
+        return calls, clients
+
+    calls, clients = asyncio.run(connect_twice())
+
+    subscriptions = {f"notify {DEVICE_STATUS_CHARACTERISTIC}", f"notify {UART_TX_CHARACTERISTIC}"}
+    assert set(calls[0][:2]) == subscriptions
+    assert calls[0][2:] == [
+        f"write {UART_RX_CHARACTERISTIC}",
+        f"read {FW_VERSION_CHARACTERISTIC}",
+        f"read {HW_VERSION_CHARACTERISTIC}",
+        f"read {SERIAL_NUMBER_CHARACTERISTIC}",
+        f"read {MODEL_NUMBER_CHARACTERISTIC}",
+    ]
+    # The firmware version is known after the first connection, and characteristics are found by
+    # their cached handles.
+    assert f"read {FW_VERSION_CHARACTERISTIC}" not in calls[1]
+    assert len(calls[1]) == 6
+    assert (clients[0].services.scans, clients[1].services.scans) == (1, 0)
@@ -0,0 +1,53 @@
+import pytest
+
+from combustion_ble.connection_pool import ConnectionPool
+
+# (is a node, not relayed by a node, not synced, RSSI)
+NODE = (True, True, True, -80)
+UNRELAYED_PROBE = (False, True, True, -70)
+SYNCED_PROBE = (False, True, False, -50)
+RELAYED_PROBE = (False, False, True, -40)
+
+
+def test_admit_evicts_less_useful_connection():
+    pool = ConnectionPool(max_size=2)
+    assert pool.admit(RELAYED_PROBE, [("node", NODE)]) == (True, None)
+
+    connections = [("node", NODE), ("relayed", RELAYED_PROBE)]
+    assert pool.admit(UNRELAYED_PROBE, connections) == (True, "relayed")
+    assert pool.admit(RELAYED_PROBE, connections) == (False, None)
+
+    assert (pool.evictions, pool.refused, pool.peak_size) == (1, 1, 2)
+    assert pool.utilization == 1.0
+
+
+def test_releases_idle_and_least_useful_connections():
+    pool = ConnectionPool(max_size=2, idle_timeout=30)
+    connections = [
+        ("node", NODE),
+        ("synced", SYNCED_PROBE),
+        ("relayed", RELAYED_PROBE),
+        ("unrelayed", UNRELAYED_PROBE),
+    ]
+    assert pool.connections_to_release(connections, now=0) == ["relayed", "synced"]
+
+    pool.touch("node", now=20)
+    pool.touch("unrelayed", now=5)
+    assert pool.connections_to_release(connections[::3], now=40) == ["unrelayed"]
+    assert (pool.evictions, pool.idle_releases) == (2, 1)
+
+    pool.forget("node")
+    assert pool.connections_to_release([("node", NODE)], now=100) == []
+
+    # Connections being opened count towards the size, but only open ones are released.
+    pool.touch("synced", now=100)
+    connections = [("synced", SYNCED_PROBE), ("relayed", RELAYED_PROBE)]
+    assert pool.connections_to_release(connections, now=110, connecting=2) == [
+        "relayed",
+        "synced",
+    ]
+    assert pool.connections_to_release([], now=200, connecting=3) == []
+    assert pool.size == 3
+
+    with pytest.raises(ValueError):
+        ConnectionPool(max_size=0)
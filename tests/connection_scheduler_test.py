@@ -0,0 +1,139 @@
+import asyncio
+
+import pytest
+
+from combustion_ble.connection_scheduler import ConnectionScheduler
+
+
+def test_limits_concurrency_and_orders_by_priority():
+    async def connect_all():
+        scheduler = ConnectionScheduler(max_concurrent=2)
+        release = asyncio.Event()
+        running = 0
+        max_running = 0
+        started: list[str] = []
+
+        def attempt(name: str, connected: bool = True):
+            async def connect():
+                nonlocal running, max_running
+                started.append(name)
+                running += 1
+                max_running = max(max_running, running)
+                await release.wait()
+                running -= 1
+                return connected
+
+            return connect
+
+        tasks = [
+            asyncio.create_task(scheduler.run(attempt("a"), (1, -50))),
+            asyncio.create_task(scheduler.run(attempt("b", connected=False), (1, -50))),
+            asyncio.create_task(scheduler.run(attempt("probe weak"), (1, -40))),
+            asyncio.create_task(scheduler.run(attempt("probe strong"), (1, -70))),
+            asyncio.create_task(scheduler.run(attempt("node"), (0, -30))),
+            asyncio.create_task(scheduler.run(attempt("other adapter"), (), "hci1")),
+        ]
+        await asyncio.sleep(0)
+        assert started == ["a", "b", "other adapter"]
+        assert scheduler.queue_depth == 3
+        assert scheduler.running == 3
+
+        release.set()
+        results = await asyncio.gather(*tasks)
+        return scheduler, started, max_running, results
+
+    scheduler, started, max_running, results = asyncio.run(connect_all())
+
+    assert started[3:] == ["node", "probe strong", "probe weak"]
+    assert max_running == 3
+    assert results == [True, False, True, True, True, True]
+    assert scheduler.queue_depth == 0
+    assert scheduler.running == 0
+    assert scheduler.max_queue_depth == 3
+    assert (scheduler.attempts, scheduler.successes, scheduler.failures) == (6, 5, 1)
+    assert scheduler.mean_time_to_connect is not None
+
+
+def test_cancelled_and_cleared_attempts_release_their_place():
+    async def cancel_and_clear():
+        scheduler = ConnectionScheduler(max_concurrent=1)
+        release = asyncio.Event()
+        started: list[int] = []
+
+        def attempt(number: int):
+            async def connect():
+                started.append(number)
+                await release.wait()
+                return True
+
+            return connect
+
+        running = asyncio.create_task(scheduler.run(attempt(0)))
+        cancelled = asyncio.create_task(scheduler.run(attempt(1)))
+        queued = asyncio.create_task(scheduler.run(attempt(2)))
+        await asyncio.sleep(0)
+        cancelled.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await cancelled
+        assert scheduler.queue_depth == 1
+
+        release.set()
+        await running
+        await queued
+        assert started == [0, 2]
+
+        release.clear()
+        blocking = asyncio.create_task(scheduler.run(attempt(3)))
+        cleared = asyncio.create_task(scheduler.run(attempt(4)))
+        await asyncio.sleep(0)
+        scheduler.clear()
+        assert await cleared is False
+        release.set()
+        await blocking
+        return scheduler, started
+
+    scheduler, started = asyncio.run(cancel_and_clear())
+
+    assert started == [0, 2, 3]
+    assert scheduler.queue_depth == 0
+    assert scheduler.running == 0
+
+
+def test_changing_the_limit():
+    with pytest.raises(ValueError):
+        ConnectionScheduler(max_concurrent=0)
+
+    async def connect_all():
+        scheduler = ConnectionScheduler(max_concurrent=1)
+        release = asyncio.Event()
+        started: list[int] = []
+
+        def attempt(number: int):
+            async def connect():
+                started.append(number)
+                await release.wait()
+                return True
+
+            return connect
+
+        tasks = [asyncio.create_task(scheduler.run(attempt(number))) for number in range(4)]
+        await asyncio.sleep(0)
+        assert (started, scheduler.queue_depth) == ([0], 3)
+
+        with pytest.raises(ValueError):
+            scheduler.max_concurrent = -1
+        assert scheduler.max_concurrent == 1
+
+        # Queued attempts start as soon as the limit is raised.
+        scheduler.max_concurrent = 3
+        await asyncio.sleep(0)
+        assert (started, scheduler.running, scheduler.queue_depth) == ([0, 1, 2], 3, 1)
+
+        # Lowering the limit lets running attempts complete without starting new ones.
+        scheduler.max_concurrent = 1
+        release.set()
+        assert await asyncio.gather(*tasks) == [True] * 4
+        assert started == [0, 1, 2, 3]
+        assert (scheduler.running, scheduler.queue_depth) == (0, 0)
+
+    asyncio.run(connect_all())
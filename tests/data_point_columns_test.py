@@ -0,0 +1,41 @@
+from combustion_ble.data_point_columns import DataPointColumns, encode_data_point
+from combustion_ble.logged_probe_data_count import LoggedProbeDataPoint
+from combustion_ble.uart import LogResponse
+
+# Log response for sequence number 300, including the UART header.
+LOG_RESPONSE = bytes.fromhex(
+    "cafe0000040118" + "2c010000" + "a4c5e02b11f8c1d8ac72cd9ba5" + "8a1b3c0a1f4b02"
+)
+
+
+def data_point(sequence_number: int) -> LoggedProbeDataPoint:
+    data = bytearray(LOG_RESPONSE)
+    data[7:11] = sequence_number.to_bytes(4, "little")
+    return LoggedProbeDataPoint.from_log_response(LogResponse(data, True, 24))
+
+
+def test_round_trip():
+    expected = data_point(300)
+    columns = DataPointColumns()
+    columns.append(encode_data_point(expected))
+
+    point = columns[0]
+    assert point.sequence_num == 300
+    assert point.temperatures.raw_data == expected.temperatures.raw_data
+    for field in LoggedProbeDataPoint._fields[2:]:
+        assert getattr(point, field) == getattr(expected, field), field
+
+
+def test_merge():
+    columns = DataPointColumns()
+    for sequence_number in (2, 5, 6, 9):
+        columns.append(encode_data_point(data_point(sequence_number)))
+
+    rows = [encode_data_point(data_point(n)) for n in (12, 0, 7, 5, 3, 3, 10, 1)]
+    assert columns.merge(rows) == 6
+
+    assert list(columns.sequence_numbers) == [0, 1, 2, 3, 5, 6, 7, 9, 10, 12]
+    assert [point.sequence_num for point in columns] == list(columns.sequence_numbers)
+    assert columns[3].temperatures.raw_data == columns[-1].temperatures.raw_data
+    assert 7 in columns
+    assert 8 not in columns
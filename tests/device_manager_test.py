@@ -0,0 +1,126 @@
+import asyncio
+import time
+from types import SimpleNamespace
+
+from combustion_ble.ble_data.advertising_data import AdvertisingData
+from combustion_ble.ble_manager import BleConnection, BleManager
+from combustion_ble.const import DEVICE_STATUS_CHARACTERISTIC
+from combustion_ble.device_manager import DeviceManager
+from combustion_ble.devices.device import Device
+from combustion_ble.uart import ResponseFramer
+
+PROBE_ADVERTISEMENT = bytes.fromhex("01b10f0010" + "a4c5e02b11f8c1d8ac72cd9ba5" + "0d0240")
+
+
+def test_devices_are_indexed_by_ble_identifier_and_serial_number():
+    async def discover():
+        device_manager = DeviceManager()
+        try:
+            advertising = AdvertisingData.from_bleak_data(PROBE_ADVERTISEMENT)
+            probe = device_manager.update_probe_with_advertising(advertising, True, -60, "A")
+            assert probe is not None
+            assert device_manager.find_device_by_ble_identifier("A") is probe
+            assert device_manager.connection_manager.get_probe_with_serial("10000FB1") is probe
+
+            # The probe is now advertising under a different address.
+            device_manager.update_probe_with_advertising(advertising, True, -60, "B")
+            assert device_manager.find_device_by_ble_identifier("A") is None
+            assert device_manager.find_device_by_ble_identifier("B") is probe
+
+            ble_manager = BleManager.shared
+            ble_manager._adapters["B"] = "hci0"
+            ble_manager._gatt_handles["B"] = {"uuid": 12}
+            ble_manager.advertising_filter.filter("B", PROBE_ADVERTISEMENT)
+            ble_manager.connection_pool.touch("B")
+            device_manager.uart_framers["B"] = ResponseFramer()
+
+            device_manager._remove_devices([probe])
+            assert device_manager.find_device_by_ble_identifier("B") is None
+            assert device_manager.connection_manager.get_probe_with_serial("10000FB1") is None
+            assert "B" not in device_manager.uart_framers
+            assert "B" not in ble_manager._adapters
+            assert "B" not in ble_manager._gatt_handles
+            assert "B" not in ble_manager.connection_pool._last_activity
+            assert len(ble_manager.advertising_filter) == 0
+        finally:
+            await device_manager.async_stop()
+            DeviceManager.shared = None
+
+    asyncio.run(discover())
+
+
+class FakeClient:
+    def __init__(self) -> None:
+        self.is_connected = True
+
+    async def disconnect(self):
+        self.is_connected = False
+
+
+def test_connection_pool_keeps_devices_streaming_status():
+    async def stream_status():
+        device_manager = DeviceManager()
+        ble_manager = BleManager.shared
+        try:
+            advertising = AdvertisingData.from_bleak_data(PROBE_ADVERTISEMENT)
+            probe = device_manager.update_probe_with_advertising(advertising, True, -60, "A")
+            assert probe is not None
+            probe.maintaining_connection = True
+            probe._update_connection_state(Device.ConnectionState.CONNECTED)
+            client = FakeClient()
+            ble_manager.connections["A"] = BleConnection(client)  # type: ignore[arg-type]
+            pool = device_manager.configure_connection_pool(idle_timeout=60)
+
+            # Only status notifications are received: the connection is not idle.
+            pool.touch("A", time.monotonic() - 120)
+            status = SimpleNamespace(uuid=DEVICE_STATUS_CHARACTERISTIC)
+            ble_manager._notification_callback("A")(status, bytearray(4))  # type: ignore[arg-type]
+            assert pool.connections_to_release(device_manager._pooled_connections()[0]) == []
+
+            # A released device is disconnected, and reconnects through its reconnect policy.
+            pool.touch("A", time.monotonic() - 120)
+            assert pool.connections_to_release(device_manager._pooled_connections()[0]) == ["A"]
+            await device_manager._release_connection("A")
+            assert not client.is_connected
+            ble_manager.disconnected_callback("A")(client)
+            assert probe.connection_state == Device.ConnectionState.DISCONNECTED
+            assert probe.maintaining_connection
+            assert probe._reconnect_task is not None
+        finally:
+            await device_manager.async_stop()
+            ble_manager.connections.clear()
+            ble_manager.connection_pool.idle_timeout = None
+            DeviceManager.shared = None
+
+    asyncio.run(stream_status())
+
+
+def test_connection_pool_leaves_queued_connections_alone():
+    async def queue_connection():
+        device_manager = DeviceManager()
+        pool = device_manager.configure_connection_pool(max_size=1, idle_timeout=60)
+        try:
+            advertising = AdvertisingData.from_bleak_data(PROBE_ADVERTISEMENT)
+            probe = device_manager.update_probe_with_advertising(advertising, True, -60, "A")
+            assert probe is not None
+            probe.maintaining_connection = True
+            probe._update_connection_state(Device.ConnectionState.CONNECTING)
+
+            # Queued by the connection scheduler for longer than the idle timeout.
+            pool.touch("A", time.monotonic() - 120)
+            assert device_manager._pooled_connections() == ([], 1)
+            released = (pool.idle_releases, pool.evictions)
+            device_manager._apply_connection_pool()
+            assert (pool.idle_releases, pool.evictions) == released
+            assert pool.size == 1
+
+            # A connection being opened is not evicted for another one.
+            assert pool.admit((True, True, True, -30), []) == (True, None)
+            assert pool.admit((True, True, True, -30), [], connecting=1) == (False, None)
+        finally:
+            await device_manager.async_stop()
+            pool.max_size = pool.idle_timeout = None
+            pool.clear()
+            DeviceManager.shared = None
+
+    asyncio.run(queue_connection())
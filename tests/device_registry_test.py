@@ -0,0 +1,100 @@
+import asyncio
+import json
+import time
+
+from combustion_ble.ble_data.advertising_data import CombustionProductType
+from combustion_ble.ble_manager import BleManager
+from combustion_ble.device_manager import DeviceManager
+from combustion_ble.device_registry import DeviceRecord, DeviceRegistry
+from combustion_ble.devices.meat_net_node import MeatNetNode
+from combustion_ble.devices.probe import Probe
+
+
+def test_registry_round_trip_drops_expired_records(tmp_path):
+    path = str(tmp_path / "devices.json")
+    now = time.time()
+    registry = DeviceRegistry(path, max_age=3600)
+    assert registry.load() == []
+
+    records = [
+        DeviceRecord(CombustionProductType.PROBE, "1", "A", firmware_version="v1", last_seen=now),
+        DeviceRecord(CombustionProductType.PROBE, "2", "B", last_seen=now - 7200),
+    ]
+    assert registry.save(records)
+    assert not registry.save(records)
+    assert registry.saves == 1
+
+    loaded = DeviceRegistry(path, max_age=3600).load(now)
+    assert [(record.unique_identifier, record.firmware_version) for record in loaded] == [
+        ("1", "v1")
+    ]
+    assert loaded[0].product_type == CombustionProductType.PROBE
+
+
+def test_unreadable_registry_is_empty(tmp_path):
+    path = tmp_path / "devices.json"
+    path.write_text("{")
+    assert DeviceRegistry(str(path)).load() == []
+    path.write_text(json.dumps({"version": 0, "devices": []}))
+    assert DeviceRegistry(str(path)).load() == []
+
+
+def test_device_manager_restores_devices_from_registry(tmp_path):
+    path = str(tmp_path / "devices.json")
+    now = time.time()
+    DeviceRegistry(path).save(
+        [
+            DeviceRecord(
+                CombustionProductType.MEAT_NET_NODE,
+                "N",
+                "N",
+                serial_number="ABC",
+                firmware_version="v2",
+                gatt_handles={"uuid": 12},
+                last_seen=now,
+            ),
+            DeviceRecord(
+                CombustionProductType.PROBE,
+                "268439473",
+                firmware_version="v1",
+                session_id=7,
+                sample_period=1000,
+                best_route="N",
+                last_seen=now - 2 * DeviceRegistry.DEFAULT_METADATA_MAX_AGE,
+            ),
+        ]
+    )
+
+    async def restart():
+        device_manager = DeviceManager()
+        try:
+            device_manager.enable_meatnet()
+            added = []
+            device_manager.add_device_listener(lambda devices, _: added.extend(devices))
+            registry = device_manager.configure_device_registry(path)
+            assert registry.loaded == 2
+
+            node = device_manager.find_device_by_ble_identifier("N")
+            assert isinstance(node, MeatNetNode)
+            assert (node.serial_number_string, node.firmware_version) == ("ABC", "v2")
+            assert BleManager.shared._gatt_handles["N"] == {"uuid": 12}
+
+            probe = device_manager.connection_manager.get_probe_with_serial("10000FB1")
+            assert isinstance(probe, Probe)
+            assert node.has_connection_to_probe(probe.serial_number)
+            # The probe's information is too old to be trusted, and is read again.
+            assert probe.firmware_version is None
+            assert probe._session_information is None
+            assert added == [node, probe]
+
+            probe.firmware_version = "v3"
+            device_manager._save_device_registry()
+            records = {record.unique_identifier: record for record in DeviceRegistry(path).load()}
+            assert records["268439473"].firmware_version == "v3"
+            assert records["268439473"].best_route == "N"
+        finally:
+            await device_manager.async_stop()
+            DeviceManager.shared = None
+            BleManager.shared._gatt_handles.clear()
+
+    asyncio.run(restart())
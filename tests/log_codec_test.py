@@ -0,0 +1,44 @@
+import pytest
+
+from combustion_ble.ble_data.probe_temperatures import ProbeTemperatures
+from combustion_ble.data_point_columns import DataPointColumns
+from combustion_ble.log_codec import decode_columns, encode_columns
+
+
+def columns(count: int) -> tuple:
+    result = DataPointColumns()
+    for index in range(count):
+        sequence_number = index * 2 if index < count // 2 else index + 5000
+        temperatures = ProbeTemperatures.from_values(
+            [20.0 + (index * (sensor + 3)) % 41 * 0.05 for sensor in range(8)]
+        )
+        result.append(
+            (
+                sequence_number,
+                temperatures.raw_data,
+                index // 100 % 256,
+                0x21 if index < 10 else 0x52,
+                1000 + index // 500,
+                max(3600 - index, 0),
+                round(50 + index * 0.7) % 2048,
+            )
+        )
+    return result.raw_columns(0, count)
+
+
+def test_round_trip():
+    original = columns(1000)
+    encoded = encode_columns(original)
+    assert decode_columns(encoded) == original
+    assert len(encoded) < len(original[1])
+
+
+def test_empty():
+    original = columns(0)
+    assert decode_columns(encode_columns(original)) == original
+
+
+def test_truncated_segment():
+    encoded = encode_columns(columns(100))
+    with pytest.raises(ValueError):
+        decode_columns(encoded[: len(encoded) // 2])
@@ -0,0 +1,121 @@
+import io
+from datetime import datetime, timedelta
+
+import pytest
+
+from combustion_ble import log_export
+from combustion_ble.probe_temperature_log import ProbeTemperatureLog
+from combustion_ble.uart import SessionInformation
+from tests.data_point_columns_test import data_point
+
+
+def new_log() -> ProbeTemperatureLog:
+    log = ProbeTemperatureLog(SessionInformation(session_id=1, sample_period=2000))
+    for sequence_number in range(100):
+        log.append_data_point(data_point(sequence_number))
+    return log
+
+
+def test_export_csv():
+    log = new_log()
+    file = io.StringIO()
+    assert log_export.export_csv(log, file, chunk_size=30) == 100
+
+    lines = file.getvalue().splitlines()
+    assert lines[0].split(",") == list(log_export.EXPORT_FIELDS)
+    assert len(lines) == 101
+
+    point = log[10]
+    assert log.start_time is not None
+    fields = dict(zip(log_export.EXPORT_FIELDS, lines[11].split(",")))
+    assert fields["sequence_number"] == "10"
+    assert float(fields["timestamp"]) == pytest.approx(log.start_time.timestamp() + 20, abs=1e-3)
+    assert [float(fields[field]) for field in log_export.TEMPERATURE_FIELDS] == pytest.approx(
+        point.temperatures.values
+    )
+    assert int(fields["virtual_core"]) == point.virtual_core.sensor_number()
+    assert int(fields["prediction_state"]) == point.prediction_state.value
+    assert float(fields["estimated_core_temperature"]) == pytest.approx(
+        point.estimated_core_temperature
+    )
+
+
+def test_export_csv_time_range():
+    log = new_log()
+    assert log.start_time is not None
+    file = io.StringIO()
+    start = log.start_time + timedelta(seconds=9)
+    end = log.start_time + timedelta(seconds=20)
+    assert log_export.export_csv(log, file, start, end) == 6
+    assert [line.split(",")[0] for line in file.getvalue().splitlines()[1:]] == [
+        str(sequence_number) for sequence_number in range(5, 11)
+    ]
+
+
+def test_to_numpy():
+    pytest.importorskip("numpy")
+    log = new_log()
+    array = log_export.to_numpy(log)
+    assert len(array) == 100
+    assert array["sequence_number"].tolist() == list(range(100))
+
+    point = log[42]
+    assert [array[42][field] for field in log_export.TEMPERATURE_FIELDS] == pytest.approx(
+        point.temperatures.values
+    )
+    assert array[42]["virtual_surface"] == point.virtual_surface.sensor_number()
+    assert array[42]["prediction_value_seconds"] == point.prediction_value_seconds
+
+
+def restored_log() -> ProbeTemperatureLog:
+    log = ProbeTemperatureLog(SessionInformation(session_id=1, sample_period=2000))
+    log.restore(new_log().columns.rows())
+    return log
+
+
+def test_export_log_without_start_time():
+    log = restored_log()
+    assert log.start_time is None
+
+    file = io.StringIO()
+    assert log_export.export_csv(log, file) == 100
+    fields = dict(zip(log_export.EXPORT_FIELDS, file.getvalue().splitlines()[11].split(",")))
+    assert (fields["sequence_number"], fields["timestamp"]) == ("10", "")
+
+    array = log_export.to_numpy(log)
+    assert list(array["sequence_number"]) == list(range(100))
+    assert all(array["timestamp"] != array["timestamp"])
+
+    # A time range cannot be located without the start time.
+    with pytest.raises(ValueError):
+        log_export.export_csv(log, io.StringIO(), start=datetime.now())
+
+
+@pytest.mark.parametrize("format", ["ipc", "parquet"])
+def test_export_arrow(tmp_path, format):
+    pa = pytest.importorskip("pyarrow")
+    path = str(tmp_path / f"log.{format}")
+
+    def read():
+        if format == "ipc":
+            return pa.ipc.open_file(path).read_all()
+        import pyarrow.parquet as pq
+
+        return pq.read_table(path)
+
+    log = new_log()
+    assert log_export.export_arrow(log, path, format=format, chunk_size=30) == 100
+    table = read()
+    assert table.column_names == list(log_export.EXPORT_FIELDS)
+    assert table.column("sequence_number").to_pylist() == list(range(100))
+    assert log.start_time is not None
+    assert table.column("timestamp")[10].as_py() == pytest.approx(
+        log.start_time.timestamp() + 20, abs=1e-3
+    )
+    assert [table.column(field)[42].as_py() for field in log_export.TEMPERATURE_FIELDS] == (
+        pytest.approx(log[42].temperatures.values)
+    )
+
+    # Unknown timestamps are written as nulls.
+    assert log_export.export_arrow(restored_log(), path, format=format) == 100
+    assert read().column("timestamp").null_count == 100
@@ -0,0 +1,63 @@
+import random
+
+import pytest
+
+from combustion_ble import log_records
+from combustion_ble.data_point_columns import encode_data_point
+from combustion_ble.log_records import (
+    LOG_RECORD_LENGTH,
+    decode_log_record,
+    decode_log_records,
+)
+from combustion_ble.logged_probe_data_count import LoggedProbeDataPoint
+from combustion_ble.probe_temperature_log import ProbeTemperatureLog
+from combustion_ble.uart import LogResponse, SessionInformation
+
+HEADER = bytes.fromhex("cafe0000040118")
+
+
+def records(count: int, seed: int = 0) -> list[bytes]:
+    rng = random.Random(seed)
+    return [
+        sequence_number.to_bytes(4, "little") + rng.randbytes(LOG_RECORD_LENGTH - 4)
+        for sequence_number in range(count)
+    ]
+
+
+def test_decode_log_record_matches_log_response():
+    for record in records(2000):
+        response = LogResponse(HEADER + record, True, 24)
+        assert response.log_record == record
+        assert decode_log_record(record) == encode_data_point(
+            LoggedProbeDataPoint.from_log_response(response)
+        )
+
+
+def test_decode_log_records_numpy_matches_per_record():
+    pytest.importorskip("numpy")
+    batch = records(1000, seed=1)
+    assert log_records._decode_log_records_numpy(b"".join(batch)) == [
+        decode_log_record(record) for record in batch
+    ]
+    assert decode_log_records(batch) == decode_log_records(batch[:10]) + decode_log_records(
+        batch[10:]
+    )
+
+
+def test_decode_log_records_rejects_partial_record():
+    with pytest.raises(ValueError):
+        decode_log_records([bytes(LOG_RECORD_LENGTH - 1)])
+
+
+def test_insert_log_records():
+    log = ProbeTemperatureLog(SessionInformation(session_id=1, sample_period=1000))
+    batch = records(600, seed=2)
+    log.insert_log_records(
+        (int.from_bytes(record[:4], "little"), record) for record in reversed(batch)
+    )
+
+    assert log.log_record_accumulator == {}
+    assert log.missing_range(0, 599) is None
+    assert [encode_data_point(data_point) for data_point in log.data_points] == [
+        decode_log_record(record) for record in batch
+    ]
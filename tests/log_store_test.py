@@ -0,0 +1,148 @@
+import asyncio
+import os
+
+import pytest
+
+from combustion_ble.data_point_columns import encode_data_point
+from combustion_ble.log_store import (
+    LogStore,
+    LogStoreWriter,
+    SegmentLogStore,
+    SQLiteLogStore,
+)
+from combustion_ble.probe_temperature_log import ProbeTemperatureLog
+from combustion_ble.uart import SessionInformation
+from tests.data_point_columns_test import data_point
+
+SERIAL_NUMBER = 0x10001234
+SESSION = SessionInformation(session_id=7, sample_period=1000)
+
+
+def test_restore_log_from_sqlite(tmp_path):
+    path = str(tmp_path / "logs.sqlite")
+
+    async def record():
+        writer = LogStoreWriter(SQLiteLogStore(path))
+        log = ProbeTemperatureLog(SESSION, SERIAL_NUMBER, writer)
+        log.append_data_point(data_point(500))
+        log.insert_data_points(data_point(n) for n in range(100, 200))
+        log.insert_accumulated_data_points()
+        await writer.close()
+        return writer.rows_written
+
+    assert asyncio.run(record()) == 101
+
+    async def restore():
+        writer = LogStoreWriter(SQLiteLogStore(path))
+        assert await writer.sessions(SERIAL_NUMBER) == [SESSION.session_id]
+        log = ProbeTemperatureLog(SESSION, SERIAL_NUMBER, writer)
+        log.restore(await writer.load(SERIAL_NUMBER, SESSION.session_id))
+        await writer.close()
+        return log, writer.rows_written
+
+    log, rows_written = asyncio.run(restore())
+    assert rows_written == 0
+    assert log.synced_count == 101
+    assert log.missing_range(0, 500) == (0, 499)
+    assert log.missing_range(100, 500) == (200, 499)
+    assert log[0].temperatures.raw_data == data_point(100).temperatures.raw_data
+
+
+def test_restore_log_from_segment_files(tmp_path):
+    directory = str(tmp_path / "logs")
+    store = SegmentLogStore(directory)
+    store.COMPACT_SEGMENTS = 4
+
+    async def record():
+        writer = LogStoreWriter(store)
+        log = ProbeTemperatureLog(SESSION, SERIAL_NUMBER, writer)
+        for sequence_number in range(200, 210):
+            log.append_data_point(data_point(sequence_number))
+            await writer.flush()
+        log.insert_data_points(data_point(n) for n in range(0, 100))
+        log.insert_accumulated_data_points()
+        await writer.close()
+
+    asyncio.run(record())
+    # Ten live segments and one backfill segment, compacted every four segments.
+    assert store.sessions(SERIAL_NUMBER) == [SESSION.session_id]
+    assert store.sessions(SERIAL_NUMBER + 1) == []
+
+    log = ProbeTemperatureLog(SESSION, SERIAL_NUMBER)
+    log.restore(SegmentLogStore(directory).load(SERIAL_NUMBER, SESSION.session_id))
+    assert log.synced_count == 110
+    assert log.missing_range(0, 209) == (100, 199)
+    assert log[-1].temperatures.raw_data == data_point(209).temperatures.raw_data
+
+
+def test_segment_compaction_survives_failures_and_restarts(tmp_path, monkeypatch):
+    directory = str(tmp_path / "logs")
+    path = os.path.join(directory, f"{SERIAL_NUMBER:08X}-{SESSION.session_id:08X}.seg")
+
+    def write(store, sequence_number):
+        row = encode_data_point(data_point(sequence_number))
+        store.write({(SERIAL_NUMBER, SESSION.session_id): (SESSION.sample_period, [row])})
+
+    def stored():
+        return [
+            row[0] for row in SegmentLogStore(directory).load(SERIAL_NUMBER, SESSION.session_id)
+        ]
+
+    def segments():
+        with open(path, "rb") as file:
+            return len(SegmentLogStore(directory)._segment_offsets(file)[0])
+
+    store = SegmentLogStore(directory)
+    store.COMPACT_SEGMENTS = 4
+    for sequence_number in range(3):
+        write(store, sequence_number)
+
+    def fail(*args):
+        raise OSError("disk full")
+
+    # A failed compaction leaves the written segments untouched.
+    with monkeypatch.context() as patch:
+        patch.setattr(os, "replace", fail)
+        with pytest.raises(OSError):
+            write(store, 3)
+    assert stored() == [0, 1, 2, 3]
+    assert segments() == 4
+
+    # After a restart, segments already in the file count towards the next compaction, and a
+    # segment cut short by a crash is dropped.
+    with open(path, "ab") as file:
+        file.write(b"\x40partial")
+    store = SegmentLogStore(directory)
+    store.COMPACT_SEGMENTS = 6
+    write(store, 4)
+    assert segments() == 5
+    write(store, 5)
+    assert segments() == 1
+    assert stored() == [0, 1, 2, 3, 4, 5]
+
+
+def test_segment_after_a_partial_first_segment(tmp_path):
+    directory = str(tmp_path / "logs")
+    store = SegmentLogStore(directory)
+    row = encode_data_point(data_point(0))
+    store.write({(SERIAL_NUMBER, SESSION.session_id): (SESSION.sample_period, [row])})
+    path = os.path.join(directory, f"{SERIAL_NUMBER:08X}-{SESSION.session_id:08X}.seg")
+    with open(path, "r+b") as file:
+        file.truncate(os.path.getsize(path) - 3)
+
+    # The partial segment is dropped, and the new one is compacted from where it was written.
+    store = SegmentLogStore(directory)
+    store.COMPACT_SEGMENTS = 1
+    row = encode_data_point(data_point(1))
+    store.write({(SERIAL_NUMBER, SESSION.session_id): (SESSION.sample_period, [row])})
+    rows = SegmentLogStore(directory).load(SERIAL_NUMBER, SESSION.session_id)
+    assert [row[0] for row in rows] == [1]
+
+
+def test_log_stores_must_implement_storage():
+    class IncompleteStore(LogStore):
+        def sessions(self, serial_number: int) -> list[int]:
+            return []
+
+    with pytest.raises(TypeError):
+        IncompleteStore()  # type: ignore[abstract]
@@ -0,0 +1,189 @@
+import asyncio
+from typing import Any, Optional
+
+import pytest
+
+from combustion_ble.log_stream import LogStream, LogStreamOverflowError, OverflowPolicy
+from combustion_ble.probe_temperature_log import LogsUpdate, ProbeTemperatureLog
+from combustion_ble.uart import SessionInformation
+from combustion_ble.utilities.monitor import Monitorable
+from tests.data_point_columns_test import data_point
+
+
+class FakeProbe:
+    """The parts of a Probe that a LogStream uses."""
+
+    def __init__(self) -> None:
+        self._temperature_logs: dict[int, ProbeTemperatureLog] = {}
+        self._logs_updated: Monitorable[Optional[LogsUpdate]] = Monitorable(None)
+        self.session_id: Optional[int] = None
+
+    def start_session(self, session_id: int) -> ProbeTemperatureLog:
+        log = ProbeTemperatureLog(SessionInformation(session_id=session_id, sample_period=1000))
+        log.add_logs_updated_listener(self._logs_updated.update)
+        self._temperature_logs[session_id] = log
+        self.session_id = session_id
+        return log
+
+    def _get_current_temperature_log(self) -> Optional[ProbeTemperatureLog]:
+        return self._temperature_logs.get(self.session_id) if self.session_id is not None else None
+
+    def add_logs_updated_listener(self, listener):
+        return self._logs_updated.add_update_listener(listener)
+
+
+async def take(stream: LogStream, count: int) -> list:
+    return [await asyncio.wait_for(stream.__anext__(), 1) for _ in range(count)]
+
+
+async def wait_idle(stream: LogStream) -> None:
+    """Wait until the stream has yielded everything in the log, and waits for live data points."""
+    with pytest.raises(asyncio.TimeoutError):
+        await asyncio.wait_for(stream.__anext__(), 0.01)
+
+
+def test_history_then_live_then_resume():
+    async def run():
+        probe: Any = FakeProbe()
+        log = probe.start_session(3)
+        for sequence_number in range(10):
+            log.append_data_point(data_point(sequence_number))
+
+        stream = LogStream(probe, since_sequence=4)
+        items = await take(stream, 3)
+        # Appended while the history is being read.
+        log.append_data_point(data_point(10))
+        items += await take(stream, 3)
+        assert [item.sequence_number for item in items] == [5, 6, 7, 8, 9, 10]
+
+        log.append_data_point(data_point(11))
+        (item,) = await take(stream, 1)
+        assert (item.sequence_number, item.resume_token) == (11, "3:11")
+        token = item.resume_token
+
+        # Data points are yielded as they are added to the log, and backfilled data points below
+        # the start position are skipped.
+        await wait_idle(stream)
+        log.append_data_point(data_point(20))
+        log.insert_data_points(data_point(n) for n in (0, 1, 12, 13, 14))
+        log.insert_accumulated_data_points()
+        items = await take(stream, 4)
+        assert [item.sequence_number for item in items] == [12, 13, 14, 20]
+        log.insert_data_points(data_point(n) for n in (16, 15))
+        log.insert_accumulated_data_points()
+        items = await take(stream, 2)
+        assert [item.sequence_number for item in items] == [15, 16]
+        # 17 to 19 were not yielded yet.
+        assert items[-1].resume_token == "3:20:17-19"
+        stream.close()
+        with pytest.raises(StopAsyncIteration):
+            await stream.__anext__()
+
+        resumed = LogStream(probe, resume_token=token)
+        items = await take(resumed, 6)
+        assert [item.sequence_number for item in items] == [12, 13, 14, 15, 16, 20]
+        resumed.close()
+
+    asyncio.run(run())
+
+
+def test_resume_yields_data_points_backfilled_below_the_cursor():
+    async def run():
+        probe: Any = FakeProbe()
+        log = probe.start_session(3)
+        log.append_data_point(data_point(10))
+        log.append_data_point(data_point(11))
+
+        async with LogStream(probe) as stream:
+            items = await take(stream, 2)
+            log.insert_data_points(data_point(n) for n in (0, 1))
+            log.insert_accumulated_data_points()
+            items += await take(stream, 1)
+        assert [item.sequence_number for item in items] == [10, 11, 0]
+        assert items[-1].resume_token == "3:11:1-9"
+        with pytest.raises(StopAsyncIteration):
+            await stream.__anext__()
+
+        # 1 was queued when the stream stopped, and 2 to 9 are backfilled afterwards.
+        log.insert_data_points(data_point(n) for n in range(2, 10))
+        log.insert_accumulated_data_points()
+        resumed = LogStream(probe, resume_token=items[-1].resume_token)
+        items = await take(resumed, 9)
+        assert [item.sequence_number for item in items] == list(range(1, 10))
+        assert items[-1].resume_token == "3:11"
+        await wait_idle(resumed)
+        await resumed.aclose()
+
+        with pytest.raises(ValueError):
+            LogStream(probe, resume_token="3:11:9-12")
+
+    asyncio.run(run())
+
+
+def test_abandoned_streams_stop_listening():
+    async def run():
+        probe: Any = FakeProbe()
+        log = probe.start_session(1)
+        log.append_data_point(data_point(0))
+
+        async def consume():
+            async for item in LogStream(probe):
+                assert item.sequence_number == 0
+                break
+
+        await consume()
+        assert len(probe._logs_updated._listeners) == 1
+        log.append_data_point(data_point(1))
+        assert len(probe._logs_updated._listeners) == 0
+
+    asyncio.run(run())
+
+
+async def live_stream(probe: Any, overflow: OverflowPolicy) -> LogStream:
+    stream = LogStream(probe, max_queue=2, overflow=overflow)
+    await take(stream, 1)
+    await wait_idle(stream)
+    return stream
+
+
+def test_overflow_policies():
+    async def run():
+        probe: Any = FakeProbe()
+        log = probe.start_session(1)
+        log.append_data_point(data_point(0))
+
+        streams = {policy: await live_stream(probe, policy) for policy in OverflowPolicy}
+        for sequence_number in range(1, 6):
+            log.append_data_point(data_point(sequence_number))
+
+        stream = streams[OverflowPolicy.DROP_OLDEST]
+        assert [item.sequence_number for item in await take(stream, 2)] == [4, 5]
+        assert stream.dropped == 3
+
+        stream = streams[OverflowPolicy.DROP_NEWEST]
+        assert [item.sequence_number for item in await take(stream, 2)] == [1, 2]
+
+        stream = streams[OverflowPolicy.RAISE]
+        with pytest.raises(LogStreamOverflowError) as error:
+            await stream.__anext__()
+        resumed = LogStream(probe, resume_token=error.value.resume_token)
+        assert [item.sequence_number for item in await take(resumed, 5)] == [1, 2, 3, 4, 5]
+
+    asyncio.run(run())
+
+
+def test_follows_new_session():
+    async def run():
+        probe: Any = FakeProbe()
+        log = probe.start_session(1)
+        log.append_data_point(data_point(7))
+        stream = LogStream(probe)
+        await take(stream, 1)
+
+        log = probe.start_session(2)
+        log.append_data_point(data_point(0))
+        log.append_data_point(data_point(1))
+        items = await take(stream, 2)
+        assert [(item.session_id, item.sequence_number) for item in items] == [(2, 0), (2, 1)]
+
+    asyncio.run(run())
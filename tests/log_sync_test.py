@@ -0,0 +1,95 @@
+import asyncio
+
+from combustion_ble.log_sync import LogSync
+from combustion_ble.probe_temperature_log import ProbeTemperatureLog
+from combustion_ble.uart import SessionInformation
+from tests.data_point_columns_test import data_point
+
+
+def new_log() -> ProbeTemperatureLog:
+    log = ProbeTemperatureLog(SessionInformation(session_id=1, sample_period=1000))
+    log.append_data_point(data_point(1000))
+    return log
+
+
+def test_window_of_chunk_requests():
+    async def sync():
+        requests: list[tuple[int, int]] = []
+
+        async def request_logs(min_sequence: int, max_sequence: int):
+            requests.append((min_sequence, max_sequence))
+
+        log = new_log()
+        log_sync = LogSync(request_logs)
+        log.add_logs_updated_listener(log_sync.logs_updated)
+
+        log_sync.update(log, 0, 1000)
+        log_sync.update(log, 0, 1000)
+        await asyncio.sleep(0)
+        assert requests == [(0, 127), (128, 255)]
+
+        # Answering the first chunk completes it, and frees a slot in the window.
+        log.insert_data_points(data_point(n) for n in range(0, 128))
+        log.insert_accumulated_data_points()
+        await asyncio.sleep(0)
+        assert requests[2:] == [(256, 383)]
+        assert log_sync.window > LogSync.INITIAL_WINDOW
+        assert log_sync.in_flight == 2
+        assert log_sync.progress.synced == 129
+        assert log_sync.progress.total == 1001
+
+    asyncio.run(sync())
+
+
+def test_timed_out_chunks_are_retried_then_abandoned():
+    async def sync():
+        requests: list[tuple[int, int]] = []
+
+        async def request_logs(min_sequence: int, max_sequence: int):
+            requests.append((min_sequence, max_sequence))
+
+        log = new_log()
+        log.insert_data_points(data_point(n) for n in range(0, 100))
+        log.insert_accumulated_data_points()
+
+        log_sync = LogSync(request_logs)
+        log_sync.REQUEST_TIMEOUT = 0
+        log_sync.INITIAL_WINDOW = 1
+        log_sync.reset()
+        for _ in range(LogSync.MAX_ATTEMPTS + 1):
+            log_sync.update(log, 0, 127)
+        await asyncio.sleep(0)
+
+        # Retries only ask for the records that are still missing.
+        assert requests == [(100, 127)] * LogSync.MAX_ATTEMPTS
+        assert log_sync.timeouts == LogSync.MAX_ATTEMPTS
+        assert log_sync.in_flight == 0
+
+    asyncio.run(sync())
+
+
+def test_abandoned_chunks_are_requested_again_after_reconnecting():
+    async def sync():
+        requests: list[tuple[int, int]] = []
+
+        async def request_logs(min_sequence: int, max_sequence: int):
+            requests.append((min_sequence, max_sequence))
+
+        log = new_log()
+        log_sync = LogSync(request_logs)
+        log_sync.REQUEST_TIMEOUT = 0
+        log_sync.INITIAL_WINDOW = 1
+        log_sync.reset()
+        for _ in range(LogSync.MAX_ATTEMPTS + 2):
+            log_sync.update(log, 0, 127)
+        await asyncio.sleep(0)
+        assert requests == [(0, 127)] * LogSync.MAX_ATTEMPTS
+
+        # The outage is over: the chunk is requested again, with a fresh set of attempts.
+        log_sync.reconnected()
+        log_sync.update(log, 0, 127)
+        await asyncio.sleep(0)
+        assert requests[LogSync.MAX_ATTEMPTS :] == [(0, 127)]
+        assert log_sync.in_flight == 1
+
+    asyncio.run(sync())
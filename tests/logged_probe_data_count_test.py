@@ -0,0 +1,38 @@
+import tracemalloc
+
+from combustion_ble.logged_probe_data_count import LoggedProbeDataPoint
+from combustion_ble.uart import LogResponse
+
+# Log response for sequence number 300, including the UART header.
+LOG_RESPONSE = bytes.fromhex(
+    "cafe0000040118" + "2c010000" + "a4c5e02b11f8c1d8ac72cd9ba5" + "8a1b3c0a1f4b02"
+)
+
+POINT_COUNT = 2000
+
+MAX_BYTES_PER_POINT = 384
+
+
+def test_from_log_response():
+    point = LoggedProbeDataPoint.from_log_response(LogResponse(LOG_RESPONSE, True, 24))
+    assert point.sequence_num == 300
+    assert len(point.temperatures.values) == 8
+    assert point == LoggedProbeDataPoint(sequence_num=300)
+
+
+def test_memory_per_logged_data_point():
+    tracemalloc.start()
+    try:
+        before = tracemalloc.take_snapshot()
+        points = [
+            LoggedProbeDataPoint.from_log_response(LogResponse(LOG_RESPONSE, True, 24))
+            for _ in range(POINT_COUNT)
+        ]
+        after = tracemalloc.take_snapshot()
+    finally:
+        tracemalloc.stop()
+
+    # Includes the temperatures and predictions that each data point keeps alive.
+    allocated = sum(stat.size_diff for stat in after.compare_to(before, "filename"))
+    assert len(points) == POINT_COUNT
+    assert allocated / POINT_COUNT < MAX_BYTES_PER_POINT
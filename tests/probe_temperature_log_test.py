@@ -0,0 +1,108 @@
+import asyncio
+from datetime import timedelta
+
+from combustion_ble.probe_temperature_log import ProbeTemperatureLog
+from combustion_ble.uart import SessionInformation
+from tests.data_point_columns_test import data_point
+
+
+def test_insert_data_points_publishes_one_update_per_batch():
+    async def backfill():
+        log = ProbeTemperatureLog(SessionInformation(session_id=1, sample_period=1000))
+        log.ACCUMULATOR_STABILIZATION_TIME = 0.01
+        log.append_data_point(data_point(100))
+
+        updates: list = []
+        log.add_logs_updated_listener(updates.append)
+        updates.clear()
+
+        log.insert_data_points(data_point(n) for n in range(50, 60))
+        log.insert_data_points(data_point(n) for n in range(0, 50))
+        assert updates == []
+        assert log.missing_range(0, 100) == (0, 99)
+
+        await asyncio.sleep(0.05)
+        assert log.accumulator_timer is None
+        return log, updates
+
+    log, updates = asyncio.run(backfill())
+
+    assert len(updates) == 1
+    assert (updates[0].count, updates[0].min_sequence_number) == (60, 0)
+    assert updates[0].max_sequence_number == 59
+    assert log.synced_count == 61
+    assert log.missing_range(0, 100) == (60, 99)
+    assert [point.sequence_num for point in log.data_points] == [*range(60), 100]
+
+
+def test_insert_data_points_without_event_loop():
+    log = ProbeTemperatureLog(SessionInformation(session_id=1, sample_period=1000))
+    log.insert_data_points(data_point(n) for n in (3, 1, 2))
+    assert log.newest_sequence_number == 3
+    assert log.missing_range(0, 3) == (0, 0)
+
+
+def test_seal():
+    log = ProbeTemperatureLog(SessionInformation(session_id=1, sample_period=1000))
+    for sequence_number in range(100):
+        log.append_data_point(data_point(sequence_number))
+    expected = log.data_points
+
+    log.seal()
+    assert log.sealed
+    assert 0 < log.sealed_size < 100 * 13
+
+    log.append_data_point(data_point(100))
+    assert not log.sealed
+    assert [point.sequence_num for point in log.data_points] == list(range(101))
+    assert log[50].temperatures.raw_data == expected[50].temperatures.raw_data
+
+
+def test_reading_a_sealed_log_keeps_it_sealed():
+    log = ProbeTemperatureLog(SessionInformation(session_id=1, sample_period=1000))
+    for sequence_number in range(100):
+        log.append_data_point(data_point(sequence_number))
+    log.seal()
+    sealed_size = log.sealed_size
+
+    assert [point.sequence_num for point in log.data_points] == list(range(100))
+    assert log.sealed
+    assert log.nbytes > sealed_size
+
+    # Sealing again drops the decompressed copy.
+    log.seal()
+    assert log.nbytes == log.sealed_size == sealed_size
+    assert log[99].sequence_num == 99
+
+
+def test_time_range_queries():
+    log = ProbeTemperatureLog(SessionInformation(session_id=1, sample_period=2000))
+    for sequence_number in range(100, 200):
+        log.append_data_point(data_point(sequence_number))
+    assert log.start_time is not None
+    assert log.timestamp_of(150) == log.start_time + timedelta(seconds=300)
+
+    view = log.points_between(log.start_time + timedelta(seconds=299), log.timestamp_of(160))
+    assert (view.min_sequence_number, view.max_sequence_number) == (150, 160)
+    assert len(view) == 11
+    assert view[0].sequence_num == 150
+    assert view[-1].sequence_num == 160
+    assert [point.sequence_num for point in view[2:5]] == [152, 153, 154]
+
+    latest = log.latest(10)
+    assert [point.sequence_num for point in latest] == list(range(190, 200))
+    assert len(log.latest(500)) == 100
+    assert len(log.latest(0)) == 0
+
+    # Views read the log when accessed, so backfilled data points are included.
+    view = log.points_between(log.start_time, log.timestamp_of(99))
+    assert len(view) == 0
+    log.insert_data_points(data_point(n) for n in range(90, 100))
+    assert [point.sequence_num for point in view] == list(range(90, 100))
+
+    # The latest view covers a fixed range of sequence numbers, which backfill can add to.
+    log.insert_data_points(data_point(n) for n in (300, 302))
+    latest = log.latest(3)
+    assert [point.sequence_num for point in latest] == [199, 300, 302]
+    log.insert_data_points([data_point(301)])
+    assert [point.sequence_num for point in latest] == [199, 300, 301, 302]
@@ -0,0 +1,85 @@
+import asyncio
+
+import pytest
+
+from combustion_ble.devices.device import Device
+from combustion_ble.reconnect_policy import ReconnectPolicy
+
+
+def test_delay_backs_off_up_to_the_maximum():
+    policy = ReconnectPolicy(initial_delay=1.0, max_delay=10.0, multiplier=2.0, jitter=0.5)
+
+    assert [policy.delay(attempt, random=lambda: 0.0) for attempt in range(6)] == [
+        1.0,
+        2.0,
+        4.0,
+        8.0,
+        10.0,
+        10.0,
+    ]
+    assert policy.delay(2, random=lambda: 1.0) == 2.0
+    assert policy.delay(10_000, random=lambda: 0.0) == 10.0
+
+    with pytest.raises(ValueError):
+        ReconnectPolicy(initial_delay=2.0, max_delay=1.0)
+
+
+class FakeDeviceManager:
+    def __init__(self, connect_after: int) -> None:
+        self.policy = ReconnectPolicy(initial_delay=0.01, max_delay=0.04, jitter=0.0)
+        self.connect_after = connect_after
+        self.connect_times: list[float] = []
+
+    def _reconnect_policy(self, device: Device) -> ReconnectPolicy:
+        return self.policy
+
+    async def _connect_to_device(self, device: Device) -> None:
+        self.connect_times.append(asyncio.get_running_loop().time())
+        if len(self.connect_times) >= self.connect_after:
+            device._update_connection_state(Device.ConnectionState.CONNECTED)
+        else:
+            device._update_connection_state(Device.ConnectionState.FAILED)
+
+
+def test_reconnects_with_backoff_and_resets_after_success():
+    async def drop_connection():
+        device_manager = FakeDeviceManager(connect_after=4)
+        device = Device("probe", device_manager=device_manager)  # type: ignore[arg-type]
+        device.maintaining_connection = True
+        device._update_connection_state(Device.ConnectionState.CONNECTED)
+
+        dropped_at = asyncio.get_running_loop().time()
+        device._update_connection_state(Device.ConnectionState.DISCONNECTED)
+        for _ in range(50):
+            await asyncio.sleep(0.01)
+            if device.connection_state == Device.ConnectionState.CONNECTED:
+                break
+        return device, device_manager, dropped_at
+
+    device, device_manager, dropped_at = asyncio.run(drop_connection())
+    times = [dropped_at, *device_manager.connect_times]
+    gaps = [later - earlier for earlier, later in zip(times, times[1:])]
+
+    assert device.connection_state == Device.ConnectionState.CONNECTED
+    assert device.reconnect_attempts == 4
+    assert device._consecutive_reconnects == 0
+    # Delays double from 10 ms up to the 40 ms maximum, within the event loop's clock resolution.
+    assert all(gap > minimum - 0.005 for gap, minimum in zip(gaps, [0.01, 0.02, 0.04, 0.04]))
+    assert device.reconnect_seconds >= sum(gaps) - 0.001
+
+
+def test_disconnect_cancels_pending_reconnect():
+    async def disconnect():
+        device_manager = FakeDeviceManager(connect_after=1)
+        device_manager._disconnect_from_device = lambda device: asyncio.sleep(0)  # type: ignore
+        device = Device("probe", device_manager=device_manager)  # type: ignore[arg-type]
+        device.maintaining_connection = True
+        device._update_connection_state(Device.ConnectionState.DISCONNECTED)
+        await device.disconnect()
+        await asyncio.sleep(0.03)
+        return device, device_manager
+
+    device, device_manager = asyncio.run(disconnect())
+
+    assert device_manager.connect_times == []
+    assert device.reconnect_attempts == 0
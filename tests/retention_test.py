@@ -0,0 +1,76 @@
+from datetime import datetime, timedelta
+from typing import Any, Optional
+
+from combustion_ble.devices.device import Device
+from combustion_ble.probe_temperature_log import ProbeTemperatureLog
+from combustion_ble.retention import RetentionPolicy
+from combustion_ble.uart import SessionInformation
+from tests.data_point_columns_test import data_point
+
+
+class FakeProbe:
+    def __init__(self, updated_at: list[float], point_count: int = 10) -> None:
+        self._temperature_logs = {}
+        for session_id, time in enumerate(updated_at):
+            log = ProbeTemperatureLog(SessionInformation(session_id=session_id, sample_period=1000))
+            for sequence_number in range(point_count):
+                log.append_data_point(data_point(sequence_number))
+            log.updated_at = time
+            self._temperature_logs[session_id] = log
+        self.current_session_id = len(updated_at) - 1
+
+    def _get_current_temperature_log(self) -> Optional[ProbeTemperatureLog]:
+        return self._temperature_logs.get(self.current_session_id)
+
+
+class FakeDevice:
+    def __init__(self, age: float, connection_state: str = Device.ConnectionState.DISCONNECTED):
+        self.last_update_time = NOW - timedelta(seconds=age)
+        self.connection_state = connection_state
+        self.maintaining_connection = False
+
+
+NOW = datetime(2024, 1, 1, 12)
+
+
+def evicted_sessions(policy: RetentionPolicy, probes: list[Any], now: float) -> list[int]:
+    return sorted(log.id for _, log in policy.sessions_to_evict(probes, now))
+
+
+def test_sessions_by_age_and_count():
+    # The current session is the last one, and is never evicted, however old.
+    probe: Any = FakeProbe([10, 20, 30, 40, 0])
+
+    assert evicted_sessions(RetentionPolicy(max_session_age=75), [probe], 100) == [0, 1]
+    assert evicted_sessions(RetentionPolicy(max_sessions_per_probe=3), [probe], 100) == [0, 1]
+    assert evicted_sessions(RetentionPolicy(), [probe], 100) == []
+
+
+def test_sessions_by_bytes():
+    probes: list[Any] = [FakeProbe([10, 50, 0]), FakeProbe([30, 0])]
+    log_bytes = probes[0]._temperature_logs[0].nbytes
+
+    policy = RetentionPolicy(max_log_bytes=log_bytes * 3)
+    # Five logs, of which three are current: the two oldest past logs are evicted.
+    assert [(probes.index(probe), log.id) for probe, log in policy.sessions_to_evict(probes)] == [
+        (0, 0),
+        (1, 0),
+    ]
+    assert policy.evicted_sessions == 2
+
+
+def test_devices_by_age_and_count():
+    devices: list[Any] = [
+        FakeDevice(100),
+        FakeDevice(5),
+        FakeDevice(200, Device.ConnectionState.CONNECTED),
+        FakeDevice(50),
+        FakeDevice(10),
+    ]
+
+    policy = RetentionPolicy(max_device_age=60)
+    assert policy.devices_to_remove(devices, NOW) == [devices[0]]
+
+    policy = RetentionPolicy(max_device_age=60, max_devices=3)
+    assert policy.devices_to_remove(devices, NOW) == [devices[0], devices[3]]
+    assert policy.removed_devices == 2
@@ -0,0 +1,102 @@
+from datetime import timedelta
+
+import pytest
+
+from combustion_ble.ble_data.probe_temperatures import ProbeTemperatures
+from combustion_ble.probe_temperature_log import ProbeTemperatureLog
+from combustion_ble.uart import SessionInformation
+from tests.data_point_columns_test import data_point
+
+
+def varying_data_point(sequence_number: int):
+    point = data_point(sequence_number)
+    temperatures = ProbeTemperatures.from_values(
+        [20.0 + (sequence_number * (sensor + 1)) % 37 * 0.5 for sensor in range(8)]
+    )
+    return point._replace(temperatures=temperatures)
+
+
+def expected_buckets(log: ProbeTemperatureLog, points_per_bucket: int):
+    buckets: dict[int, list] = {}
+    for point in log.data_points:
+        buckets.setdefault(point.sequence_num // points_per_bucket, []).append(
+            point.temperatures.values
+        )
+    return {
+        index: (
+            len(values),
+            [min(column) for column in zip(*values)],
+            [sum(column) / len(column) for column in zip(*values)],
+            [max(column) for column in zip(*values)],
+        )
+        for index, values in buckets.items()
+    }
+
+
+def assert_rollup(log: ProbeTemperatureLog, bucket_seconds: int, points_per_bucket: int):
+    expected = expected_buckets(log, points_per_bucket)
+    buckets = log.rollup(bucket_seconds)
+    assert [bucket.index for bucket in buckets] == sorted(expected)
+    for bucket in buckets:
+        count, minimum, mean, maximum = expected[bucket.index]
+        assert bucket.count == count
+        assert bucket.minimum == pytest.approx(minimum)
+        assert bucket.mean == pytest.approx(mean)
+        assert bucket.maximum == pytest.approx(maximum)
+
+
+def test_rollup_is_updated_by_appends_and_backfill():
+    log = ProbeTemperatureLog(SessionInformation(session_id=1, sample_period=2000))
+    for sequence_number in range(200, 300):
+        log.append_data_point(varying_data_point(sequence_number))
+
+    # Buckets of 60 seconds hold 30 data points at a 2 second sample period.
+    assert_rollup(log, 60, 30)
+
+    for sequence_number in range(300, 320):
+        log.append_data_point(varying_data_point(sequence_number))
+    # Backfilled data points update the buckets that already exist.
+    log.insert_data_points(varying_data_point(n) for n in range(150, 215))
+    assert_rollup(log, 60, 30)
+    assert_rollup(log, 10, 5)
+
+
+def test_rollup_time_range():
+    log = ProbeTemperatureLog(SessionInformation(session_id=1, sample_period=1000))
+    for sequence_number in range(600):
+        log.append_data_point(varying_data_point(sequence_number))
+    assert log.start_time is not None
+
+    start = log.start_time
+    buckets = log.rollup(60, start, start)
+    assert [bucket.index for bucket in buckets] == [0]
+    assert buckets[0].start_time == start
+
+    buckets = log.rollup(60, start + timedelta(seconds=130), start + timedelta(seconds=300))
+    assert [bucket.index for bucket in buckets] == [2, 3, 4, 5]
+    assert buckets[1].start_time == start + timedelta(seconds=180)
+
+    # Without a start time, buckets cannot be located in time.
+    restored = ProbeTemperatureLog(SessionInformation(session_id=1, sample_period=1000))
+    restored.restore(log.columns.rows())
+    assert restored.start_time is None
+    assert len(restored.rollup(60)) == 10
+    with pytest.raises(ValueError):
+        restored.rollup(60, start)
+    with pytest.raises(ValueError):
+        restored.rollup(60, end=start)
+
+
+def test_downsample():
+    log = ProbeTemperatureLog(SessionInformation(session_id=1, sample_period=1000))
+    for sequence_number in range(1000):
+        log.append_data_point(varying_data_point(sequence_number))
+
+    points = log.downsample(100, sensor=2)
+    assert len(points) == 100
+    assert points[0].sequence_num == 0
+    assert points[-1].sequence_num == 999
+    assert [point.sequence_num for point in points] == sorted(
+        point.sequence_num for point in points
+    )
+    assert len(log.downsample(2000)) == 1000
@@ -0,0 +1,92 @@
+import pytest
+
+from combustion_ble.uart import (
+    LogResponse,
+    ResponseFramer,
+    SessionInfoResponse,
+    UARTFramer,
+)
+from combustion_ble.uart.meatnet import (
+    NodeReadLogsResponse,
+    NodeReadSessionInfoRequest,
+    NodeUARTFramer,
+)
+from combustion_ble.utilities.crc16ccitt import CRC16CCITT
+
+
+def _response(message_type: int, payload: bytes) -> bytes:
+    header = bytes((message_type, 1, len(payload)))
+    return b"\xCA\xFE" + CRC16CCITT(header).update(payload).to_bytes() + header + payload
+
+
+def _log_response(sequence_number: int) -> bytes:
+    return _response(4, sequence_number.to_bytes(4, "little") + bytes(20))
+
+
+def _node_log_response(serial_number: int, sequence_number: int) -> bytes:
+    header = bytes((0x84,)) + bytes(4) + bytes(4) + bytes((1, 28))
+    payload = serial_number.to_bytes(4, "little") + sequence_number.to_bytes(4, "little")
+    payload += bytes(20)
+    return b"\xCA\xFE" + CRC16CCITT(header).update(payload).to_bytes() + header + payload
+
+
+def test_decodes_multiple_responses_in_one_notification():
+    framer = ResponseFramer()
+    data = _log_response(1) + _response(3, bytes(6)) + _log_response(2)
+
+    responses = framer.feed(data)
+
+    assert [type(r) for r in responses] == [LogResponse, SessionInfoResponse, LogResponse]
+    assert framer.dropped_bytes == 0
+    assert framer.buffered_bytes == 0
+
+
+def test_reassembles_response_split_across_notifications():
+    framer = ResponseFramer()
+    data = _log_response(7) + _log_response(8)
+
+    assert framer.feed(data[:5]) == []
+    assert framer.feed(data[5:40]) and framer.buffered_bytes == 40 - len(_log_response(7))
+    responses = framer.feed(data[40:])
+
+    assert [r.sequence_number for r in responses if isinstance(r, LogResponse)] == [8]
+    assert framer.frames == 2
+    assert framer.buffered_bytes == 0
+
+
+def test_resynchronizes_after_garbage_and_crc_errors():
+    framer = ResponseFramer()
+    corrupt = bytearray(_log_response(1))
+    corrupt[10] ^= 0xFF
+
+    responses = framer.feed(b"\x00\x01" + bytes(corrupt) + _log_response(2) + b"\xCA")
+
+    assert [r.sequence_number for r in responses if isinstance(r, LogResponse)] == [2]
+    assert framer.crc_errors == 1
+    assert framer.dropped_bytes == 2 + len(corrupt)
+    assert framer.buffered_bytes == 1
+
+
+def test_node_framer_handles_requests_and_responses():
+    framer = NodeUARTFramer()
+    request = NodeReadSessionInfoRequest(serial_number=1).data
+    data = bytes(request) + _node_log_response(0x1234, 99)
+
+    messages = framer.feed(data[:12]) + framer.feed(data[12:])
+
+    # Session info requests are valid frames that this SDK does not act on.
+    assert len(messages) == 1
+    assert isinstance(messages[0], NodeReadLogsResponse)
+    assert messages[0].probe_serial_number == 0x1234
+    assert messages[0].sequence_number == 99
+    assert framer.frames == 2
+    assert framer.dropped_bytes == 0
+
+
+def test_framers_must_describe_their_messages():
+    class IncompleteFramer(UARTFramer):
+        def frame_length(self, view: memoryview):
+            return None
+
+    with pytest.raises(TypeError):
+        IncompleteFramer()  # type: ignore[abstract]
@@ -0,0 +1,37 @@
+from combustion_ble.uart import LogRequest
+from combustion_ble.utilities.crc16ccitt import CRC16CCITT, crc16ccitt
+
+
+def _bitwise_crc16ccitt(data: bytes) -> int:
+    crc = 0xFFFF
+    for byte in data:
+        crc ^= byte << 8
+        for _ in range(8):
+            crc = (crc << 1) ^ 0x1021 if (crc & 0x8000) else crc << 1
+            crc &= 0xFFFF
+    return crc
+
+
+def test_check_value():
+    assert crc16ccitt(b"123456789") == 0x29B1
+
+
+def test_matches_bitwise_reference():
+    data = bytes(range(256)) * 3
+    for length in (0, 1, 2, 7, 64, len(data)):
+        assert crc16ccitt(data[:length]) == _bitwise_crc16ccitt(data[:length])
+
+
+def test_incremental_update_matches_one_shot():
+    data = bytes(range(200))
+    crc = CRC16CCITT(data[:13]).update(memoryview(data)[13:100]).update(bytearray(data[100:]))
+    assert crc.value == crc16ccitt(data)
+    assert crc16ccitt(data[50:], crc=crc16ccitt(data[:50])) == crc16ccitt(data)
+
+
+def test_request_framing():
+    request = LogRequest(min_sequence=1, max_sequence=300)
+    assert request.data[:2] == b"\xCA\xFE"
+    crc = int.from_bytes(request.data[2:4], byteorder="little")
+    assert crc == _bitwise_crc16ccitt(bytes(request.data[4:]))
+    assert request.data[4:6] == bytes((4, 8))
@@ -0,0 +1,57 @@
+import random
+
+from combustion_ble.utilities.interval_set import IntervalSet
+
+
+def test_add_merges_runs():
+    values = IntervalSet()
+    for value in (5, 6, 7, 1, 3, 2, 10):
+        assert values.add(value)
+    assert not values.add(6)
+
+    assert values.runs == [(1, 3), (5, 7), (10, 10)]
+    assert len(values) == 7
+    assert values.min == 1
+    assert values.max == 10
+    assert 6 in values
+    assert 4 not in values
+
+    assert values.add(4)
+    assert values.runs == [(1, 7), (10, 10)]
+
+
+def test_gap_queries():
+    values = IntervalSet()
+    for value in [*range(0, 10), *range(20, 30), *range(35, 40)]:
+        values.add(value)
+
+    assert values.first_missing(0, 50) == 10
+    assert values.first_missing(0, 9) is None
+    assert values.first_missing(12, 50) == 12
+    assert values.last_missing(0, 50) == 50
+    assert values.last_missing(0, 39) == 34
+    assert values.last_missing(20, 29) is None
+    assert list(values.missing_runs(0, 45)) == [(10, 19), (30, 34), (40, 45)]
+    assert list(values.missing_runs(5, 25)) == [(10, 19)]
+
+    assert values.count_in_range(0, 100) == 25
+    assert values.count_in_range(5, 25) == 11
+    assert values.count_in_range(10, 19) == 0
+
+
+def test_matches_set():
+    rng = random.Random(1)
+    values = IntervalSet()
+    expected = set()
+    for _ in range(2000):
+        value = rng.randrange(500)
+        assert values.add(value) == (value not in expected)
+        expected.add(value)
+
+    assert list(values) == sorted(expected)
+    assert len(values) == len(expected)
+    for start, end in ((0, 499), (100, 200), (250, 251)):
+        missing = [value for value in range(start, end + 1) if value not in expected]
+        assert values.first_missing(start, end) == (missing[0] if missing else None)
+        assert values.last_missing(start, end) == (missing[-1] if missing else None)
+        assert values.count_in_range(start, end) == end - start + 1 - len(missing)
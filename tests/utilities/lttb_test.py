@@ -0,0 +1,21 @@
+import pytest
+
+from combustion_ble.utilities.lttb import lttb
+
+
+def test_keeps_peaks():
+    x = list(range(100))
+    y = [0.0] * 100
+    y[37] = 10.0
+    y[71] = -10.0
+
+    selected = lttb(x, y, 10)
+    assert len(selected) == 10
+    assert selected[0] == 0 and selected[-1] == 99
+    assert 37 in selected and 71 in selected
+
+
+def test_small_series():
+    assert lttb([0, 1, 2], [1, 2, 3], 5) == [0, 1, 2]
+    with pytest.raises(ValueError):
+        lttb(list(range(10)), list(range(10)), 2)